@@ -0,0 +1,291 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from memory_manager import ALLOCATION_ENGINES, MemoryManager
+from process import Process
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+STRATEGIES = ("First Fit", "Best Fit", "Worst Fit", "Next Fit")
+MEMORY_SIZES = (64, 1024, 16384, 262144, 1048576)
+
+
+def engine_latency(engine_class, block_count, operations=20000, seed=0):
+    """
+    Mengukur latensi alokasi dan dealokasi mesin alokasi pada jumlah blok tertentu.
+
+    Memori diisi terlebih dahulu dengan block_count proses berukuran 2 MB, lalu
+    setiap proses kedua dibebaskan sehingga terbentuk sekitar block_count blok
+    yang saling berselang antara terpakai dan kosong. Setelah itu pasangan
+    alokasi-dealokasi dengan ukuran acak diukur satu per satu.
+
+    Args:
+        engine_class (type): Kelas mesin alokasi, misalnya TLSFAllocator
+        block_count (int): Jumlah blok yang dibentuk sebelum pengukuran
+        operations (int, optional): Jumlah pasangan alokasi-dealokasi yang diukur.
+                                  Defaults to 20000.
+        seed (int, optional): Seed untuk ukuran proses acak. Defaults to 0.
+
+    Returns:
+        dict: Jumlah blok serta rata-rata dan persentil 99 latensi dalam nanodetik
+    """
+    rng = random.Random(seed)
+    engine = engine_class(block_count * 4)
+
+    for i in range(block_count):
+        engine.allocate(Process(f"fill {i}", 2, 1))
+    for i in range(0, block_count, 2):
+        engine.free(f"fill {i}")
+
+    samples = []
+    clock = time.perf_counter_ns
+    for i in range(operations):
+        process = Process("probe", rng.randint(1, 8), 1)
+        begin = clock()
+        engine.allocate(process)
+        engine.free("probe")
+        samples.append(clock() - begin)
+
+    samples.sort()
+    return {
+        "blocks": block_count,
+        "mean_ns": sum(samples) / len(samples),
+        "p99_ns": samples[int(len(samples) * 0.99)],
+    }
+
+
+def percentiles(samples):
+    """
+    Meringkas sampel latensi menjadi persentil.
+
+    Args:
+        samples (list[int]): Sampel latensi dalam nanodetik
+
+    Returns:
+        dict: Rata-rata, p50, p90, p99, dan maksimum latensi dalam nanodetik
+    """
+    samples = sorted(samples)
+    if not samples:
+        return {"mean": 0, "p50": 0, "p90": 0, "p99": 0, "max": 0}
+    last = len(samples) - 1
+    return {
+        "mean": sum(samples) / len(samples),
+        "p50": samples[int(last * 0.5)],
+        "p90": samples[int(last * 0.9)],
+        "p99": samples[int(last * 0.99)],
+        "max": samples[last],
+    }
+
+
+def resident_memory_kb():
+    """
+    Mendapatkan penggunaan memori fisik (RSS) proses benchmark.
+
+    Di Linux nilai dibaca dari /proc/self/statm sehingga merupakan RSS saat
+    ini. Di sistem lain digunakan RSS puncak dari modul resource.
+
+    Returns:
+        int: RSS dalam KB, atau None jika tidak dapat dibaca
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def strategy_benchmark(algorithm, block_count, total_memory, operations=20000, seed=0):
+    """
+    Mengukur satu algoritma alokasi MemoryManager dalam mode partisi variabel.
+
+    Memori diisi block_count proses berukuran sama, lalu setiap proses kedua
+    dibebaskan sehingga terbentuk lubang-lubang yang saling berselang dengan
+    blok terpakai. Setelah itu alokasi dan dealokasi proses berukuran acak
+    diukur secara terpisah, dan satu pemanggilan merge_free_blocks diukur
+    pada susunan blok akhir.
+
+    Args:
+        algorithm (str): Algoritma alokasi, misalnya "Best Fit"
+        block_count (int): Jumlah proses pengisi sebelum pengukuran
+        total_memory (int): Ukuran total memori dalam MB
+        operations (int, optional): Jumlah pasangan alokasi-dealokasi yang diukur.
+                                  Defaults to 20000.
+        seed (int, optional): Seed untuk ukuran proses acak. Defaults to 0.
+
+    Returns:
+        dict: Parameter benchmark, persentil latensi alokasi dan dealokasi,
+             ops_per_second, peak_blocks, merge_ns, dan rss_kb
+    """
+    rng = random.Random(seed)
+    manager = MemoryManager(total_memory, use_timer=False)
+    unit = max(total_memory // (block_count * 2), 1)
+
+    manager.allocate_many(Process(f"fill {i}", unit, 1) for i in range(block_count))
+    manager.deallocate_many(f"fill {i}" for i in range(0, block_count, 2))
+
+    allocate_samples = []
+    free_samples = []
+    peak_blocks = len(manager.memory_blocks)
+    clock = time.perf_counter_ns
+    for i in range(operations):
+        process = Process(f"probe {i}", rng.randint(1, unit), 1)
+        begin = clock()
+        manager.allocate_process(process, algorithm)
+        allocate_samples.append(clock() - begin)
+        peak_blocks = max(peak_blocks, len(manager.memory_blocks))
+
+        begin = clock()
+        manager.deallocate_process(process.name)
+        free_samples.append(clock() - begin)
+
+    begin = clock()
+    manager.merge_free_blocks()
+    merge_ns = clock() - begin
+
+    elapsed_ns = sum(allocate_samples) + sum(free_samples)
+    return {
+        "algorithm": algorithm,
+        "blocks": block_count,
+        "total_memory": total_memory,
+        "operations": operations,
+        "allocate_ns": percentiles(allocate_samples),
+        "free_ns": percentiles(free_samples),
+        "ops_per_second": 2 * operations / elapsed_ns * 1e9 if elapsed_ns else 0,
+        "peak_blocks": peak_blocks,
+        "merge_ns": merge_ns,
+        "rss_kb": resident_memory_kb(),
+    }
+
+
+def run_suite(
+    strategies=STRATEGIES,
+    max_exponent=6,
+    memory_sizes=MEMORY_SIZES,
+    memory_blocks=1000,
+    operations=20000,
+    seed=0,
+    progress=None,
+):
+    """
+    Menjalankan benchmark untuk setiap algoritma dengan dua sapuan parameter.
+
+    Sapuan jumlah blok menggunakan 10^2 sampai 10^max_exponent blok dengan
+    memori empat kali jumlah blok. Sapuan ukuran memori menggunakan
+    memory_blocks blok pada setiap ukuran memori, dari MB hingga TB.
+
+    Args:
+        strategies (iterable, optional): Algoritma yang diukur.
+                                       Defaults to STRATEGIES.
+        max_exponent (int, optional): Eksponen jumlah blok terbesar.
+                                    Defaults to 6.
+        memory_sizes (iterable, optional): Ukuran memori dalam MB.
+                                         Defaults to MEMORY_SIZES.
+        memory_blocks (int, optional): Jumlah blok pada sapuan ukuran memori.
+                                     Defaults to 1000.
+        operations (int, optional): Jumlah pasangan alokasi-dealokasi per kasus.
+                                  Defaults to 20000.
+        seed (int, optional): Seed untuk ukuran proses acak. Defaults to 0.
+        progress (function, optional): Fungsi yang dipanggil dengan hasil setiap
+                                     kasus setelah selesai. Defaults to None.
+
+    Returns:
+        dict: Metadata lingkungan dan daftar hasil setiap kasus
+    """
+    cases = []
+    for exponent in range(2, max_exponent + 1):
+        cases.append(("blocks", 10**exponent, 10**exponent * 4))
+    for total_memory in memory_sizes:
+        cases.append(("memory", min(memory_blocks, total_memory // 2), total_memory))
+
+    results = []
+    for algorithm in strategies:
+        for sweep, block_count, total_memory in cases:
+            result = strategy_benchmark(
+                algorithm, block_count, total_memory, operations, seed
+            )
+            result["sweep"] = sweep
+            results.append(result)
+            if progress is not None:
+                progress(result)
+
+    return {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "operations": operations,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def main():
+    """
+    Menjalankan benchmark latensi mesin alokasi dari command line.
+
+    Untuk setiap jumlah blok 10^2 sampai 10^max_exponent, latensi rata-rata
+    dan persentil 99 dicetak. Mesin dengan biaya konstan seperti TLSF akan
+    menunjukkan latensi yang datar meskipun jumlah blok bertambah.
+
+    Dengan --suite, benchmark algoritma alokasi MemoryManager dijalankan
+    dan hasilnya ditulis sebagai JSON ke --output, sehingga hasil antar commit
+    dapat dibandingkan.
+    """
+    parser = argparse.ArgumentParser(description="Allocator latency benchmark")
+    parser.add_argument("--engine", default="TLSF", choices=sorted(ALLOCATION_ENGINES))
+    parser.add_argument("--max-exponent", type=int, default=6)
+    parser.add_argument("--operations", type=int, default=20000)
+    parser.add_argument("--suite", action="store_true")
+    parser.add_argument("--algorithm", action="append", choices=STRATEGIES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="-")
+    args = parser.parse_args()
+
+    if args.suite:
+        suite = run_suite(
+            strategies=args.algorithm or STRATEGIES,
+            max_exponent=args.max_exponent,
+            operations=args.operations,
+            seed=args.seed,
+            progress=lambda result: print(
+                f"{result['algorithm']:>10} {result['sweep']:>6} "
+                f"{result['blocks']:>8} blocks {result['total_memory']:>8} MB "
+                f"{result['ops_per_second']:>10.0f} ops/s",
+                file=sys.stderr,
+            ),
+        )
+        if args.output == "-":
+            json.dump(suite, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.output, "w") as output:
+                json.dump(suite, output, indent=2)
+        return
+
+    engine_class = ALLOCATION_ENGINES[args.engine]
+    print(f"{'blocks':>10} {'mean (ns)':>12} {'p99 (ns)':>12}")
+    for exponent in range(2, args.max_exponent + 1):
+        result = engine_latency(engine_class, 10**exponent, args.operations)
+        print(
+            f"{result['blocks']:>10} {result['mean_ns']:>12.0f} {result['p99_ns']:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+import bisect
+from array import array
+from collections.abc import Sequence
+
+from free_index import FreeSizeStats
+from memory_block import MemoryBlock
+
+NO_PARTITION = -1
+NO_HANDLE = -1
+
+
+class _ProcessEntry:
+    """
+    Catatan proses dalam BlockTable beserta alamat awal bloknya.
+
+    Attributes:
+        process (Process): Proses yang menempati blok
+        start_address (int): Alamat awal blok proses dalam MB
+    """
+
+    __slots__ = ("process", "start_address")
+
+    def __init__(self, process, start_address):
+        self.process = process
+        self.start_address = start_address
+
+
+class BlockTableView(Sequence):
+    """
+    Tampilan baca-saja dari BlockTable sebagai daftar MemoryBlock.
+
+    Setiap akses elemen membuat objek MemoryBlock baru dari baris tabel, sehingga
+    konsumen seperti MemoryVisualizer dapat membaca blok seperti biasa tanpa
+    tabel harus menyimpan satu objek per blok. Perubahan pada objek hasil tidak
+    memengaruhi tabel.
+
+    Attributes:
+        table (BlockTable): Tabel blok yang ditampilkan
+    """
+
+    __slots__ = ("table",)
+
+    def __init__(self, table):
+        """
+        Inisialisasi tampilan untuk sebuah tabel blok.
+
+        Args:
+            table (BlockTable): Tabel blok yang ditampilkan
+        """
+        self.table = table
+
+    def __len__(self):
+        return len(self.table.starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.table.get_block(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("block index out of range")
+        return self.table.get_block(index)
+
+
+class BlockTable:
+    """
+    Mesin alokasi partisi variabel dengan tabel blok berbasis array.
+
+    Kelas ini menyimpan blok memori sebagai kolom-kolom array paralel: alamat
+    awal, ukuran, status kosong, ID partisi, dan handle proses. Setiap blok
+    hanya membutuhkan sekitar 29 byte, dibandingkan ratusan byte untuk objek
+    MemoryBlock beserta isi list-nya, sehingga cocok untuk simulasi dengan
+    jutaan blok. Sebagai gantinya, pencarian First, Best, Worst, dan Next Fit
+    dilakukan dengan pemindaian kolom secara linear.
+
+    Proses disimpan dalam daftar yang diindeks oleh handle bilangan bulat.
+    Handle proses yang sudah selesai digunakan kembali.
+
+    Attributes:
+        name (str): Nama mode alokasi
+        supports_algorithms (bool): Mesin ini memakai algoritma First/Best/Worst/Next Fit
+        supports_partitions (bool): Mesin ini mendukung partisi
+        total_memory (int): Total ukuran memori dalam MB
+        starts (array): Alamat awal setiap blok dalam MB
+        sizes (array): Ukuran setiap blok dalam MB
+        free_flags (array): Status kosong setiap blok (1 jika kosong)
+        partition_ids (array): ID partisi setiap blok (NO_PARTITION jika tidak dipartisi)
+        handles (array): Handle proses setiap blok (NO_HANDLE jika kosong)
+        process_table (list): Catatan proses untuk setiap handle (None jika tidak dipakai)
+        handle_map (dict): Handle setiap proses (key: nama proses)
+        next_fit_position (int): Alamat akhir alokasi Next Fit terakhir dalam MB
+        free_sizes (FreeSizeStats): Penghitung ukuran blok kosong untuk stats()
+    """
+
+    name = "Compact"
+    supports_algorithms = True
+    supports_partitions = True
+
+    def __init__(self, total_memory):
+        """
+        Inisialisasi tabel blok dengan satu blok kosong.
+
+        Args:
+            total_memory (int): Total ukuran memori dalam MB
+        """
+        self.view = BlockTableView(self)
+        self.reset(total_memory)
+
+    def reset(self, total_memory, blocks=None):
+        """
+        Mengosongkan tabel dan mengisinya dengan blok kosong awal.
+
+        Args:
+            total_memory (int): Total ukuran memori dalam MB
+            blocks (list[MemoryBlock], optional): Blok partisi kosong awal. Jika
+                                                None, memori menjadi satu blok
+                                                kosong. Defaults to None.
+        """
+        self.total_memory = total_memory
+        self.starts = array("q")
+        self.sizes = array("q")
+        self.free_flags = array("b")
+        self.partition_ids = array("i")
+        self.handles = array("q")
+        self.process_table = []
+        self.free_handles = []
+        self.handle_map = {}
+        self.next_fit_position = 0
+        self.free_sizes = FreeSizeStats()
+
+        if blocks is None:
+            blocks = [MemoryBlock(0, total_memory)]
+        for block in blocks:
+            self.starts.append(block.start)
+            self.sizes.append(block.size)
+            self.free_flags.append(1)
+            self.partition_ids.append(
+                NO_PARTITION if block.partition_id is None else block.partition_id
+            )
+            self.handles.append(NO_HANDLE)
+            self.free_sizes.add(block.size)
+
+    def get_block(self, index):
+        """
+        Membuat objek MemoryBlock dari satu baris tabel.
+
+        Args:
+            index (int): Indeks baris
+
+        Returns:
+            MemoryBlock: Salinan blok pada baris tersebut
+        """
+        handle = self.handles[index]
+        partition_id = self.partition_ids[index]
+        return MemoryBlock(
+            self.starts[index],
+            self.sizes[index],
+            bool(self.free_flags[index]),
+            self.process_table[handle].process if handle != NO_HANDLE else None,
+            partition_id if partition_id != NO_PARTITION else None,
+        )
+
+    def get_blocks(self):
+        """
+        Mendapatkan tampilan baca-saja dari semua blok.
+
+        Returns:
+            BlockTableView: Tampilan blok terurut berdasarkan alamat
+        """
+        return self.view
+
+    def rename(self, process_name, new_name):
+        """
+        Mengganti kunci blok terpakai milik proses tanpa memindahkan bloknya.
+
+        Args:
+            process_name (str): Kunci blok saat ini
+            new_name: Kunci baru untuk blok tersebut
+        """
+        self.handle_map[new_name] = self.handle_map.pop(process_name)
+
+    def get_partition(self, process_name):
+        """
+        Mendapatkan ID partisi dari blok yang ditempati proses.
+
+        Args:
+            process_name (str): Nama proses yang dicari
+
+        Returns:
+            int: ID partisi, atau None jika proses tidak ditemukan atau tidak dipartisi
+        """
+        index = self.find_process(process_name)
+        if index is None:
+            return None
+        partition_id = self.partition_ids[index]
+        return partition_id if partition_id != NO_PARTITION else None
+
+    def find_process(self, process_name):
+        """
+        Mencari indeks baris yang ditempati proses.
+
+        Baris dicari dengan pencarian biner pada alamat awal, lalu baris lain
+        dengan alamat awal yang sama dilewati hingga handle proses ditemukan.
+
+        Args:
+            process_name (str): Nama proses yang dicari
+
+        Returns:
+            int: Indeks baris, atau None jika proses tidak ditemukan
+        """
+        handle = self.handle_map.get(process_name)
+        if handle is None:
+            return None
+        start = self.process_table[handle].start_address
+        index = bisect.bisect_left(self.starts, start)
+        # Blok kosong berukuran nol memiliki alamat awal yang sama dengan blok
+        # sesudahnya, sehingga baris tersebut dilewati
+        while self.handles[index] != handle:
+            index += 1
+        return index
+
+    def find_fit(self, size, algorithm):
+        """
+        Mencari indeks blok kosong yang sesuai dengan algoritma alokasi.
+
+        Args:
+            size (int): Ukuran yang dibutuhkan dalam MB
+            algorithm (str): "First Fit", "Best Fit", "Worst Fit", atau "Next Fit"
+
+        Returns:
+            int: Indeks blok yang dipilih, atau None jika tidak ada yang muat
+        """
+        free_flags = self.free_flags
+        sizes = self.sizes
+
+        if algorithm == "Next Fit":
+            start = 0
+            if self.next_fit_position < self.total_memory:
+                start = bisect.bisect_right(self.starts, self.next_fit_position) - 1
+            for index in range(start, len(sizes)):
+                if free_flags[index] and sizes[index] >= size:
+                    return index
+            for index in range(start):
+                if free_flags[index] and sizes[index] >= size:
+                    return index
+            return None
+
+        if algorithm == "First Fit":
+            for index, block_size in enumerate(sizes):
+                if block_size >= size and free_flags[index]:
+                    return index
+            return None
+
+        chosen = None
+        chosen_size = None
+        for index, block_size in enumerate(sizes):
+            if block_size >= size and free_flags[index]:
+                if (
+                    chosen is None
+                    or (algorithm == "Best Fit" and block_size < chosen_size)
+                    or (algorithm == "Worst Fit" and block_size > chosen_size)
+                ):
+                    chosen = index
+                    chosen_size = block_size
+        return chosen
+
+    def allocate(self, process, algorithm="First Fit"):
+        """
+        Mengalokasikan blok untuk proses menggunakan algoritma tertentu.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+            algorithm (str, optional): Algoritma alokasi. Defaults to "First Fit".
+
+        Returns:
+            MemoryBlock: Salinan blok yang dialokasikan, atau None jika gagal
+        """
+        if algorithm not in ("First Fit", "Best Fit", "Worst Fit", "Next Fit"):
+            return None
+
+        index = self.find_fit(process.size, algorithm)
+        if index is None:
+            return None
+
+        self.free_sizes.remove(self.sizes[index])
+        if self.sizes[index] > process.size:
+            self.free_sizes.add(self.sizes[index] - process.size)
+            self.starts.insert(index + 1, self.starts[index] + process.size)
+            self.sizes.insert(index + 1, self.sizes[index] - process.size)
+            self.free_flags.insert(index + 1, 1)
+            self.partition_ids.insert(index + 1, self.partition_ids[index])
+            self.handles.insert(index + 1, NO_HANDLE)
+            self.sizes[index] = process.size
+
+        if self.free_handles:
+            handle = self.free_handles.pop()
+            self.process_table[handle] = _ProcessEntry(process, self.starts[index])
+        else:
+            handle = len(self.process_table)
+            self.process_table.append(_ProcessEntry(process, self.starts[index]))
+
+        self.free_flags[index] = 0
+        self.handles[index] = handle
+        self.handle_map[process.name] = handle
+        if algorithm == "Next Fit":
+            self.next_fit_position = self.starts[index] + process.size
+        return self.get_block(index)
+
+    def free(self, process_name):
+        """
+        Membebaskan blok proses dan menggabungkannya dengan tetangga yang kosong.
+
+        Args:
+            process_name (str): Nama proses yang akan dibebaskan
+
+        Returns:
+            bool: True jika berhasil, False jika proses tidak ditemukan
+        """
+        index = self.find_process(process_name)
+        if index is None:
+            return False
+
+        handle = self.handle_map.pop(process_name)
+        self.process_table[handle] = None
+        self.free_handles.append(handle)
+        self.free_flags[index] = 1
+        self.handles[index] = NO_HANDLE
+
+        partition_id = self.partition_ids[index]
+        last = index
+        if (
+            last + 1 < len(self.starts)
+            and self.free_flags[last + 1]
+            and self.partition_ids[last + 1] == partition_id
+        ):
+            last += 1
+        first = index
+        if (
+            first > 0
+            and self.free_flags[first - 1]
+            and self.partition_ids[first - 1] == partition_id
+        ):
+            first -= 1
+
+        for neighbour in {first, last} - {index}:
+            self.free_sizes.remove(self.sizes[neighbour])
+        if last > first:
+            self.sizes[first] = (
+                self.starts[last] + self.sizes[last] - self.starts[first]
+            )
+            for column in (
+                self.starts,
+                self.sizes,
+                self.free_flags,
+                self.partition_ids,
+                self.handles,
+            ):
+                del column[first + 1 : last + 1]
+        self.free_sizes.add(self.sizes[first])
+        return True
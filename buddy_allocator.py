@@ -0,0 +1,183 @@
+from free_index import FreeSizeStats
+from memory_block import MemoryBlock
+
+
+class BuddyAllocator:
+    """
+    Mesin alokasi memori dengan sistem buddy biner.
+
+    Memori dibagi menjadi blok-blok berukuran pangkat dua. Setiap order k
+    memiliki daftar blok kosong berukuran 2^k MB. Saat alokasi, blok kosong
+    terkecil yang cukup besar diambil lalu dibelah dua berulang kali hingga
+    ukurannya pas dengan order yang dibutuhkan. Saat dealokasi, blok
+    digabungkan kembali dengan buddy-nya selama buddy tersebut juga kosong.
+    Kedua operasi hanya membutuhkan O(log N) langkah, tanpa perlu pemindaian
+    penuh seperti merge_free_blocks.
+
+    Jika total memori bukan pangkat dua, memori dipecah menjadi beberapa blok
+    akar sesuai representasi binernya (misalnya 1000 MB = 512 + 256 + 128 +
+    64 + 32 + 8). Setiap blok akar selalu sejajar dengan ukurannya, sehingga
+    alamat buddy dapat dihitung dengan operasi XOR.
+
+    Attributes:
+        name (str): Nama mode alokasi
+        supports_algorithms (bool): Mesin ini tidak memakai algoritma First/Best/Worst Fit
+        supports_partitions (bool): Mesin ini tidak mendukung partisi
+        total_memory (int): Total ukuran memori dalam MB
+        free_lists (list[dict]): Daftar blok kosong per order (key: alamat awal)
+        allocated (dict): Blok terpakai (key: nama proses, value: (alamat, order, proses))
+        free_sizes (FreeSizeStats): Penghitung ukuran blok kosong untuk stats()
+    """
+
+    name = "Buddy"
+    supports_algorithms = False
+    supports_partitions = False
+
+    def __init__(self, total_memory):
+        """
+        Inisialisasi mesin alokasi buddy.
+
+        Args:
+            total_memory (int): Total ukuran memori dalam MB
+        """
+        self.reset(total_memory)
+
+    def reset(self, total_memory):
+        """
+        Mengosongkan seluruh memori dan membangun ulang blok akar.
+
+        Args:
+            total_memory (int): Total ukuran memori dalam MB
+        """
+        self.total_memory = total_memory
+        self.max_order = max(total_memory.bit_length() - 1, 0)
+        self.free_lists = [{} for _ in range(self.max_order + 1)]
+        self.allocated = {}
+        self.free_sizes = FreeSizeStats()
+        self._blocks = None
+
+        start = 0
+        for order in range(self.max_order, -1, -1):
+            if total_memory & (1 << order):
+                self.free_lists[order][start] = True
+                self.free_sizes.add(1 << order)
+                start += 1 << order
+
+    @staticmethod
+    def order_for(size):
+        """
+        Menghitung order terkecil yang dapat menampung ukuran tertentu.
+
+        Args:
+            size (int): Ukuran yang dibutuhkan dalam MB
+
+        Returns:
+            int: Order k sehingga 2^k >= size
+        """
+        return max(size - 1, 0).bit_length()
+
+    def allocate(self, process, algorithm=None):
+        """
+        Mengalokasikan blok buddy untuk proses.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+            algorithm (str, optional): Diabaikan, karena penempatan ditentukan
+                                     oleh mesin ini sendiri. Defaults to None.
+
+        Returns:
+            MemoryBlock: Blok yang dialokasikan, atau None jika tidak ada ruang
+        """
+        order = self.order_for(process.size)
+        if order > self.max_order:
+            return None
+
+        current = order
+        while current <= self.max_order and not self.free_lists[current]:
+            current += 1
+        if current > self.max_order:
+            return None
+
+        start, _ = self.free_lists[current].popitem()
+        self.free_sizes.remove(1 << current)
+        while current > order:
+            current -= 1
+            self.free_lists[current][start + (1 << current)] = True
+            self.free_sizes.add(1 << current)
+
+        self.allocated[process.name] = (start, order, process)
+        self._blocks = None
+        return MemoryBlock(start, 1 << order, False, process)
+
+    def free(self, process_name):
+        """
+        Membebaskan blok proses dan menggabungkannya dengan buddy yang kosong.
+
+        Args:
+            process_name (str): Nama proses yang akan dibebaskan
+
+        Returns:
+            bool: True jika berhasil, False jika proses tidak ditemukan
+        """
+        if process_name not in self.allocated:
+            return False
+
+        start, order, _ = self.allocated.pop(process_name)
+        while order < self.max_order:
+            buddy = start ^ (1 << order)
+            if buddy not in self.free_lists[order]:
+                break
+            del self.free_lists[order][buddy]
+            self.free_sizes.remove(1 << order)
+            start = min(start, buddy)
+            order += 1
+
+        self.free_lists[order][start] = True
+        self.free_sizes.add(1 << order)
+        self._blocks = None
+        return True
+
+    def rename(self, process_name, new_name):
+        """
+        Mengganti kunci blok terpakai milik proses tanpa memindahkan bloknya.
+
+        Args:
+            process_name (str): Kunci blok saat ini
+            new_name: Kunci baru untuk blok tersebut
+        """
+        self.allocated[new_name] = self.allocated.pop(process_name)
+
+    def internal_fragmentation(self):
+        """
+        Menghitung fragmentasi internal dari semua blok terpakai.
+
+        Fragmentasi internal adalah selisih antara ukuran blok buddy dan ukuran
+        proses yang menempatinya.
+
+        Returns:
+            int: Total memori yang terbuang di dalam blok terpakai dalam MB
+        """
+        return sum(
+            (1 << order) - process.size for _, order, process in self.allocated.values()
+        )
+
+    def get_blocks(self):
+        """
+        Mendapatkan daftar blok memori terurut berdasarkan alamat.
+
+        Daftar blok hanya dibangun ulang ketika ada perubahan sejak pemanggilan
+        terakhir, sehingga mode headless tidak menanggung biayanya.
+
+        Returns:
+            list[MemoryBlock]: Daftar blok memori
+        """
+        if self._blocks is None:
+            blocks = [
+                MemoryBlock(start, 1 << order, False, process)
+                for start, order, process in self.allocated.values()
+            ]
+            for order, free_list in enumerate(self.free_lists):
+                blocks.extend(MemoryBlock(start, 1 << order) for start in free_list)
+            blocks.sort(key=lambda b: b.start)
+            self._blocks = blocks
+        return self._blocks
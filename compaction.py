@@ -0,0 +1,312 @@
+import bisect
+import time
+from operator import attrgetter
+
+from memory_block import MemoryBlock
+from memory_events import LayoutChanged
+
+COMPACTION_MODES = ("Full", "Minimal", "Incremental")
+
+
+class Compactor:
+    """
+    Pemadat memori untuk mode partisi variabel MemoryManager.
+
+    Pemadatan memindahkan blok terpakai ke alamat yang lebih rendah sehingga
+    blok-blok kosong yang terpencar bergabung menjadi satu blok kosong besar.
+    Jika memori dipartisi, blok hanya dipindahkan di dalam partisinya sendiri.
+    Tersedia tiga mode:
+
+    - Full: Semua blok terpakai digeser ke awal partisinya, sehingga setiap
+      partisi hanya memiliki satu blok kosong di bagian akhir.
+    - Minimal: Hanya blok dalam rentang termurah yang digeser, cukup untuk
+      membuka satu blok kosong dengan ukuran yang diminta.
+    - Incremental: Blok kosong digeser ke atas sedikit demi sedikit dengan
+      memindahkan paling banyak sejumlah MB tertentu per pemanggilan, sehingga
+      pemadatan dapat disebar ke banyak tick. Pemanggilan berikutnya
+      melanjutkan dari posisi terakhir.
+
+    Blok terpakai dipindahkan dengan mengubah alamatnya, sehingga peta blok
+    proses dan alamat slot slab tetap berlaku.
+
+    Attributes:
+        memory_manager (MemoryManager): Pengelola memori yang dipadatkan
+        position (int): Alamat awal pemadatan Incremental berikutnya dalam MB
+        total_moved (int): Total ukuran blok yang pernah dipindahkan dalam MB
+    """
+
+    def __init__(self, memory_manager):
+        """
+        Inisialisasi pemadat untuk sebuah MemoryManager.
+
+        Args:
+            memory_manager (MemoryManager): Pengelola memori yang dipadatkan
+        """
+        self.memory_manager = memory_manager
+        self.position = 0
+        self.total_moved = 0
+
+    def compact(self, mode="Full", size=None, budget=None, max_cost=None):
+        """
+        Menjalankan satu pemadatan.
+
+        Args:
+            mode (str, optional): Mode pemadatan. Defaults to "Full".
+                                Pilihan: "Full", "Minimal", "Incremental"
+            size (int, optional): Ukuran blok kosong yang dibutuhkan dalam MB
+                                untuk mode Minimal. Defaults to None.
+            budget (int, optional): Ukuran maksimum yang dipindahkan dalam MB
+                                  untuk mode Incremental. Defaults to None.
+            max_cost (int, optional): Biaya maksimum rencana Minimal dalam MB.
+                                    Rencana yang lebih mahal tidak dijalankan.
+                                    Defaults to None (tanpa batas).
+
+        Returns:
+            dict: Hasil pemadatan berisi mode, moved (total ukuran blok yang
+                 dipindahkan dalam MB), moved_blocks, seconds, dan complete
+                 (False jika blok kosong yang diminta tidak dapat dibuka dengan
+                 biaya yang diizinkan atau pemadatan Incremental belum selesai)
+
+        Raises:
+            ValueError: Jika mode tidak valid atau size/budget tidak diberikan
+        """
+        if mode not in COMPACTION_MODES:
+            raise ValueError(f"Unknown compaction mode: {mode}")
+        if mode == "Minimal" and size is None:
+            raise ValueError("Minimal compaction needs a size")
+        if mode == "Incremental" and budget is None:
+            raise ValueError("Incremental compaction needs a budget")
+
+        begin = time.perf_counter()
+        moved = 0
+        moved_blocks = 0
+        complete = False
+
+        if self.memory_manager.engine is None:
+            with self.memory_manager.batch():
+                if mode == "Full":
+                    moved, moved_blocks = self.full()
+                    complete = True
+                elif mode == "Minimal":
+                    plan = self.plan_minimal(size)
+                    if plan is not None and (max_cost is None or plan[0] <= max_cost):
+                        _, first, last = plan
+                        moved, moved_blocks = self.relocate(first, last)
+                        complete = True
+                else:
+                    moved, moved_blocks, complete = self.incremental(budget)
+
+        self.total_moved += moved
+        return {
+            "mode": mode,
+            "moved": moved,
+            "moved_blocks": moved_blocks,
+            "seconds": time.perf_counter() - begin,
+            "complete": complete,
+        }
+
+    def full(self):
+        """
+        Menggeser semua blok terpakai ke awal partisinya.
+
+        Daftar blok dan indeks blok kosong dibangun ulang sekali untuk seluruh
+        memori.
+
+        Returns:
+            tuple: Total ukuran blok yang dipindahkan dalam MB dan jumlahnya
+        """
+        manager = self.memory_manager
+        blocks = manager.memory_blocks
+        compacted = []
+        moved = 0
+        moved_blocks = 0
+        index = 0
+
+        while index < len(blocks):
+            partition_id = blocks[index].partition_id
+            address = blocks[index].start
+            while index < len(blocks) and blocks[index].partition_id == partition_id:
+                block = blocks[index]
+                region_end = block.end
+                index += 1
+                if block.is_free:
+                    continue
+                if block.start != address:
+                    moved += block.size
+                    moved_blocks += 1
+                    block.start = address
+                    block.end = address + block.size - 1
+                compacted.append(block)
+                address += block.size
+
+            if address <= region_end:
+                compacted.append(
+                    MemoryBlock(
+                        address, region_end - address + 1, partition_id=partition_id
+                    )
+                )
+
+        manager.memory_blocks = compacted
+        manager.free_index.rebuild(compacted)
+        if moved:
+            manager.emit_event(LayoutChanged(0, manager.total_memory))
+            manager.notify_callbacks()
+        return moved, moved_blocks
+
+    def plan_minimal(self, size):
+        """
+        Mencari rentang blok termurah yang dapat dipadatkan menjadi satu blok
+        kosong berukuran size.
+
+        Rentang dicari dengan dua penunjuk di setiap partisi. Biaya rentang
+        adalah total ukuran blok terpakai di dalamnya, yaitu blok yang harus
+        digeser ke bawah agar semua ruang kosongnya berkumpul di akhir rentang.
+
+        Args:
+            size (int): Ukuran blok kosong yang dibutuhkan dalam MB
+
+        Returns:
+            tuple: (biaya dalam MB, indeks blok pertama, indeks blok terakhir),
+                  atau None jika tidak ada partisi dengan ruang kosong yang cukup
+        """
+        blocks = self.memory_manager.memory_blocks
+        best = None
+        first = 0
+        free_size = 0
+        used_size = 0
+
+        for last, block in enumerate(blocks):
+            if block.partition_id != blocks[first].partition_id:
+                first = last
+                free_size = 0
+                used_size = 0
+
+            if block.is_free:
+                free_size += block.size
+            else:
+                used_size += block.size
+
+            while first < last:
+                head = blocks[first]
+                head_free = head.size if head.is_free else 0
+                if free_size - head_free < size:
+                    break
+                free_size -= head_free
+                used_size -= head.size - head_free
+                first += 1
+
+            if free_size >= size and (best is None or used_size < best[0]):
+                best = (used_size, first, last)
+
+        return best
+
+    def relocate(self, first, last):
+        """
+        Memadatkan rentang blok dengan menggeser blok terpakai ke awal rentang.
+
+        Semua ruang kosong dalam rentang digabungkan menjadi satu blok kosong
+        di akhir rentang, lalu digabungkan dengan tetangga kanannya jika kosong.
+        Rentang harus berada dalam satu partisi.
+
+        Args:
+            first (int): Indeks blok pertama dalam memory_blocks
+            last (int): Indeks blok terakhir dalam memory_blocks
+
+        Returns:
+            tuple: Total ukuran blok yang dipindahkan dalam MB dan jumlahnya
+        """
+        manager = self.memory_manager
+        blocks = manager.memory_blocks
+        segment = blocks[first : last + 1]
+        region_start = segment[0].start
+        region_end = segment[-1].end
+        address = region_start
+        moved = 0
+        moved_blocks = 0
+        relocated = []
+
+        for block in segment:
+            if block.is_free:
+                manager.free_index.remove(block)
+                continue
+            if block.start != address:
+                moved += block.size
+                moved_blocks += 1
+                block.start = address
+                block.end = address + block.size - 1
+            relocated.append(block)
+            address += block.size
+
+        if address <= region_end:
+            relocated.append(
+                MemoryBlock(
+                    address,
+                    region_end - address + 1,
+                    partition_id=segment[0].partition_id,
+                )
+            )
+        blocks[first : last + 1] = relocated
+
+        if manager.event_callbacks:
+            manager.emit_event(
+                LayoutChanged(region_start, region_end - region_start + 1)
+            )
+        if relocated[-1].is_free:
+            manager.coalesce_block(first + len(relocated) - 1)
+        manager.notify_callbacks()
+        return moved, moved_blocks
+
+    def incremental(self, budget):
+        """
+        Menggeser blok kosong ke atas dengan memindahkan paling banyak budget MB.
+
+        Mulai dari self.position, setiap blok kosong ditukar dengan blok
+        terpakai tepat di kanannya. Blok terpakai yang lebih besar dari budget
+        tidak pernah dapat dipindahkan dalam satu pemanggilan, sehingga
+        dilewati. Jika akhir memori tercapai, pemanggilan berikutnya dimulai
+        lagi dari alamat 0. Pemadatan hanya dianggap selesai jika akhir memori
+        tercapai tanpa ada blok yang dilewati, karena blok kosong di bawah blok
+        yang dilewati masih terpencar.
+
+        Args:
+            budget (int): Ukuran maksimum yang dipindahkan dalam MB
+
+        Returns:
+            tuple: Total ukuran yang dipindahkan dalam MB, jumlah blok yang
+                  dipindahkan, dan status apakah akhir memori tercapai tanpa
+                  melewati blok
+        """
+        blocks = self.memory_manager.memory_blocks
+        index = max(
+            bisect.bisect_right(blocks, self.position, key=attrgetter("start")) - 1,
+            0,
+        )
+        moved = 0
+        moved_blocks = 0
+        skipped = False
+
+        while index + 1 < len(blocks):
+            hole = blocks[index]
+            block = blocks[index + 1]
+            if (
+                not hole.is_free
+                or block.is_free
+                or block.partition_id != hole.partition_id
+            ):
+                index += 1
+                continue
+            if block.size > budget:
+                skipped = True
+                index += 1
+                continue
+            if moved + block.size > budget:
+                self.position = hole.start
+                return moved, moved_blocks, False
+
+            size, count = self.relocate(index, index + 1)
+            moved += size
+            moved_blocks += count
+            index += 1
+
+        self.position = 0
+        return moved, moved_blocks, not skipped
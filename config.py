@@ -15,4 +15,22 @@ BLOCK_COLORS = [
     "#795548",  # Brown
     "#607D8B",  # Blue Gray
     "#E91E63",  # Pink
-]
\ No newline at end of file
+]
+
+PARTITION_COLORS = [
+    "#3a7ebf",
+    "#bf3a3a",
+    "#3abf7e",
+    "#7e3abf",
+    "#bf7e3a",
+    "#7ebf3a",
+]
+
+ALGORITHM_COLORS = {
+    "First Fit": "#4CAF50",
+    "Best Fit": "#2196F3",
+    "Worst Fit": "#FF9800",
+    "Next Fit": "#00BCD4",
+    "Buddy": "#E91E63",
+    "TLSF": "#795548",
+}
@@ -0,0 +1,566 @@
+import random
+from collections import Counter
+
+
+class _TreeNode:
+    """
+    Simpul pohon alamat blok kosong.
+
+    Attributes:
+        start (int): Alamat awal blok kosong dalam MB
+        size (int): Ukuran blok kosong dalam MB
+        priority (float): Prioritas acak untuk menjaga keseimbangan treap
+        left (_TreeNode): Anak kiri (alamat lebih rendah)
+        right (_TreeNode): Anak kanan (alamat lebih tinggi)
+        max_size (int): Ukuran blok terbesar dalam subtree simpul ini
+    """
+
+    __slots__ = ("start", "size", "priority", "left", "right", "max_size")
+
+    def __init__(self, start, size):
+        self.start = start
+        self.size = size
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+        self.max_size = size
+
+
+class FreeAddressTree:
+    """
+    Pohon blok kosong yang diurutkan berdasarkan alamat awal.
+
+    Kelas ini mengimplementasikan treap yang setiap simpulnya menyimpan ukuran
+    blok terbesar dalam subtree-nya. Dengan informasi tersebut, pencarian blok
+    kosong dengan alamat terendah yang cukup besar dapat melewati seluruh
+    subtree yang tidak mungkin muat, sehingga First Fit berjalan dalam O(log n)
+    tanpa harus memeriksa blok-blok yang sudah terpakai.
+
+    Attributes:
+        root (_TreeNode): Akar pohon, atau None jika pohon kosong
+    """
+
+    def __init__(self):
+        """
+        Inisialisasi pohon alamat kosong.
+        """
+        self.root = None
+
+    @staticmethod
+    def _pull(node):
+        max_size = node.size
+        if node.left is not None and node.left.max_size > max_size:
+            max_size = node.left.max_size
+        if node.right is not None and node.right.max_size > max_size:
+            max_size = node.right.max_size
+        node.max_size = max_size
+
+    def _split(self, node, start):
+        if node is None:
+            return None, None
+        if node.start < start:
+            left, right = self._split(node.right, start)
+            node.right = left
+            self._pull(node)
+            return node, right
+        left, right = self._split(node.left, start)
+        node.left = right
+        self._pull(node)
+        return left, node
+
+    def _merge(self, left, right):
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            self._pull(left)
+            return left
+        right.left = self._merge(left, right.left)
+        self._pull(right)
+        return right
+
+    def build(self, items):
+        """
+        Membangun ulang pohon dari pasangan (alamat awal, ukuran) yang terurut.
+
+        Pohon dibangun dalam waktu linear menggunakan konstruksi Cartesian tree.
+
+        Args:
+            items (iterable): Pasangan (alamat awal, ukuran) terurut berdasarkan alamat
+        """
+        stack = []
+        for start, size in items:
+            node = _TreeNode(start, size)
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+                self._pull(last)
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+        for node in reversed(stack):
+            self._pull(node)
+        self.root = stack[0] if stack else None
+
+    def insert(self, start, size):
+        """
+        Menambahkan blok kosong ke dalam pohon.
+
+        Args:
+            start (int): Alamat awal blok dalam MB
+            size (int): Ukuran blok dalam MB
+        """
+        left, right = self._split(self.root, start)
+        self.root = self._merge(self._merge(left, _TreeNode(start, size)), right)
+
+    def remove(self, start):
+        """
+        Menghapus blok kosong dengan alamat awal tertentu dari pohon.
+
+        Args:
+            start (int): Alamat awal blok dalam MB
+        """
+        left, right = self._split(self.root, start)
+        _, right = self._split(right, start + 1)
+        self.root = self._merge(left, right)
+
+    def first_fit(self, size, lower=0):
+        """
+        Mencari blok kosong dengan alamat terendah yang cukup besar.
+
+        Args:
+            size (int): Ukuran yang dibutuhkan dalam MB
+            lower (int, optional): Alamat awal minimum blok yang dicari. Defaults to 0.
+
+        Returns:
+            int: Alamat awal blok yang ditemukan, atau None jika tidak ada
+        """
+        node = self._find(self.root, size, lower)
+        return node.start if node is not None else None
+
+    def _find(self, node, size, lower):
+        while node is not None and node.max_size >= size:
+            if node.start < lower:
+                node = node.right
+                continue
+            found = self._find(node.left, size, lower)
+            if found is not None:
+                return found
+            if node.size >= size:
+                return node
+            node = node.right
+        return None
+
+
+class _SizeNode:
+    """
+    Simpul pohon ukuran blok kosong.
+
+    Attributes:
+        key (tuple): Pasangan (ukuran, alamat awal) blok kosong
+        priority (float): Prioritas acak untuk menjaga keseimbangan treap
+        left (_SizeNode): Anak kiri (kunci lebih kecil)
+        right (_SizeNode): Anak kanan (kunci lebih besar)
+    """
+
+    __slots__ = ("key", "priority", "left", "right")
+
+    def __init__(self, key):
+        self.key = key
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+
+
+class FreeSizeTree:
+    """
+    Pohon blok kosong yang diurutkan berdasarkan pasangan (ukuran, alamat awal).
+
+    Kelas ini mengimplementasikan treap seperti FreeAddressTree, sehingga
+    penambahan dan penghapusan blok, pencarian kunci terkecil yang tidak
+    kurang dari kunci tertentu, dan pencarian kunci terbesar masing-masing
+    berjalan dalam O(log n) harapan.
+
+    Attributes:
+        root (_SizeNode): Akar pohon, atau None jika pohon kosong
+    """
+
+    def __init__(self):
+        """
+        Inisialisasi pohon ukuran kosong.
+        """
+        self.root = None
+
+    def _split(self, node, key):
+        if node is None:
+            return None, None
+        if node.key < key:
+            left, right = self._split(node.right, key)
+            node.right = left
+            return node, right
+        left, right = self._split(node.left, key)
+        node.left = right
+        return left, node
+
+    def _merge(self, left, right):
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            return left
+        right.left = self._merge(left, right.left)
+        return right
+
+    def build(self, keys):
+        """
+        Membangun ulang pohon dari kunci (ukuran, alamat awal) yang terurut.
+
+        Args:
+            keys (iterable): Kunci terurut
+        """
+        stack = []
+        for key in keys:
+            node = _SizeNode(key)
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+        self.root = stack[0] if stack else None
+
+    def insert(self, key):
+        """
+        Menambahkan kunci ke dalam pohon.
+
+        Args:
+            key (tuple): Pasangan (ukuran, alamat awal)
+        """
+        left, right = self._split(self.root, key)
+        self.root = self._merge(self._merge(left, _SizeNode(key)), right)
+
+    def remove(self, key):
+        """
+        Menghapus kunci dari pohon.
+
+        Args:
+            key (tuple): Pasangan (ukuran, alamat awal)
+        """
+        size, start = key
+        left, right = self._split(self.root, key)
+        _, right = self._split(right, (size, start + 1))
+        self.root = self._merge(left, right)
+
+    def ceiling(self, key):
+        """
+        Mencari kunci terkecil yang tidak kurang dari kunci tertentu.
+
+        Args:
+            key (tuple): Kunci batas bawah, misalnya (ukuran,)
+
+        Returns:
+            tuple: Kunci yang ditemukan, atau None jika tidak ada
+        """
+        node = self.root
+        found = None
+        while node is not None:
+            if node.key < key:
+                node = node.right
+            else:
+                found = node.key
+                node = node.left
+        return found
+
+    def maximum(self):
+        """
+        Mencari kunci terbesar dalam pohon.
+
+        Returns:
+            tuple: Kunci terbesar, atau None jika pohon kosong
+        """
+        node = self.root
+        if node is None:
+            return None
+        while node.right is not None:
+            node = node.right
+        return node.key
+
+
+class FreeBlockIndex:
+    """
+    Indeks blok memori kosong yang diurutkan berdasarkan ukuran dan alamat.
+
+    Kelas ini menyimpan semua blok kosong milik MemoryManager dalam
+    FreeSizeTree yang terurut berdasarkan pasangan (ukuran, alamat awal).
+    Dengan urutan ini, pencarian Best Fit cukup berupa pencarian kunci terkecil
+    dengan ukuran yang mencukupi, dan Worst Fit cukup membaca kunci terbesar.
+    Penambahan dan penghapusan blok juga berjalan dalam O(log n). Alamat awal dipakai
+    sebagai pemecah seri sehingga blok dengan alamat terendah selalu dipilih,
+    sama seperti pemindaian linear pada daftar blok memori.
+
+    Selain itu, blok kosong juga disimpan dalam FreeAddressTree yang terurut
+    berdasarkan alamat, sehingga First Fit dapat langsung menemukan blok kosong
+    dengan alamat terendah yang cukup besar.
+
+    Indeks harus selalu sinkron dengan daftar blok memori: blok dihapus dari
+    indeks sebelum ukurannya diubah dan ditambahkan kembali setelahnya.
+
+    Total ukuran blok kosong dan histogram ukurannya ikut diperbarui pada
+    setiap penambahan dan penghapusan, sehingga dapat dibaca tanpa pemindaian.
+
+    Attributes:
+        total_size (int): Total ukuran semua blok kosong dalam MB
+        histogram (dict): Jumlah blok kosong per kelas ukuran pangkat dua
+                        (key: bit_length ukuran, yaitu kelas [2^(k-1), 2^k))
+        _by_size (FreeSizeTree): Pohon blok kosong terurut berdasarkan
+                               (ukuran, alamat awal)
+        _blocks (dict): Pemetaan alamat awal ke objek MemoryBlock yang kosong
+        _by_address (FreeAddressTree): Pohon blok kosong terurut berdasarkan alamat
+    """
+
+    def __init__(self, blocks=None):
+        """
+        Inisialisasi indeks blok kosong.
+
+        Args:
+            blocks (list, optional): Daftar blok memori awal. Hanya blok kosong
+                                   yang dimasukkan ke dalam indeks. Defaults to None.
+        """
+        self._by_size = FreeSizeTree()
+        self._blocks = {}
+        self._by_address = FreeAddressTree()
+        self.total_size = 0
+        self.histogram = {}
+        if blocks:
+            self.rebuild(blocks)
+
+    def __len__(self):
+        """
+        Mengembalikan jumlah blok kosong dalam indeks.
+
+        Returns:
+            int: Jumlah blok kosong
+        """
+        return len(self._blocks)
+
+    def rebuild(self, blocks):
+        """
+        Membangun ulang indeks dari daftar blok memori.
+
+        Method ini dipakai setelah operasi yang mengganti seluruh daftar blok,
+        seperti penggabungan penuh, pembuatan partisi, atau perubahan ukuran memori.
+
+        Args:
+            blocks (list[MemoryBlock]): Daftar blok memori terbaru
+        """
+        self._blocks = {block.start: block for block in blocks if block.is_free}
+        self._by_size.build(
+            sorted((block.size, block.start) for block in self._blocks.values())
+        )
+        self._by_address.build(
+            sorted((block.start, block.size) for block in self._blocks.values())
+        )
+        self.total_size = 0
+        self.histogram = {}
+        for block in self._blocks.values():
+            self.count_size(block.size, 1)
+
+    def add(self, block):
+        """
+        Menambahkan blok kosong ke dalam indeks.
+
+        Args:
+            block (MemoryBlock): Blok kosong yang akan ditambahkan
+        """
+        self._blocks[block.start] = block
+        self._by_size.insert((block.size, block.start))
+        self._by_address.insert(block.start, block.size)
+        self.count_size(block.size, 1)
+
+    def remove(self, block):
+        """
+        Menghapus blok dari indeks.
+
+        Method ini harus dipanggil sebelum ukuran atau alamat blok diubah,
+        karena posisi blok dalam indeks ditentukan oleh kedua nilai tersebut.
+
+        Args:
+            block (MemoryBlock): Blok yang akan dihapus dari indeks
+        """
+        stored = self._blocks.get(block.start)
+        if stored is not None and stored.size == block.size:
+            self._by_size.remove((block.size, block.start))
+            del self._blocks[block.start]
+            self._by_address.remove(block.start)
+            self.count_size(block.size, -1)
+
+    def count_size(self, size, delta):
+        """
+        Memperbarui total ukuran dan histogram untuk satu blok kosong.
+
+        Args:
+            size (int): Ukuran blok dalam MB
+            delta (int): 1 jika blok ditambahkan, -1 jika blok dihapus
+        """
+        self.total_size += size * delta
+        bucket = size.bit_length()
+        count = self.histogram.get(bucket, 0) + delta
+        if count:
+            self.histogram[bucket] = count
+        else:
+            del self.histogram[bucket]
+
+    def first_fit(self, size, lower=0):
+        """
+        Mencari blok kosong dengan alamat terendah yang cukup besar.
+
+        Args:
+            size (int): Ukuran yang dibutuhkan dalam MB
+            lower (int, optional): Alamat awal minimum blok. Defaults to 0.
+
+        Returns:
+            MemoryBlock: Blok pertama yang muat, atau None jika tidak ada
+        """
+        start = self._by_address.first_fit(size, lower)
+        if start is None:
+            return None
+        return self._blocks[start]
+
+    def best_fit(self, size):
+        """
+        Mencari blok kosong terkecil yang cukup besar.
+
+        Args:
+            size (int): Ukuran yang dibutuhkan dalam MB
+
+        Returns:
+            MemoryBlock: Blok terkecil yang muat dengan alamat terendah,
+                        atau None jika tidak ada blok yang cukup besar
+        """
+        key = self._by_size.ceiling((size,))
+        if key is None:
+            return None
+        return self._blocks[key[1]]
+
+    def worst_fit(self, size):
+        """
+        Mencari blok kosong terbesar yang cukup besar.
+
+        Args:
+            size (int): Ukuran yang dibutuhkan dalam MB
+
+        Returns:
+            MemoryBlock: Blok terbesar dengan alamat terendah, atau None jika
+                        blok terbesar pun tidak cukup besar
+        """
+        if not self._blocks:
+            return None
+        largest = self.largest_size()
+        if largest < size:
+            return None
+        return self._blocks[self._by_size.ceiling((largest,))[1]]
+
+    def largest_size(self):
+        """
+        Mendapatkan ukuran blok kosong terbesar.
+
+        Returns:
+            int: Ukuran blok kosong terbesar dalam MB, atau 0 jika tidak ada
+        """
+        key = self._by_size.maximum()
+        return key[0] if key is not None else 0
+
+
+class FreeSizeStats:
+    """
+    Penghitung ukuran blok kosong untuk mesin alokasi.
+
+    Mesin alokasi memanggil add setiap kali sebuah blok kosong terbentuk dan
+    remove setiap kali blok kosong dipakai atau digabungkan, sehingga jumlah,
+    total ukuran, ukuran terbesar, dan histogram blok kosong dapat dibaca oleh
+    MemoryManager.stats tanpa membangun daftar blok mesin tersebut.
+
+    Setiap pembaruan hanya mengubah beberapa penghitung dalam O(1), sehingga
+    tidak menambah biaya asimtotik mesin alokasi. Ukuran terbesar hanya
+    dihitung ulang ketika blok terakhir dengan ukuran terbesar dihapus.
+
+    Attributes:
+        count (int): Jumlah blok kosong
+        total_size (int): Total ukuran semua blok kosong dalam MB
+        histogram (dict): Jumlah blok kosong per kelas ukuran pangkat dua
+                        (key: bit_length ukuran, yaitu kelas [2^(k-1), 2^k))
+        sizes (Counter): Jumlah blok kosong untuk setiap ukuran
+        largest (int): Ukuran blok kosong terbesar dalam MB
+    """
+
+    def __init__(self):
+        """
+        Inisialisasi penghitung kosong.
+        """
+        self.count = 0
+        self.total_size = 0
+        self.histogram = {}
+        self.sizes = Counter()
+        self.largest = 0
+
+    def __len__(self):
+        """
+        Mengembalikan jumlah blok kosong.
+
+        Returns:
+            int: Jumlah blok kosong
+        """
+        return self.count
+
+    def add(self, size):
+        """
+        Mencatat satu blok kosong baru.
+
+        Args:
+            size (int): Ukuran blok dalam MB
+        """
+        self.count += 1
+        self.total_size += size
+        self.sizes[size] += 1
+        if size > self.largest:
+            self.largest = size
+        bucket = size.bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def remove(self, size):
+        """
+        Menghapus catatan satu blok kosong.
+
+        Args:
+            size (int): Ukuran blok dalam MB
+        """
+        self.count -= 1
+        self.total_size -= size
+        remaining = self.sizes[size] - 1
+        if remaining:
+            self.sizes[size] = remaining
+        else:
+            del self.sizes[size]
+            if size == self.largest:
+                self.largest = max(self.sizes, default=0)
+        bucket = size.bit_length()
+        count = self.histogram[bucket] - 1
+        if count:
+            self.histogram[bucket] = count
+        else:
+            del self.histogram[bucket]
+
+    def largest_size(self):
+        """
+        Mendapatkan ukuran blok kosong terbesar.
+
+        Returns:
+            int: Ukuran blok kosong terbesar dalam MB, atau 0 jika tidak ada
+        """
+        return self.largest
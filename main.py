@@ -2,6 +2,7 @@ import customtkinter as ctk
 from memory_manager import MemoryManager
 from memory_visualizer import MemoryVisualizer
 from process import Process
+from process_list import VirtualProcessList
 from config import WINDOW_WIDTH, WINDOW_HEIGHT, SECONDARY_COLOR
 
 
@@ -106,6 +107,23 @@ class MemoryManagementApp:
         )
         update_btn.pack(side="left", padx=5)
 
+        mode_frame = ctk.CTkFrame(self.left_panel)
+        mode_frame.pack(fill="x", padx=10, pady=10)
+
+        mode_label = ctk.CTkLabel(
+            mode_frame, text="Allocation Mode:", font=ctk.CTkFont(weight="bold")
+        )
+        mode_label.pack(side="left", padx=5)
+
+        self.allocation_mode_var = ctk.StringVar(value="Variable")
+        mode_dropdown = ctk.CTkOptionMenu(
+            mode_frame,
+            values=["Variable", "Buddy", "TLSF", "Compact", "Bitmap"],
+            variable=self.allocation_mode_var,
+            command=self.update_allocation_mode,
+        )
+        mode_dropdown.pack(side="left", padx=5)
+
         partition_frame = ctk.CTkFrame(self.left_panel)
         partition_frame.pack(fill="x", padx=10, pady=10)
 
@@ -191,7 +209,7 @@ class MemoryManagementApp:
         algo_label.grid(row=3, column=0, padx=5, pady=5, sticky="w")
 
         self.algorithm_var = ctk.StringVar(value="First Fit")
-        algorithms = ["First Fit", "Best Fit", "Worst Fit"]
+        algorithms = ["First Fit", "Best Fit", "Worst Fit", "Next Fit"]
         algo_dropdown = ctk.CTkOptionMenu(
             process_inputs_frame, values=algorithms, variable=self.algorithm_var
         )
@@ -210,12 +228,9 @@ class MemoryManagementApp:
         )
         list_label.pack(pady=5)
 
-        self.process_list_scroll = ctk.CTkScrollableFrame(
-            process_list_frame, width=250, height=200
+        self.process_list = VirtualProcessList(
+            process_list_frame, self.remove_process, height=200
         )
-        self.process_list_scroll.pack(fill="x", padx=5, pady=5)
-
-        self.process_ui_elements = {}
 
         clear_btn = ctk.CTkButton(
             self.left_panel,
@@ -338,17 +353,10 @@ class MemoryManagementApp:
                 var.set(self.partition_values[i])
                 label.configure(text=f"{self.partition_values[i]:.1f}%")
 
-        process_names = list(self.process_ui_elements.keys())
-
         result = self.memory_manager.create_partitions(self.partition_values)
 
         if result:
-            for process_name in process_names:
-                if process_name in self.process_ui_elements:
-                    self.process_ui_elements[process_name]["frame"].destroy()
-
-            self.process_ui_elements = {}
-
+            self.process_list.clear()
             self.memory_visualizer.redraw()
             self.status_var.set(
                 f"Memory partitioned into {len(self.partition_values)} sections"
@@ -356,6 +364,25 @@ class MemoryManagementApp:
         else:
             self.status_var.set("Failed to partition memory")
 
+    def update_allocation_mode(self, choice):
+        """
+        Mengganti mode alokasi memori.
+
+        Method ini mengganti mesin alokasi pada memory_manager sesuai pilihan
+        pengguna. Semua proses yang sedang berjalan akan dihapus dari memori
+        dan dari daftar proses.
+
+        Args:
+            choice (str): Mode alokasi yang dipilih ("Variable", "Buddy", "TLSF",
+                          "Compact", atau "Bitmap")
+        """
+        if self.memory_manager.set_allocation_mode(choice):
+            self.process_list.clear()
+            self.memory_visualizer.redraw()
+            self.status_var.set(f"Allocation mode changed to {choice}")
+        else:
+            self.status_var.set(f"Unknown allocation mode '{choice}'")
+
     def update_memory_size(self):
         """
         Memperbarui ukuran total memori.
@@ -423,8 +450,7 @@ class MemoryManagementApp:
         """
         Menambahkan proses ke daftar proses dalam antarmuka.
 
-        Method ini membuat elemen UI untuk menampilkan informasi proses,
-        termasuk:
+        Daftar menampilkan informasi proses, termasuk:
         - Nama dan ukuran proses
         - Partisi yang digunakan (jika ada)
         - Algoritma alokasi yang digunakan
@@ -434,91 +460,10 @@ class MemoryManagementApp:
         Args:
             process (Process): Proses yang akan ditambahkan ke daftar
         """
-        process_item = ctk.CTkFrame(self.process_list_scroll)
-        process_item.pack(fill="x", padx=5, pady=5)
-        process_item.grid_columnconfigure(0, weight=1)
-
         partition_id = self.memory_manager.get_process_partition(process.name)
-        partition_text = (
-            f" [Partition {partition_id+1}]" if partition_id is not None else ""
-        )
-
-        header_frame = ctk.CTkFrame(process_item, fg_color="transparent")
-        header_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=2)
-
-        process_name_label = ctk.CTkLabel(
-            header_frame, text=f"{process.name} ({process.size} MB)", anchor="w"
-        )
-        process_name_label.pack(side="left")
-
-        if partition_id is not None:
-            partition_colors = [
-                "#3a7ebf",
-                "#bf3a3a",
-                "#3abf7e",
-                "#7e3abf",
-                "#bf7e3a",
-                "#7ebf3a",
-            ]
-            color = partition_colors[partition_id % len(partition_colors)]
-            partition_label = ctk.CTkLabel(
-                header_frame,
-                text=f"P{partition_id}",
-                fg_color=color,
-                text_color="white",
-                corner_radius=10,
-                width=30,
-                height=20,
-            )
-            partition_label.pack(side="right", padx=5)
-
-        if process.algorithm:
-            algo_colors = {
-                "First Fit": "#4CAF50",
-                "Best Fit": "#2196F3",
-                "Worst Fit": "#FF9800",
-            }
-            algo_color = algo_colors.get(process.algorithm, "#9C27B0")
-
-            algo_letter = (
-                "".join(word[0] for word in process.algorithm.split())
-                if process.algorithm
-                else "?"
-            )
-            algo_label = ctk.CTkLabel(
-                header_frame,
-                text=algo_letter,
-                fg_color=algo_color,
-                text_color="white",
-                corner_radius=10,
-                width=30,
-                height=20,
-            )
-            algo_label.pack(side="right", padx=5)
+        self.process_list.add(process, partition_id)
 
-        time_var = ctk.StringVar(
-            value=f"Time: {process.elapsed_time}s / {process.duration}s"
-        )
-        time_label = ctk.CTkLabel(process_item, textvariable=time_var)
-        time_label.grid(row=1, column=0, sticky="w", padx=5, pady=2)
-
-        remove_btn = ctk.CTkButton(
-            process_item,
-            text="Remove",
-            width=70,
-            height=25,
-            command=lambda p=process: self.remove_process(p, process_item),
-            fg_color=SECONDARY_COLOR,
-        )
-        remove_btn.grid(row=0, column=1, rowspan=2, padx=5, pady=2)
-
-        self.process_ui_elements[process.name] = {
-            "frame": process_item,
-            "time_var": time_var,
-            "process": process,
-        }
-
-    def remove_process(self, process, list_item):
+    def remove_process(self, process_name):
         """
         Menghapus proses dari sistem.
 
@@ -527,15 +472,12 @@ class MemoryManagementApp:
         akan diperbarui.
 
         Args:
-            process (Process): Proses yang akan dihapus
-            list_item: Widget UI yang terkait dengan proses
+            process_name (str): Nama proses yang akan dihapus
         """
-        self.memory_manager.deallocate_process(process.name)
-        list_item.destroy()
-        if process.name in self.process_ui_elements:
-            del self.process_ui_elements[process.name]
+        self.memory_manager.deallocate_process(process_name)
+        self.process_list.remove(process_name)
         self.memory_visualizer.redraw()
-        self.status_var.set(f"Process '{process.name}' removed")
+        self.status_var.set(f"Process '{process_name}' removed")
 
     def process_expired_callback(self, process_name):
         """
@@ -560,9 +502,7 @@ class MemoryManagementApp:
         Args:
             process_name (str): Nama proses yang selesai
         """
-        if process_name in self.process_ui_elements:
-            self.process_ui_elements[process_name]["frame"].destroy()
-            del self.process_ui_elements[process_name]
+        if self.process_list.remove(process_name):
             self.status_var.set(f"Process '{process_name}' completed and removed")
 
     def clear_all(self):
@@ -574,9 +514,7 @@ class MemoryManagementApp:
         partisi akan dipertahankan tetapi semua blok akan dikosongkan.
         """
         self.memory_manager.clear_all()
-        for widget in self.process_list_scroll.winfo_children():
-            widget.destroy()
-        self.process_ui_elements = {}
+        self.process_list.clear()
         self.memory_visualizer.redraw()
         self.status_var.set("All processes cleared")
 
@@ -595,23 +533,11 @@ class MemoryManagementApp:
         """
         Memperbarui waktu proses yang ditampilkan dalam antarmuka.
 
-        Method ini memperbarui label waktu untuk setiap proses yang
-        sedang berjalan, menampilkan waktu yang telah berlalu dan
-        waktu yang tersisa.
-        """
-        for process_name, ui_data in self.process_ui_elements.items():
-            process = ui_data["process"]
-            time_var = ui_data["time_var"]
-            frame = ui_data["frame"]
-
-            if process_name in self.memory_manager.processes:
-                process = self.memory_manager.processes[process_name]
-                remaining_time = process.duration - process.elapsed_time
-                time_var.set(
-                    f"Time: {process.elapsed_time}s / {process.duration}s ({remaining_time}s left)"
-                )
-            else:
-                time_var.set(f"Time: {process.elapsed_time}s / {process.duration}s")
+        Method ini memperbarui label waktu untuk proses yang sedang terlihat
+        dalam daftar, menampilkan waktu yang telah berlalu dan waktu yang
+        tersisa. Proses yang tidak terlihat tidak diperbarui.
+        """
+        self.process_list.update_times(self.memory_manager.processes)
 
     def run(self):
         """
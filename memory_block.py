@@ -0,0 +1,43 @@
+class MemoryBlock:
+    """
+    Kelas yang merepresentasikan sebuah blok memori dalam sistem.
+
+    Kelas ini menyimpan informasi tentang blok memori, termasuk lokasi, ukuran,
+    status ketersediaan, dan proses yang menggunakan blok tersebut. Setiap blok
+    memori memiliki alamat awal dan akhir yang digunakan untuk melacak posisinya
+    dalam memori fisik.
+
+    Attributes:
+        start (int): Alamat awal blok memori dalam MB
+        size (int): Ukuran blok memori dalam MB
+        is_free (bool): Status apakah blok memori tersedia untuk dialokasikan
+        process (Process): Proses yang menggunakan blok memori (None jika blok kosong)
+        end (int): Alamat akhir blok memori dalam MB (start + size - 1)
+        partition_id (int): ID partisi yang dimiliki blok memori (None jika tidak dipartisi)
+    """
+
+    __slots__ = ("start", "size", "is_free", "process", "end", "partition_id")
+
+    def __init__(self, start, size, is_free=True, process=None, partition_id=None):
+        """
+        Inisialisasi objek MemoryBlock baru.
+
+        Method ini membuat instance baru dari kelas MemoryBlock dengan parameter yang diberikan.
+        Alamat akhir blok dihitung secara otomatis berdasarkan alamat awal dan ukuran.
+
+        Args:
+            start (int): Alamat awal blok memori dalam MB
+            size (int): Ukuran blok memori dalam MB
+            is_free (bool, optional): Status ketersediaan blok. Defaults to True.
+            process (Process, optional): Proses yang menggunakan blok. Defaults to None.
+            partition_id (int, optional): ID partisi. Defaults to None.
+
+        Raises:
+            ValueError: Jika start atau size bernilai negatif
+        """
+        self.start = start
+        self.size = size
+        self.is_free = is_free
+        self.process = process
+        self.end = start + size - 1
+        self.partition_id = partition_id
@@ -0,0 +1,206 @@
+class MemoryEvent:
+    """
+    Kelas dasar untuk event perubahan blok memori.
+
+    Setiap event membawa rentang alamat yang terpengaruh, sehingga pendengar
+    hanya perlu memperbarui bagian memori yang berubah.
+
+    Attributes:
+        start (int): Alamat awal rentang yang terpengaruh dalam MB
+        size (int): Ukuran rentang yang terpengaruh dalam MB
+    """
+
+    __slots__ = ("start", "size")
+
+    def __init__(self, start, size):
+        """
+        Inisialisasi event untuk sebuah rentang alamat.
+
+        Args:
+            start (int): Alamat awal rentang dalam MB
+            size (int): Ukuran rentang dalam MB
+        """
+        self.start = start
+        self.size = size
+
+    @property
+    def end(self):
+        """
+        Alamat akhir rentang yang terpengaruh (inklusif).
+
+        Returns:
+            int: Alamat akhir dalam MB
+        """
+        return self.start + self.size - 1
+
+    def __repr__(self):
+        return f"{type(self).__name__}(start={self.start}, size={self.size})"
+
+
+class BlockSplit(MemoryEvent):
+    """
+    Event ketika sebuah blok kosong dibelah menjadi dua.
+
+    Rentang event adalah blok asli sebelum dibelah.
+
+    Attributes:
+        split_at (int): Alamat awal bagian kedua dalam MB
+    """
+
+    __slots__ = ("split_at",)
+
+    def __init__(self, start, size, split_at):
+        """
+        Inisialisasi event pembelahan blok.
+
+        Args:
+            start (int): Alamat awal blok asli dalam MB
+            size (int): Ukuran blok asli dalam MB
+            split_at (int): Alamat awal bagian kedua dalam MB
+        """
+        super().__init__(start, size)
+        self.split_at = split_at
+
+
+class BlockAllocated(MemoryEvent):
+    """
+    Event ketika sebuah blok ditempati proses.
+
+    Attributes:
+        process_name (str): Nama proses yang menempati blok
+        partition_id (int): ID partisi blok, atau None jika tidak dipartisi
+    """
+
+    __slots__ = ("process_name", "partition_id")
+
+    def __init__(self, start, size, process_name, partition_id=None):
+        """
+        Inisialisasi event alokasi blok.
+
+        Args:
+            start (int): Alamat awal blok dalam MB
+            size (int): Ukuran blok dalam MB
+            process_name (str): Nama proses yang menempati blok
+            partition_id (int, optional): ID partisi blok. Defaults to None.
+        """
+        super().__init__(start, size)
+        self.process_name = process_name
+        self.partition_id = partition_id
+
+
+class BlockFreed(MemoryEvent):
+    """
+    Event ketika blok sebuah proses dikosongkan.
+
+    Attributes:
+        process_name (str): Nama proses yang sebelumnya menempati blok
+        partition_id (int): ID partisi blok, atau None jika tidak dipartisi
+    """
+
+    __slots__ = ("process_name", "partition_id")
+
+    def __init__(self, start, size, process_name, partition_id=None):
+        """
+        Inisialisasi event dealokasi blok.
+
+        Args:
+            start (int): Alamat awal blok dalam MB
+            size (int): Ukuran blok dalam MB
+            process_name (str): Nama proses yang sebelumnya menempati blok
+            partition_id (int, optional): ID partisi blok. Defaults to None.
+        """
+        super().__init__(start, size)
+        self.process_name = process_name
+        self.partition_id = partition_id
+
+
+class BlockMerged(MemoryEvent):
+    """
+    Event ketika beberapa blok kosong yang berdekatan digabungkan.
+
+    Rentang event adalah blok hasil penggabungan.
+
+    Attributes:
+        merged (list): Rentang blok asli sebagai pasangan (alamat awal, ukuran)
+    """
+
+    __slots__ = ("merged",)
+
+    def __init__(self, start, size, merged):
+        """
+        Inisialisasi event penggabungan blok.
+
+        Args:
+            start (int): Alamat awal blok hasil dalam MB
+            size (int): Ukuran blok hasil dalam MB
+            merged (list): Rentang blok asli sebagai pasangan (alamat awal, ukuran)
+        """
+        super().__init__(start, size)
+        self.merged = merged
+
+
+class PartitionsRebuilt(MemoryEvent):
+    """
+    Event ketika partisi dibuat ulang dan semua blok dikosongkan.
+
+    Rentang event adalah seluruh memori.
+
+    Attributes:
+        partitions (list): Partisi baru sebagai tuple (alamat awal, ukuran, ID
+                         partisi), kosong jika memori tidak lagi dipartisi
+    """
+
+    __slots__ = ("partitions",)
+
+    def __init__(self, start, size, partitions):
+        """
+        Inisialisasi event pembuatan ulang partisi.
+
+        Args:
+            start (int): Alamat awal memori dalam MB
+            size (int): Total ukuran memori dalam MB
+            partitions (list): Partisi baru sebagai tuple (alamat awal, ukuran,
+                             ID partisi)
+        """
+        super().__init__(start, size)
+        self.partitions = partitions
+
+
+class Resized(MemoryEvent):
+    """
+    Event ketika ukuran total memori berubah.
+
+    Rentang event mencakup ukuran lama dan ukuran baru, karena blok kosong di
+    seluruh memori dapat tersusun ulang.
+
+    Attributes:
+        old_size (int): Ukuran memori sebelumnya dalam MB
+        new_size (int): Ukuran memori baru dalam MB
+    """
+
+    __slots__ = ("old_size", "new_size")
+
+    def __init__(self, old_size, new_size):
+        """
+        Inisialisasi event perubahan ukuran memori.
+
+        Args:
+            old_size (int): Ukuran memori sebelumnya dalam MB
+            new_size (int): Ukuran memori baru dalam MB
+        """
+        super().__init__(0, max(old_size, new_size))
+        self.old_size = old_size
+        self.new_size = new_size
+
+
+class LayoutChanged(MemoryEvent):
+    """
+    Event ketika susunan blok dalam sebuah rentang dibangun ulang.
+
+    Digunakan untuk perubahan yang tidak dapat dijelaskan oleh event lain,
+    misalnya saat memori dikosongkan, mode alokasi diganti, atau blok
+    digabungkan melalui merge_free_blocks. Pendengar sebaiknya membaca ulang
+    seluruh blok dalam rentang tersebut.
+    """
+
+    __slots__ = ()
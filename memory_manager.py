@@ -1,48 +1,83 @@
-import time
-import threading
+import bisect
+import functools
+import inspect
+from contextlib import contextmanager
+from operator import attrgetter
+
+from block_table import BlockTable
+from buddy_allocator import BuddyAllocator
+from compaction import Compactor
+from free_index import FreeBlockIndex
+from memory_block import MemoryBlock
+from memory_events import (
+    BlockAllocated,
+    BlockFreed,
+    BlockMerged,
+    BlockSplit,
+    LayoutChanged,
+    PartitionsRebuilt,
+    Resized,
+)
+from page_bitmap import PageBitmap
+from scheduler import ExpiryScheduler
+from slab_cache import SlabCache
+from tlsf_allocator import TLSFAllocator
+
+ALLOCATION_ENGINES = {
+    "Buddy": BuddyAllocator,
+    "TLSF": TLSFAllocator,
+    "Compact": BlockTable,
+    "Bitmap": PageBitmap,
+}
+
+
+def recorded_operation(operation):
+    """
+    Decorator untuk method MemoryManager yang dilaporkan ke callback operasi.
+
+    Hanya pemanggilan terluar yang dilaporkan. Pemanggilan bersarang, misalnya
+    dealokasi proses lama di dalam allocate_process atau pengambilan slab baru
+    oleh cache slab, merupakan bagian dari operasi terluar dan tidak
+    dilaporkan sendiri. Jika tidak ada callback operasi, method dipanggil
+    langsung tanpa biaya tambahan selain satu pemeriksaan.
 
+    Args:
+        operation (str): Nama operasi, misalnya "allocate" atau "free"
 
-class MemoryBlock:
+    Returns:
+        function: Decorator method
     """
-    Kelas yang merepresentasikan sebuah blok memori dalam sistem.
 
-    Kelas ini menyimpan informasi tentang blok memori, termasuk lokasi, ukuran,
-    status ketersediaan, dan proses yang menggunakan blok tersebut. Setiap blok
-    memori memiliki alamat awal dan akhir yang digunakan untuk melacak posisinya
-    dalam memori fisik.
+    def decorator(method):
+        parameters = list(inspect.signature(method).parameters.values())[1:]
+        names = [parameter.name for parameter in parameters]
+        defaults = {
+            parameter.name: parameter.default
+            for parameter in parameters
+            if parameter.default is not parameter.empty
+        }
 
-    Attributes:
-        start (int): Alamat awal blok memori dalam MB
-        size (int): Ukuran blok memori dalam MB
-        is_free (bool): Status apakah blok memori tersedia untuk dialokasikan
-        process (Process): Proses yang menggunakan blok memori (None jika blok kosong)
-        end (int): Alamat akhir blok memori dalam MB (start + size - 1)
-        partition_id (int): ID partisi yang dimiliki blok memori (None jika tidak dipartisi)
-    """
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.operation_callbacks:
+                return method(self, *args, **kwargs)
 
-    def __init__(self, start, size, is_free=True, process=None, partition_id=None):
-        """
-        Inisialisasi objek MemoryBlock baru.
+            self.operation_depth += 1
+            try:
+                result = method(self, *args, **kwargs)
+            finally:
+                self.operation_depth -= 1
 
-        Method ini membuat instance baru dari kelas MemoryBlock dengan parameter yang diberikan.
-        Alamat akhir blok dihitung secara otomatis berdasarkan alamat awal dan ukuran.
+            if not self.operation_depth:
+                arguments = dict(defaults)
+                arguments.update(zip(names, args))
+                arguments.update(kwargs)
+                self.notify_operation(operation, arguments, result)
+            return result
 
-        Args:
-            start (int): Alamat awal blok memori dalam MB
-            size (int): Ukuran blok memori dalam MB
-            is_free (bool, optional): Status ketersediaan blok. Defaults to True.
-            process (Process, optional): Proses yang menggunakan blok. Defaults to None.
-            partition_id (int, optional): ID partisi. Defaults to None.
+        return wrapper
 
-        Raises:
-            ValueError: Jika start atau size bernilai negatif
-        """
-        self.start = start
-        self.size = size
-        self.is_free = is_free
-        self.process = process
-        self.end = start + size - 1
-        self.partition_id = partition_id
+    return decorator
 
 
 class MemoryManager:
@@ -60,20 +95,46 @@ class MemoryManager:
     - First Fit: Mengalokasikan ke blok pertama yang cukup besar
     - Best Fit: Mengalokasikan ke blok terkecil yang cukup besar
     - Worst Fit: Mengalokasikan ke blok terbesar yang tersedia
+    - Next Fit: Melanjutkan pencarian dari posisi akhir alokasi sebelumnya
+
+    Selain mode partisi variabel bawaan, alokasi juga dapat dialihkan ke mesin
+    alokasi lain yang terdaftar di ALLOCATION_ENGINES (misalnya "Buddy",
+    "TLSF", tabel blok "Compact", atau bitmap halaman "Bitmap") melalui
+    set_allocation_mode.
 
     Attributes:
         total_memory (int): Total ukuran memori dalam MB
+        used_memory (int): Total ukuran blok terpakai dalam MB
         memory_blocks (list): Daftar blok memori dalam sistem
         processes (dict): Dictionary proses yang sedang berjalan (key: nama proses)
+        process_blocks (dict): Blok memori yang ditempati setiap proses (key: nama proses)
         block_callbacks (list): Daftar callback untuk perubahan blok memori
+        event_callbacks (list): Daftar callback untuk event perubahan blok memori
+        operation_callbacks (list): Daftar callback untuk operasi yang dipanggil
+        operation_depth (int): Kedalaman operasi tercatat yang sedang berjalan
         process_callbacks (list): Daftar callback untuk perubahan proses
         timer_running (bool): Status timer proses
+        use_timer (bool): Status apakah timer waktu nyata dijalankan otomatis
+        scheduler (ExpiryScheduler): Penjadwal berakhirnya proses (None jika belum dimulai)
         partitioned (bool): Status apakah memori dipartisi
         partitions (list): Daftar persentase partisi
         time_update_callbacks (list): Daftar callback untuk update waktu
+        free_index (FreeBlockIndex): Indeks blok kosong terurut berdasarkan ukuran
+        next_fit_position (int): Alamat akhir alokasi Next Fit terakhir dalam MB
+        allocation_mode (str): Mode alokasi aktif ("Variable" atau nama mesin)
+        engine: Mesin alokasi aktif, atau None untuk mode partisi variabel
+        slab_cache (SlabCache): Lapisan cache slab opsional, atau None jika tidak aktif
+        compactor (Compactor): Pemadat memori untuk mode partisi variabel
+        compaction_threshold (int): Biaya pemadatan maksimum dalam MB saat alokasi
+                                  gagal (None jika pemadatan otomatis tidak aktif)
+        last_compaction (dict): Hasil pemadatan otomatis pada alokasi terakhir
+                              beserta size yang dibutuhkan (None jika alokasi
+                              terakhir tidak memadatkan memori)
+        batch_depth (int): Kedalaman batch yang sedang berjalan (0 jika tidak ada)
+        batch_changed (bool): Status apakah blok memori berubah selama batch
     """
 
-    def __init__(self, total_memory=1024):
+    def __init__(self, total_memory=1024, use_timer=True):
         """
         Inisialisasi objek MemoryManager baru.
 
@@ -82,19 +143,154 @@ class MemoryManager:
 
         Args:
             total_memory (int, optional): Total ukuran memori dalam MB. Defaults to 1024.
+            use_timer (bool, optional): Menjalankan timer waktu nyata saat proses
+                                      dialokasikan. Simulasi headless yang mengatur
+                                      waktunya sendiri menggunakan False.
+                                      Defaults to True.
 
         Raises:
             ValueError: Jika total_memory bernilai negatif atau nol
         """
         self.total_memory = total_memory
+        self.used_memory = 0
+        self.allocation_mode = "Variable"
+        self.engine = None
         self.memory_blocks = [MemoryBlock(0, total_memory)]
         self.processes = {}
+        self.process_blocks = {}
         self.block_callbacks = []
+        self.event_callbacks = []
+        self.operation_callbacks = []
+        self.operation_depth = 0
         self.process_callbacks = []
         self.timer_running = False
+        self.use_timer = use_timer
+        self.scheduler = None
         self.partitioned = False
         self.partitions = []
         self.time_update_callbacks = []
+        self.free_index = FreeBlockIndex(self.memory_blocks)
+        self.next_fit_position = 0
+        self.slab_cache = None
+        self.compactor = Compactor(self)
+        self.compaction_threshold = None
+        self.last_compaction = None
+        self.batch_depth = 0
+        self.batch_changed = False
+
+    @property
+    def memory_blocks(self):
+        """
+        Daftar blok memori terurut berdasarkan alamat.
+
+        Dalam mode partisi variabel, daftar ini adalah daftar blok milik
+        MemoryManager sendiri. Jika mesin alokasi lain aktif, daftar blok
+        dibangun oleh mesin tersebut hanya ketika dibutuhkan.
+
+        Returns:
+            list[MemoryBlock]: Daftar blok memori
+        """
+        if self.engine is not None:
+            return self.engine.get_blocks()
+        return self._memory_blocks
+
+    @memory_blocks.setter
+    def memory_blocks(self, blocks):
+        self._memory_blocks = blocks
+
+    @recorded_operation("mode")
+    def set_allocation_mode(self, mode):
+        """
+        Mengganti mode alokasi memori.
+
+        Method ini mengganti mesin alokasi yang digunakan oleh allocate_process
+        dan deallocate_process. Mode "Variable" menggunakan partisi variabel
+        bawaan, sedangkan mode lain diambil dari ALLOCATION_ENGINES. Semua
+        proses yang sedang berjalan dan partisi akan dihapus.
+
+        Mesin alokasi harus menyediakan atribut name, total_memory,
+        supports_algorithms, dan supports_partitions serta method
+        reset(total_memory), allocate(process, algorithm), free(process_name),
+        rename(process_name, new_name), dan get_blocks(). Mesin yang mendukung
+        partisi juga harus menerima daftar blok partisi awal pada reset dan
+        menyediakan get_partition().
+
+        Args:
+            mode (str): Nama mode alokasi, misalnya "Variable" atau "Buddy"
+
+        Returns:
+            bool: True jika berhasil mengganti mode, False jika mode tidak dikenal
+        """
+        if mode != "Variable" and mode not in ALLOCATION_ENGINES:
+            return False
+
+        for process_name in list(self.processes.keys()):
+            self.notify_process_expired(process_name)
+        self.reset_processes()
+
+        self.allocation_mode = mode
+        self.engine = (
+            ALLOCATION_ENGINES[mode](self.total_memory) if mode != "Variable" else None
+        )
+        self.partitioned = False
+        self.partitions = []
+        self.clear_all()
+        return True
+
+    def enable_slab_cache(self, size_classes, objects_per_slab=8):
+        """
+        Mengaktifkan lapisan cache slab untuk ukuran proses tertentu.
+
+        Proses yang ukurannya sama dengan salah satu kelas ukuran akan
+        dialokasikan ke slot slab, sedangkan proses lain tetap dialokasikan
+        seperti biasa. Memberikan daftar kelas ukuran kosong akan menonaktifkan
+        cache slab.
+
+        Args:
+            size_classes (list): Daftar ukuran proses dalam MB yang akan di-cache
+            objects_per_slab (int, optional): Jumlah slot dalam setiap slab.
+                                            Defaults to 8.
+
+        Returns:
+            bool: True jika berhasil, False jika masih ada proses dalam cache lama
+        """
+        if self.slab_cache is not None and self.slab_cache.allocations:
+            return False
+
+        self.slab_cache = (
+            SlabCache(self, size_classes, objects_per_slab) if size_classes else None
+        )
+        return True
+
+    def enable_compaction(self, max_cost):
+        """
+        Mengaktifkan pemadatan otomatis saat alokasi gagal.
+
+        Jika tidak ada blok kosong yang cukup besar untuk sebuah proses dalam
+        mode partisi variabel, allocate_process mencari rencana pemadatan
+        Minimal termurah. Rencana hanya dijalankan jika total ukuran blok yang
+        harus dipindahkan tidak melebihi max_cost, lalu alokasi diulang.
+
+        Args:
+            max_cost (int): Biaya pemadatan maksimum dalam MB. None menonaktifkan
+                          pemadatan otomatis.
+        """
+        self.compaction_threshold = max_cost
+
+    def reset_processes(self):
+        """
+        Menghapus semua proses beserta jadwal dan slot cache-nya.
+
+        Method ini hanya mengosongkan catatan proses. Blok memori harus
+        dikosongkan atau dibangun ulang oleh pemanggil.
+        """
+        self.processes = {}
+        self.process_blocks = {}
+        self.used_memory = 0
+        if self.slab_cache is not None:
+            self.slab_cache.reset()
+        if self.scheduler is not None:
+            self.scheduler.clear()
 
     def register_callback(self, callback):
         """
@@ -102,7 +298,8 @@ class MemoryManager:
 
         Callback akan dipanggil setiap kali ada perubahan pada blok memori,
         seperti alokasi atau dealokasi. Callback menerima parameter berupa
-        daftar blok memori terbaru.
+        daftar blok memori terbaru. Untuk perubahan per rentang alamat, gunakan
+        register_event_callback.
 
         Args:
             callback (function): Fungsi yang akan dipanggil saat blok memori berubah.
@@ -110,6 +307,38 @@ class MemoryManager:
         """
         self.block_callbacks.append(callback)
 
+    def register_event_callback(self, callback):
+        """
+        Mendaftarkan callback untuk event perubahan blok memori.
+
+        Berbeda dengan register_callback yang selalu menerima seluruh daftar
+        blok, callback ini menerima satu objek event (lihat memory_events)
+        untuk setiap perubahan, misalnya BlockSplit, BlockAllocated, BlockFreed,
+        atau BlockMerged, beserta rentang alamat yang terpengaruh. Event dikirim
+        langsung saat perubahan terjadi, termasuk di dalam batch. Mesin alokasi
+        lain hanya mengirim BlockAllocated dan BlockFreed, karena pembelahan dan
+        penggabungan blok terjadi di dalam mesin tersebut.
+
+        Args:
+            callback (function): Fungsi yang akan dipanggil dengan objek event
+        """
+        self.event_callbacks.append(callback)
+
+    def register_operation_callback(self, callback):
+        """
+        Mendaftarkan callback untuk operasi yang dipanggil pada MemoryManager.
+
+        Callback dipanggil setelah setiap operasi terluar selesai dengan tiga
+        argumen: nama operasi ("allocate", "free", "expire", "resize",
+        "partition", "mode", atau "clear"), dictionary argumen operasi
+        (termasuk nilai default), dan hasil operasi. Callback ini dipakai
+        misalnya oleh TraceRecorder untuk merekam sesi.
+
+        Args:
+            callback (function): Fungsi yang akan dipanggil setelah setiap operasi
+        """
+        self.operation_callbacks.append(callback)
+
     def register_process_callback(self, callback):
         """
         Mendaftarkan callback untuk perubahan proses.
@@ -135,6 +364,9 @@ class MemoryManager:
                                Fungsi harus menerima parameter dict (proses)
         """
         self.time_update_callbacks.append(callback)
+        if self.scheduler is not None:
+            self.scheduler.on_tick = self.notify_time_update
+            self.scheduler.wake()
 
     def notify_callbacks(self):
         """
@@ -142,10 +374,59 @@ class MemoryManager:
 
         Method ini dipanggil setiap kali ada perubahan pada blok memori.
         Semua callback terdaftar akan dipanggil dengan daftar blok memori terbaru.
+        Selama batch berjalan, pemberitahuan ditunda hingga batch selesai.
         """
+        if self.batch_depth:
+            self.batch_changed = True
+            return
         for callback in self.block_callbacks:
             callback(self.memory_blocks)
 
+    def emit_event(self, event):
+        """
+        Mengirim event perubahan blok memori ke semua callback event.
+
+        Args:
+            event (MemoryEvent): Event yang terjadi
+        """
+        for callback in self.event_callbacks:
+            callback(event)
+
+    def notify_operation(self, operation, arguments, result):
+        """
+        Memberitahu semua callback operasi tentang operasi yang selesai.
+
+        Args:
+            operation (str): Nama operasi
+            arguments (dict): Argumen operasi (key: nama parameter)
+            result: Hasil operasi
+        """
+        for callback in self.operation_callbacks:
+            callback(operation, arguments, result)
+
+    @contextmanager
+    def batch(self):
+        """
+        Menjalankan sekumpulan perubahan dengan satu pemberitahuan di akhir.
+
+        Selama blok with berjalan, callback blok memori tidak dipanggil. Jika
+        ada perubahan, callback dipanggil sekali ketika batch terluar selesai,
+        termasuk ketika batch berakhir karena exception. Batch boleh bersarang.
+
+        Contoh:
+            with memory_manager.batch():
+                memory_manager.allocate_process(process_a)
+                memory_manager.deallocate_process("B")
+        """
+        self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.batch_depth -= 1
+            if not self.batch_depth and self.batch_changed:
+                self.batch_changed = False
+                self.notify_callbacks()
+
     def notify_process_expired(self, process_name):
         """
         Memberitahu semua callback proses tentang proses yang telah selesai.
@@ -169,6 +450,7 @@ class MemoryManager:
         for callback in self.time_update_callbacks:
             callback(self.processes)
 
+    @recorded_operation("resize")
     def resize_memory(self, new_size):
         """
         Mengubah ukuran total memori.
@@ -176,7 +458,8 @@ class MemoryManager:
         Method ini mengubah ukuran total memori sistem. Jika ukuran baru lebih kecil
         dari ukuran saat ini, method akan gagal jika ada proses yang menggunakan
         memori lebih dari ukuran baru. Jika memori dipartisi, semua partisi akan
-        dihapus dan dibuat ulang.
+        dihapus dan dibuat ulang. Jika mesin alokasi lain aktif, memori akan
+        dikosongkan dan dibangun ulang dengan ukuran baru.
 
         Args:
             new_size (int): Ukuran memori baru dalam MB
@@ -187,14 +470,26 @@ class MemoryManager:
         Raises:
             ValueError: Jika new_size bernilai negatif atau nol
         """
-        if new_size < self.total_memory:
-            used_memory = sum(
-                block.size for block in self.memory_blocks if not block.is_free
-            )
-            if used_memory > new_size:
-                return False
+        if self.engine is not None:
+            for process_name in list(self.processes.keys()):
+                self.notify_process_expired(process_name)
+            self.reset_processes()
+            old_size = self.total_memory
+            self.total_memory = new_size
+            if self.partitioned:
+                self.create_partitions(self.partitions)
+            else:
+                self.engine.reset(new_size)
+            self.emit_event(Resized(old_size, new_size))
+            self.notify_callbacks()
+            return True
+
+        if new_size < self.total_memory and self.used_memory > new_size:
+            return False
 
+        old_size = self.total_memory
         self.total_memory = new_size
+        next_fit_position = self.next_fit_position
 
         if self.partitioned:
             self.clear_all()
@@ -222,9 +517,16 @@ class MemoryManager:
                         MemoryBlock(last_end, new_size - last_end)
                     )
 
+            self.free_index.rebuild(self.memory_blocks)
+
+        self.next_fit_position = (
+            next_fit_position if next_fit_position < new_size else 0
+        )
+        self.emit_event(Resized(old_size, new_size))
         self.notify_callbacks()
         return True
 
+    @recorded_operation("partition")
     def create_partitions(self, partition_percentages):
         """
         Membuat partisi memori berdasarkan persentase.
@@ -232,7 +534,8 @@ class MemoryManager:
         Method ini membagi memori menjadi beberapa partisi berdasarkan persentase
         yang diberikan. Setiap partisi akan memiliki ID unik dan ukuran sesuai
         dengan persentasenya. Semua proses yang sedang berjalan akan dihapus
-        ketika partisi dibuat.
+        ketika partisi dibuat. Partisi hanya tersedia dalam mode partisi variabel
+        dan mesin alokasi yang mendukungnya.
 
         Args:
             partition_percentages (list): Daftar persentase untuk setiap partisi.
@@ -244,9 +547,22 @@ class MemoryManager:
         Raises:
             ValueError: Jika partition_percentages kosong atau berisi nilai negatif
         """
+        if self.engine is not None and not self.engine.supports_partitions:
+            return not partition_percentages
+
+        self.next_fit_position = 0
+
         if not partition_percentages:
             self.partitioned = False
-            self.memory_blocks = [MemoryBlock(0, self.total_memory)]
+            for process_name in list(self.processes.keys()):
+                self.notify_process_expired(process_name)
+            self.reset_processes()
+            if self.engine is not None:
+                self.engine.reset(self.total_memory)
+            else:
+                self.memory_blocks = [MemoryBlock(0, self.total_memory)]
+                self.free_index.rebuild(self.memory_blocks)
+            self.emit_event(PartitionsRebuilt(0, self.total_memory, []))
             self.notify_callbacks()
             return True
 
@@ -256,8 +572,8 @@ class MemoryManager:
         for process_name in list(self.processes.keys()):
             self.notify_process_expired(process_name)
 
-        self.processes = {}
-        self.memory_blocks = []
+        self.reset_processes()
+        blocks = []
 
         start_pos = 0
         for i, percentage in enumerate(partition_percentages):
@@ -269,12 +585,62 @@ class MemoryManager:
                 size = self.total_memory - start_pos
 
             new_block = MemoryBlock(start_pos, size, is_free=True, partition_id=i)
-            self.memory_blocks.append(new_block)
+            blocks.append(new_block)
             start_pos += size
 
+        if self.engine is not None:
+            self.engine.reset(self.total_memory, blocks)
+        else:
+            self.memory_blocks = blocks
+            self.free_index.rebuild(self.memory_blocks)
+        self.emit_event(
+            PartitionsRebuilt(
+                0,
+                self.total_memory,
+                [(block.start, block.size, block.partition_id) for block in blocks],
+            )
+        )
         self.notify_callbacks()
         return True
 
+    def stats(self):
+        """
+        Mendapatkan statistik penggunaan memori saat ini.
+
+        Dalam mode partisi variabel, semua nilai dibaca dari penghitung yang
+        diperbarui pada setiap pembelahan, penggabungan, dan dealokasi, sehingga
+        tidak memerlukan pemindaian blok. Mesin alokasi lain menyimpan
+        penghitung yang sama dalam atribut free_sizes-nya.
+
+        Returns:
+            dict: Statistik memori berisi total_memory, used_memory, free_memory,
+                 free_blocks, largest_free_block, fragmentation (dalam persen),
+                 dan free_histogram (jumlah blok kosong per kelas ukuran, key:
+                 batas bawah kelas ukuran pangkat dua dalam MB)
+        """
+        free_sizes = self.free_index if self.engine is None else self.engine.free_sizes
+        free_blocks = len(free_sizes)
+        free_size = free_sizes.total_size
+        largest_free_block = free_sizes.largest_size()
+        histogram = free_sizes.histogram
+
+        fragmentation = 0
+        if free_blocks and free_size > 0:
+            fragmentation = (free_blocks - 1) / free_blocks * 100
+
+        return {
+            "total_memory": self.total_memory,
+            "used_memory": self.used_memory,
+            "free_memory": self.total_memory - self.used_memory,
+            "free_blocks": free_blocks,
+            "largest_free_block": largest_free_block,
+            "fragmentation": fragmentation,
+            "free_histogram": {
+                (1 << (bucket - 1) if bucket else 0): count
+                for bucket, count in sorted(histogram.items())
+            },
+        }
+
     def get_free_blocks(self):
         """
         Mendapatkan daftar blok memori yang tersedia.
@@ -296,8 +662,14 @@ class MemoryManager:
         menjadi satu blok yang lebih besar. Ini membantu mengurangi fragmentasi
         memori. Jika memori dipartisi, penggabungan hanya dilakukan dalam partisi
         yang sama.
+
+        Dealokasi biasa sudah menggabungkan blok dengan tetangganya melalui
+        coalesce_block, sehingga method ini hanya diperlukan sebagai pemeliharaan
+        eksplisit, misalnya setelah daftar blok diubah secara manual. Mesin
+        alokasi lain menggabungkan bloknya sendiri saat dealokasi, sehingga
+        method ini tidak melakukan apa pun untuknya.
         """
-        if not self.memory_blocks:
+        if self.engine is not None or not self.memory_blocks:
             return
 
         if self.partitioned:
@@ -348,18 +720,64 @@ class MemoryManager:
             merged_blocks.append(current_block)
             self.memory_blocks = merged_blocks
 
+        self.free_index.rebuild(self.memory_blocks)
+        self.emit_event(LayoutChanged(0, self.total_memory))
+
+    @recorded_operation("compact")
+    def compact(self, mode="Full", size=None, budget=None, max_cost=None):
+        """
+        Memadatkan memori untuk menyatukan blok-blok kosong.
+
+        Pemadatan hanya tersedia dalam mode partisi variabel. Mesin alokasi lain
+        menempatkan bloknya sendiri, sehingga tidak ada blok yang dipindahkan.
+
+        Args:
+            mode (str, optional): Mode pemadatan. Defaults to "Full".
+                                Pilihan: "Full", "Minimal", "Incremental"
+            size (int, optional): Ukuran blok kosong yang dibutuhkan dalam MB
+                                untuk mode Minimal. Defaults to None.
+            budget (int, optional): Ukuran maksimum yang dipindahkan dalam MB
+                                  untuk mode Incremental. Defaults to None.
+            max_cost (int, optional): Biaya maksimum rencana Minimal dalam MB.
+                                    Defaults to None (tanpa batas).
+
+        Returns:
+            dict: Hasil pemadatan berisi mode, moved (dalam MB), moved_blocks,
+                 seconds, dan complete
+
+        Raises:
+            ValueError: Jika mode tidak valid atau size/budget tidak diberikan
+        """
+        return self.compactor.compact(mode, size, budget, max_cost)
+
+    @recorded_operation("allocate")
     def allocate_process(self, process, algorithm="First Fit"):
         """
         Mengalokasikan proses ke memori menggunakan algoritma tertentu.
 
         Method ini mencoba mengalokasikan memori untuk proses menggunakan algoritma
-        yang dipilih. Jika proses dengan nama yang sama sudah ada, proses tersebut
-        akan dihapus terlebih dahulu.
+        yang dipilih. Jika proses dengan nama yang sama sudah ada, proses baru
+        dicarikan tempat tanpa memakai blok proses lama, dan proses lama baru
+        dihapus setelah proses baru berhasil dialokasikan. Jika alokasi gagal,
+        proses lama tetap berjalan di bloknya semula. Jika cache slab aktif dan
+        ukuran proses termasuk salah satu kelas ukurannya, proses dialokasikan ke
+        slot slab.
+        Jika mesin alokasi lain aktif, algoritma diabaikan dan penempatan
+        ditentukan oleh mesin tersebut.
+
+        Jika pemadatan otomatis aktif (lihat enable_compaction) dan tidak ada
+        blok kosong yang cukup besar, memori dipadatkan seperlunya lalu alokasi
+        diulang. Nilai kembalian tetap berupa bool; biaya pemadatan tersebut
+        hanya dilaporkan melalui last_compaction, yang berisi hasil pemadatan
+        (termasuk ukuran yang dipindahkan) dan ukuran yang dibutuhkan. Atribut
+        ini diatur ulang pada setiap pemanggilan allocate_process, sehingga
+        harus dibaca segera setelah alokasi.
 
         Args:
             process (Process): Proses yang akan dialokasikan
             algorithm (str, optional): Algoritma alokasi. Defaults to "First Fit".
-                                    Pilihan: "First Fit", "Best Fit", "Worst Fit"
+                                    Pilihan: "First Fit", "Best Fit", "Worst Fit",
+                                    "Next Fit"
 
         Returns:
             bool: True jika berhasil mengalokasikan, False jika gagal
@@ -368,21 +786,289 @@ class MemoryManager:
             ValueError: Jika algorithm tidak valid
         """
         process.algorithm = algorithm
+        self.last_compaction = None
+        previous = self.detach_process(process.name)
+        allocated = self.place_process(process, algorithm)
+        if previous is not None:
+            if allocated:
+                self.release_detached(previous)
+            else:
+                self.attach_process(previous)
+        return allocated
+
+    def place_process(self, process, algorithm):
+        """
+        Mencarikan tempat untuk proses baru sesuai mode alokasi yang aktif.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+            algorithm (str): Algoritma alokasi
+
+        Returns:
+            bool: True jika berhasil mengalokasikan, False jika gagal
+        """
+        if self.slab_cache is not None and self.slab_cache.handles(process):
+            return self.allocate_cached(process, algorithm)
+
+        if self.engine is not None:
+            return self.allocate_with_engine(process, algorithm)
+
+        if self.allocate_with_algorithm(process, algorithm):
+            return True
+        if self.compaction_threshold is None:
+            return False
+        return self.allocate_after_compaction(process, algorithm)
+
+    def detach_process(self, process_name):
+        """
+        Melepas proses dari namanya tanpa mengosongkan bloknya.
+
+        Blok proses tetap terpakai, tetapi disimpan dengan objek prosesnya
+        sebagai kunci, sehingga proses baru dengan nama yang sama dapat
+        dicarikan tempat terlebih dahulu. Blok tersebut kemudian dikosongkan
+        dengan release_detached atau dikembalikan dengan attach_process.
+
+        Args:
+            process_name (str): Nama proses
+
+        Returns:
+            Process: Proses yang dilepas, atau None jika nama belum dipakai
+        """
+        process = self.processes.pop(process_name, None)
+        if process is None:
+            return None
+        if self.scheduler is not None:
+            self.scheduler.remove(process_name)
+        self.rename_process_block(process_name, process)
+        return process
+
+    def attach_process(self, process):
+        """
+        Mengembalikan proses yang dilepas ke namanya dan bloknya semula.
+
+        Args:
+            process (Process): Proses dari detach_process
+        """
+        self.rename_process_block(process, process.name)
+        self.processes[process.name] = process
+        if self.use_timer:
+            self.schedule_expiry(process)
+
+    def release_detached(self, process):
+        """
+        Mengosongkan blok proses yang dilepas.
+
+        Args:
+            process (Process): Proses dari detach_process
+        """
+        if self.slab_cache is not None and process in self.slab_cache.allocations:
+            self.slab_cache.free(process)
+            self.notify_callbacks()
+        else:
+            self.release_block(process.name, process)
+
+    def rename_process_block(self, key, new_key):
+        """
+        Mengganti kunci blok proses di peta blok, mesin alokasi, atau cache slab.
+
+        Args:
+            key: Kunci blok saat ini
+            new_key: Kunci baru untuk blok tersebut
+        """
+        if self.slab_cache is not None and key in self.slab_cache.allocations:
+            allocations = self.slab_cache.allocations
+            allocations[new_key] = allocations.pop(key)
+            return
+        if self.engine is not None:
+            self.engine.rename(key, new_key)
+        self.process_blocks[new_key] = self.process_blocks.pop(key)
+
+    def allocate_with_algorithm(self, process, algorithm):
+        """
+        Mengalokasikan proses dalam mode partisi variabel dengan algoritma fit.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+            algorithm (str): Algoritma alokasi
+
+        Returns:
+            bool: True jika berhasil mengalokasikan, False jika gagal atau
+                 algoritma tidak dikenal
+        """
         if algorithm == "First Fit":
             return self.first_fit(process)
         elif algorithm == "Best Fit":
             return self.best_fit(process)
         elif algorithm == "Worst Fit":
             return self.worst_fit(process)
+        elif algorithm == "Next Fit":
+            return self.next_fit(process)
         return False
 
+    def allocate_after_compaction(self, process, algorithm):
+        """
+        Memadatkan memori seperlunya lalu mengulang alokasi yang gagal.
+
+        Pemadatan hanya dilakukan jika ruang kosong dalam satu partisi cukup
+        untuk proses dan rencana pemadatan Minimal termurah tidak melebihi
+        compaction_threshold. Jika pemadatan dijalankan, hasilnya beserta
+        ukuran proses disimpan di last_compaction.
+
+        Args:
+            process (Process): Proses yang gagal dialokasikan
+            algorithm (str): Algoritma alokasi
+
+        Returns:
+            bool: True jika berhasil mengalokasikan setelah pemadatan, False jika
+                 pemadatan terlalu mahal atau tidak mungkin
+        """
+        result = self.compactor.compact(
+            "Minimal", size=process.size, max_cost=self.compaction_threshold
+        )
+        if not result["complete"]:
+            return False
+        self.last_compaction = dict(result, size=process.size)
+        return self.allocate_with_algorithm(process, algorithm)
+
+    def allocate_many(self, processes, algorithm="First Fit"):
+        """
+        Mengalokasikan sekumpulan proses dengan satu pemberitahuan perubahan.
+
+        Proses dialokasikan berurutan seperti allocate_process di dalam satu
+        batch, sehingga callback blok memori hanya dipanggil sekali.
+
+        Args:
+            processes (iterable): Proses yang akan dialokasikan, atau pasangan
+                                (proses, algoritma) untuk algoritma per proses
+            algorithm (str, optional): Algoritma alokasi untuk proses tanpa
+                                     algoritma sendiri. Defaults to "First Fit".
+
+        Returns:
+            list[bool]: Hasil alokasi untuk setiap proses sesuai urutan masukan
+        """
+        results = []
+        with self.batch():
+            for item in processes:
+                if isinstance(item, tuple):
+                    results.append(self.allocate_process(*item))
+                else:
+                    results.append(self.allocate_process(item, algorithm))
+        return results
+
+    def deallocate_many(self, process_names):
+        """
+        Dealokasi sekumpulan proses dengan satu pemberitahuan perubahan.
+
+        Args:
+            process_names (iterable): Nama proses yang akan dealokasi
+
+        Returns:
+            list[bool]: Hasil dealokasi untuk setiap proses sesuai urutan masukan
+        """
+        with self.batch():
+            return [self.deallocate_process(name) for name in process_names]
+
+    def allocate_cached(self, process, algorithm):
+        """
+        Mengalokasikan proses melalui cache slab.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+            algorithm (str): Algoritma untuk mengambil slab baru jika diperlukan
+
+        Returns:
+            bool: True jika berhasil mengalokasikan, False jika gagal
+        """
+        if not self.slab_cache.allocate(process, algorithm):
+            return False
+
+        self.processes[process.name] = process
+
+        if self.use_timer:
+            self.schedule_expiry(process)
+
+        self.notify_callbacks()
+        return True
+
+    def allocate_slab(self, slab_process, algorithm):
+        """
+        Mengambil blok memori untuk slab baru milik cache slab.
+
+        Blok slab ditempatkan seperti blok proses biasa dan dicatat di
+        process_blocks, tetapi proses semu slab tidak dicatat sebagai proses
+        aktif. Dengan demikian slab tidak terhitung sebagai proses, tidak
+        berakhir karena timer, dan tidak dapat dibebaskan melalui
+        deallocate_process, melainkan hanya melalui free_slab.
+
+        Args:
+            slab_process (Process): Proses semu slab
+            algorithm (str): Algoritma alokasi
+
+        Returns:
+            bool: True jika berhasil mengalokasikan, False jika gagal
+        """
+        if not self.allocate_process(slab_process, algorithm):
+            return False
+        del self.processes[slab_process.name]
+        if self.scheduler is not None:
+            self.scheduler.remove(slab_process.name)
+        return True
+
+    def free_slab(self, slab_name):
+        """
+        Mengembalikan blok slab yang sudah kosong ke ruang kosong umum.
+
+        Args:
+            slab_name (str): Nama proses semu slab
+
+        Returns:
+            bool: True jika berhasil, False jika blok slab tidak ditemukan
+        """
+        return self.release_block(slab_name)
+
+    def allocate_with_engine(self, process, algorithm):
+        """
+        Mengalokasikan proses menggunakan mesin alokasi yang aktif.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+            algorithm (str): Algoritma alokasi, hanya digunakan oleh mesin yang
+                           mendukung pemilihan algoritma
+
+        Returns:
+            bool: True jika berhasil mengalokasikan, False jika gagal
+        """
+        if not self.engine.supports_algorithms:
+            process.algorithm = self.engine.name
+        block = self.engine.allocate(process, algorithm)
+        if block is None:
+            return False
+
+        self.processes[process.name] = process
+        self.process_blocks[process.name] = block
+        self.used_memory += block.size
+        if self.event_callbacks:
+            self.emit_event(
+                BlockAllocated(
+                    block.start, block.size, process.name, block.partition_id
+                )
+            )
+
+        if self.use_timer:
+            self.schedule_expiry(process)
+
+        self.notify_callbacks()
+        return True
+
     def first_fit(self, process):
         """
         Mengalokasikan proses menggunakan algoritma First Fit.
 
         Algoritma First Fit mencari blok memori kosong pertama yang cukup besar
         untuk menampung proses. Ini adalah algoritma yang paling sederhana dan
-        cepat, tetapi mungkin tidak optimal dalam penggunaan memori.
+        cepat, tetapi mungkin tidak optimal dalam penggunaan memori. Pencarian
+        dilakukan melalui pohon alamat blok kosong sehingga blok-blok terpakai
+        di alamat rendah tidak perlu diperiksa satu per satu.
 
         Args:
             process (Process): Proses yang akan dialokasikan
@@ -390,9 +1076,9 @@ class MemoryManager:
         Returns:
             bool: True jika berhasil mengalokasikan, False jika gagal
         """
-        for i, block in enumerate(self.memory_blocks):
-            if block.is_free and block.size >= process.size:
-                return self.allocate_block(i, process)
+        block = self.free_index.first_fit(process.size)
+        if block is not None:
+            return self.allocate_block(self.get_block_index(block), process)
         return False
 
     def best_fit(self, process):
@@ -400,8 +1086,9 @@ class MemoryManager:
         Mengalokasikan proses menggunakan algoritma Best Fit.
 
         Algoritma Best Fit mencari blok memori kosong terkecil yang cukup besar
-        untuk menampung proses. Ini membantu mengurangi fragmentasi memori, tetapi
-        mungkin membutuhkan waktu pencarian lebih lama.
+        untuk menampung proses. Ini membantu mengurangi fragmentasi memori.
+        Pencarian dilakukan melalui indeks blok kosong sehingga hanya
+        membutuhkan waktu O(log n).
 
         Args:
             process (Process): Proses yang akan dialokasikan
@@ -409,17 +1096,9 @@ class MemoryManager:
         Returns:
             bool: True jika berhasil mengalokasikan, False jika gagal
         """
-        best_block_index = -1
-        best_block_size = float("inf")
-
-        for i, block in enumerate(self.memory_blocks):
-            if block.is_free and block.size >= process.size:
-                if block.size < best_block_size:
-                    best_block_index = i
-                    best_block_size = block.size
-
-        if best_block_index != -1:
-            return self.allocate_block(best_block_index, process)
+        block = self.free_index.best_fit(process.size)
+        if block is not None:
+            return self.allocate_block(self.get_block_index(block), process)
         return False
 
     def worst_fit(self, process):
@@ -428,7 +1107,8 @@ class MemoryManager:
 
         Algoritma Worst Fit mencari blok memori kosong terbesar yang tersedia.
         Ini membantu mengurangi fragmentasi dengan memanfaatkan blok besar terlebih
-        dahulu, tetapi mungkin tidak optimal untuk proses kecil.
+        dahulu, tetapi mungkin tidak optimal untuk proses kecil. Blok terbesar
+        dibaca langsung dari ujung indeks blok kosong.
 
         Args:
             process (Process): Proses yang akan dialokasikan
@@ -436,26 +1116,94 @@ class MemoryManager:
         Returns:
             bool: True jika berhasil mengalokasikan, False jika gagal
         """
-        worst_block_index = -1
-        worst_block_size = -1
+        block = self.free_index.worst_fit(process.size)
+        if block is not None:
+            return self.allocate_block(self.get_block_index(block), process)
+        return False
+
+    def next_fit(self, process):
+        """
+        Mengalokasikan proses menggunakan algoritma Next Fit.
 
-        for i, block in enumerate(self.memory_blocks):
-            if block.is_free and block.size >= process.size:
-                if block.size > worst_block_size:
-                    worst_block_index = i
-                    worst_block_size = block.size
+        Algoritma Next Fit bekerja seperti First Fit, tetapi pencarian dimulai
+        dari blok yang memuat posisi akhir alokasi Next Fit sebelumnya. Jika
+        tidak ada blok yang cukup besar hingga akhir memori, pencarian diulang
+        dari alamat 0. Cara ini menyebarkan alokasi ke seluruh ruang alamat
+        sehingga blok-blok kecil tidak menumpuk di alamat rendah.
 
-        if worst_block_index != -1:
-            return self.allocate_block(worst_block_index, process)
-        return False
+        Posisi pencarian disimpan sebagai alamat, sehingga tetap berlaku setelah
+        blok kosong digabungkan atau ukuran memori diubah.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+
+        Returns:
+            bool: True jika berhasil mengalokasikan, False jika gagal
+        """
+        position = self.next_fit_position
+        block = None
+
+        index = bisect.bisect_right(
+            self.memory_blocks, position, key=attrgetter("start")
+        )
+        if index > 0:
+            current = self.memory_blocks[index - 1]
+            if (
+                current.is_free
+                and current.end >= position
+                and current.size >= process.size
+            ):
+                block = current
+
+        if block is None:
+            block = self.free_index.first_fit(process.size, position)
+        if block is None:
+            block = self.free_index.first_fit(process.size)
+        if block is None:
+            return False
+
+        self.next_fit_position = block.start + process.size
+        return self.allocate_block(self.get_block_index(block), process)
+
+    def get_block_index(self, block):
+        """
+        Mendapatkan indeks blok dalam daftar blok memori.
+
+        Daftar blok memori selalu terurut berdasarkan alamat awal, sehingga
+        indeks dapat dicari dengan pencarian biner.
+
+        Args:
+            block (MemoryBlock): Blok memori yang dicari
+
+        Returns:
+            int: Indeks blok dalam memory_blocks
+        """
+        return bisect.bisect_left(
+            self.memory_blocks, block.start, key=attrgetter("start")
+        )
+
+    def get_process_address(self, process_name):
+        """
+        Mendapatkan alamat awal memori yang ditempati proses.
+
+        Args:
+            process_name (str): Nama proses yang dicari
+
+        Returns:
+            int: Alamat awal dalam MB, atau None jika proses tidak ditemukan
+        """
+        if self.slab_cache is not None and process_name in self.slab_cache.allocations:
+            return self.slab_cache.get_address(process_name)
+        block = self.process_blocks.get(process_name)
+        return block.start if block is not None else None
 
     def get_process_partition(self, process_name):
         """
         Mendapatkan ID partisi dari proses.
 
-        Method ini mencari partisi yang digunakan oleh proses dengan nama tertentu.
-        Jika proses tidak ditemukan atau memori tidak dipartisi, method akan
-        mengembalikan None.
+        Method ini mencari partisi yang digunakan oleh proses dengan nama tertentu
+        melalui peta blok proses. Jika proses tidak ditemukan atau memori tidak
+        dipartisi, method akan mengembalikan None.
 
         Args:
             process_name (str): Nama proses yang dicari
@@ -463,14 +1211,20 @@ class MemoryManager:
         Returns:
             int: ID partisi (0-based) atau None jika tidak ditemukan
         """
-        for block in self.memory_blocks:
-            if (
-                not block.is_free
-                and block.process
-                and block.process.name == process_name
-            ):
-                return block.partition_id
-        return None
+        if self.slab_cache is not None:
+            slab_process = self.slab_cache.get_slab_process(process_name)
+            if slab_process is not None:
+                process_name = slab_process.name
+
+        if self.engine is not None:
+            if self.engine.supports_partitions:
+                return self.engine.get_partition(process_name)
+            return None
+
+        block = self.process_blocks.get(process_name)
+        if block is None:
+            return None
+        return block.partition_id
 
     def allocate_block(self, block_index, process):
         """
@@ -496,10 +1250,17 @@ class MemoryManager:
         if process.name in self.processes:
             self.deallocate_process(process.name)
 
+        self.free_index.remove(block)
+
         if block.size == process.size:
             block.is_free = False
             block.process = process
+            self.process_blocks[process.name] = block
         else:
+            if self.event_callbacks:
+                self.emit_event(
+                    BlockSplit(block.start, block.size, block.start + process.size)
+                )
             used_block = MemoryBlock(
                 block.start, process.size, False, process, partition_id
             )
@@ -511,21 +1272,33 @@ class MemoryManager:
 
             self.memory_blocks[block_index] = used_block
             self.memory_blocks.insert(block_index + 1, free_block)
+            self.free_index.add(free_block)
+            self.process_blocks[process.name] = used_block
 
         self.processes[process.name] = process
+        self.used_memory += process.size
+        if self.event_callbacks:
+            self.emit_event(
+                BlockAllocated(block.start, process.size, process.name, partition_id)
+            )
 
-        if not self.timer_running:
-            self.start_process_timer()
+        if self.use_timer:
+            self.schedule_expiry(process)
 
         self.notify_callbacks()
         return True
 
+    @recorded_operation("free")
     def deallocate_process(self, process_name):
         """
         Dealokasi proses dari memori.
 
         Method ini menghapus proses dari memori dan menandai blok memori yang
-        digunakan sebagai kosong. Blok-blok kosong yang berdekatan akan digabungkan.
+        digunakan sebagai kosong. Blok proses ditemukan langsung melalui peta
+        blok proses, lalu hanya digabungkan dengan tetangga kiri dan kanannya
+        yang kosong tanpa membangun ulang seluruh daftar blok.
+        Blok slab milik cache slab bukan proses, sehingga tidak dapat
+        didealokasi melalui method ini.
 
         Args:
             process_name (str): Nama proses yang akan dealokasi
@@ -536,21 +1309,123 @@ class MemoryManager:
         if process_name not in self.processes:
             return False
 
-        for block in self.memory_blocks:
+        if self.scheduler is not None:
+            self.scheduler.remove(process_name)
+
+        del self.processes[process_name]
+        if self.slab_cache is not None and process_name in self.slab_cache.allocations:
+            self.slab_cache.free(process_name)
+            self.notify_callbacks()
+            return True
+
+        return self.release_block(process_name)
+
+    def release_block(self, process_name, key=None):
+        """
+        Mengosongkan blok memori milik proses atau slab.
+
+        Catatan proses dan jadwalnya harus sudah dihapus oleh pemanggil.
+
+        Args:
+            process_name (str): Nama proses atau slab pemilik blok
+            key (optional): Kunci blok di peta blok dan mesin alokasi jika
+                          berbeda dari nama proses. Defaults to None.
+
+        Returns:
+            bool: True jika berhasil, False jika blok tidak ditemukan
+        """
+        if key is None:
+            key = process_name
+
+        if self.engine is not None:
+            self.engine.free(key)
+            block = self.process_blocks.pop(key, None)
+            if block is not None:
+                self.used_memory -= block.size
+                if self.event_callbacks:
+                    self.emit_event(
+                        BlockFreed(
+                            block.start, block.size, process_name, block.partition_id
+                        )
+                    )
+            self.notify_callbacks()
+            return True
+
+        block = self.process_blocks.pop(key, None)
+        if block is None:
+            return False
+
+        block.is_free = True
+        block.process = None
+        self.used_memory -= block.size
+        if self.event_callbacks:
+            self.emit_event(
+                BlockFreed(block.start, block.size, process_name, block.partition_id)
+            )
+        self.coalesce_block(self.get_block_index(block))
+        self.notify_callbacks()
+        return True
+
+    def coalesce_block(self, block_index):
+        """
+        Menggabungkan blok kosong dengan tetangga langsungnya yang kosong.
+
+        Method ini hanya memeriksa blok tepat di sebelah kiri dan kanan, sehingga
+        biayanya tidak bergantung pada jumlah blok. Jika memori dipartisi,
+        penggabungan hanya dilakukan dengan tetangga dalam partisi yang sama.
+        Blok hasil penggabungan dimasukkan ke indeks blok kosong.
+
+        Args:
+            block_index (int): Indeks blok kosong dalam memory_blocks
+
+        Returns:
+            MemoryBlock: Blok kosong hasil penggabungan
+        """
+        blocks = self.memory_blocks
+        block = blocks[block_index]
+        first = block_index
+        last = block_index
+
+        if block_index > 0:
+            left = blocks[block_index - 1]
             if (
-                not block.is_free
-                and block.process
-                and block.process.name == process_name
+                left.is_free
+                and left.end + 1 == block.start
+                and left.partition_id == block.partition_id
             ):
-                block.is_free = True
-                block.process = None
-                del self.processes[process_name]
-                self.merge_free_blocks()
-                self.notify_callbacks()
-                return True
+                first = block_index - 1
 
-        return False
+        if block_index + 1 < len(blocks):
+            right = blocks[block_index + 1]
+            if (
+                right.is_free
+                and block.end + 1 == right.start
+                and right.partition_id == block.partition_id
+            ):
+                last = block_index + 1
+
+        merged = blocks[first]
+        for neighbour in blocks[first : last + 1]:
+            if neighbour is not block:
+                self.free_index.remove(neighbour)
+
+        if last > first:
+            if self.event_callbacks:
+                self.emit_event(
+                    BlockMerged(
+                        merged.start,
+                        blocks[last].end - merged.start + 1,
+                        [(b.start, b.size) for b in blocks[first : last + 1]],
+                    )
+                )
+            merged.size = blocks[last].end - merged.start + 1
+            merged.end = blocks[last].end
+            del blocks[first + 1 : last + 1]
+
+        self.free_index.add(merged)
+        return merged
 
+    @recorded_operation("clear")
     def clear_all(self):
         """
         Menghapus semua proses dan mengembalikan memori ke kondisi awal.
@@ -561,48 +1436,63 @@ class MemoryManager:
         """
         if self.partitioned and self.partitions:
             self.create_partitions(self.partitions)
+        elif self.engine is not None:
+            self.engine.reset(self.total_memory)
+            self.emit_event(LayoutChanged(0, self.total_memory))
         else:
             self.partitioned = False
             self.partitions = []
             self.memory_blocks = [MemoryBlock(0, self.total_memory)]
+            self.free_index.rebuild(self.memory_blocks)
+            self.next_fit_position = 0
+            self.emit_event(LayoutChanged(0, self.total_memory))
 
-        self.processes = {}
-        self.timer_running = False
+        self.reset_processes()
         self.notify_callbacks()
 
     def start_process_timer(self):
         """
         Memulai timer untuk menghitung waktu proses.
 
-        Method ini memulai thread terpisah yang akan menghitung waktu untuk setiap
-        proses. Thread akan berjalan setiap detik dan akan berhenti ketika tidak
-        ada proses yang berjalan. Setiap detik, waktu proses akan diperbarui dan
-        callback waktu akan dipanggil.
+        Method ini menjalankan ExpiryScheduler yang menyimpan batas waktu setiap
+        proses dalam min-heap. Thread penjadwal tidur hingga batas waktu paling
+        awal dan dibangunkan lebih awal ketika proses ditambahkan atau dihapus.
+        Thread tetap hidup meskipun tidak ada proses yang berjalan. Jika ada
+        callback waktu terdaftar, callback tersebut dipanggil setiap detik.
         """
-        if self.timer_running:
-            return
+        if self.scheduler is None:
+            self.scheduler = ExpiryScheduler(
+                self.expire_process,
+                self.notify_time_update if self.time_update_callbacks else None,
+            )
 
+        self.scheduler.start()
         self.timer_running = True
 
-        def timer_thread():
-            while self.processes and self.timer_running:
-                processes_to_remove = []
-
-                for name, process in list(self.processes.items()):
-                    process.elapsed_time += 1
-                    if process.elapsed_time >= process.duration:
-                        processes_to_remove.append(name)
+    def schedule_expiry(self, process):
+        """
+        Menjadwalkan berakhirnya proses pada timer.
 
-                self.notify_time_update()
+        Args:
+            process (Process): Proses yang baru dialokasikan
+        """
+        self.start_process_timer()
+        self.scheduler.add(process)
 
-                for name in processes_to_remove:
-                    self.notify_process_expired(name)
-                    self.deallocate_process(name)
+    @recorded_operation("expire")
+    def expire_process(self, process_name):
+        """
+        Mengakhiri proses yang telah mencapai batas waktunya.
 
-                time.sleep(1)
+        Method ini dipanggil oleh thread penjadwal atau oleh simulasi headless.
+        Callback proses diberi tahu terlebih dahulu, kemudian memori proses
+        didealokasi.
 
-            self.timer_running = False
+        Args:
+            process_name (str): Nama proses yang berakhir
 
-        thread = threading.Thread(target=timer_thread)
-        thread.daemon = True
-        thread.start()
+        Returns:
+            bool: True jika berhasil dealokasi, False jika proses tidak ditemukan
+        """
+        self.notify_process_expired(process_name)
+        return self.deallocate_process(process_name)
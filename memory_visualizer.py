@@ -1,6 +1,9 @@
+import bisect
 import customtkinter as ctk
 import random
-from config import BLOCK_COLORS
+from operator import attrgetter
+from config import BLOCK_COLORS, PARTITION_COLORS
+from memory_events import BlockAllocated, BlockFreed, BlockMerged, BlockSplit
 
 
 class MemoryVisualizer:
@@ -19,6 +22,7 @@ class MemoryVisualizer:
     - Warna berbeda digunakan untuk membedakan proses
     - Partisi ditandai dengan warna khusus
     - Ukuran blok proporsional dengan ukuran memori yang digunakan
+    - Dalam mode Buddy, batas pohon buddy dan fragmentasi internal ditandai
 
     Attributes:
         parent: Widget induk untuk visualisasi (biasanya frame atau window)
@@ -26,6 +30,19 @@ class MemoryVisualizer:
         canvas_height (int): Tinggi canvas dalam piksel
         canvas_width (int): Lebar canvas dalam piksel
         margin (int): Margin canvas dalam piksel untuk padding
+        block_items (dict): Item canvas setiap blok yang sudah digambar
+                          (key: alamat awal, value: (tanda blok, item))
+        process_colors (dict): Warna setiap proses (key: nama proses)
+        dirty_starts (set): Alamat awal blok yang berubah sejak penggambaran terakhir
+        full_redraw (bool): Status apakah semua blok perlu dibandingkan ulang
+        layout (tuple): Ukuran canvas, ukuran memori, dan mode Buddy saat
+                      canvas terakhir dibersihkan
+        buddy_mode (bool): Status apakah batas pohon buddy digambar
+        lod_threshold (int): Jumlah blok maksimum yang digambar satu per satu,
+                           atau None untuk memakai lebar canvas dalam piksel
+        detail_mode (bool): Status apakah canvas sedang menggambar ringkasan per
+                          kolom piksel, bukan blok satu per satu
+        column_items (list): Item canvas dan tampilan terakhir setiap kolom piksel
     """
 
     def __init__(self, parent, memory_manager):
@@ -45,7 +62,17 @@ class MemoryVisualizer:
         self.canvas_height = 400
         self.canvas_width = 500
         self.margin = 20
-
+        self.block_items = {}
+        self.process_colors = {}
+        self.dirty_starts = set()
+        self.full_redraw = True
+        self.layout = None
+        self.buddy_mode = False
+        self.lod_threshold = None
+        self.detail_mode = False
+        self.column_items = []
+
+        self.memory_manager.register_event_callback(self.on_memory_event)
         self.memory_manager.register_callback(self.update_visualization)
 
         self.create_ui()
@@ -121,55 +148,146 @@ class MemoryVisualizer:
         """
         self.update_visualization(self.memory_manager.memory_blocks)
 
+    def on_memory_event(self, event):
+        """
+        Mencatat bagian memori yang berubah dari event MemoryManager.
+
+        Perubahan hanya dicatat di sini, lalu digambar sekaligus saat
+        update_visualization dipanggil, sehingga satu batch perubahan hanya
+        menghasilkan satu kali penggambaran.
+
+        Args:
+            event (MemoryEvent): Event perubahan blok memori
+        """
+        if isinstance(event, BlockSplit):
+            self.dirty_starts.add(event.start)
+            self.dirty_starts.add(event.split_at)
+        elif isinstance(event, BlockMerged):
+            self.dirty_starts.update(start for start, _ in event.merged)
+        elif isinstance(event, BlockAllocated):
+            self.dirty_starts.add(event.start)
+        elif isinstance(event, BlockFreed):
+            self.dirty_starts.add(event.start)
+            self.process_colors.pop(event.process_name, None)
+        else:
+            self.full_redraw = True
+
     def update_visualization(self, memory_blocks):
         """
         Memperbarui visualisasi berdasarkan blok memori saat ini.
 
-        Method ini menggambar ulang visualisasi memori berdasarkan data blok
+        Method ini memperbarui visualisasi memori berdasarkan data blok
         memori yang diberikan. Visualisasi mencakup:
         - Blok memori yang digunakan dan kosong
         - Partisi (jika ada)
         - Label untuk setiap blok
         - Skala memori
         - Statistik penggunaan
+        - Batas pohon buddy (jika mode Buddy aktif)
+
+        Item canvas setiap blok disimpan dan digunakan kembali. Dalam mode
+        partisi variabel, hanya blok yang tercatat berubah melalui event yang
+        digambar ulang. Mesin alokasi lain tidak melaporkan pembelahan dan
+        penggabungan bloknya, sehingga semua blok dibandingkan dengan gambar
+        sebelumnya, tetapi tetap hanya blok yang berbeda yang diperbarui.
+        Canvas hanya dibersihkan seluruhnya jika ukuran canvas, ukuran memori,
+        mode Buddy, atau tingkat detail berubah.
+
+        Jika jumlah blok melebihi lod_threshold (secara default lebar canvas
+        dalam piksel), blok tidak lagi digambar satu per satu. Sebagai gantinya
+        setiap kolom piksel digambar sebagai satu item yang merangkum blok di
+        dalamnya, sehingga biaya penggambaran dibatasi oleh lebar canvas.
 
         Args:
             memory_blocks (list): Daftar blok memori yang akan divisualisasikan
         """
-        self.canvas.delete("all")
-
         if not memory_blocks:
+            self.canvas.delete("all")
+            self.block_items = {}
+            self.column_items = []
+            self.layout = None
             return
 
+        self.update_statistics()
+
         total_memory = self.memory_manager.total_memory
-        used_memory = sum(block.size for block in memory_blocks if not block.is_free)
-        usage_percent = (used_memory / total_memory) * 100 if total_memory > 0 else 0
+        buddy_mode = self.memory_manager.allocation_mode == "Buddy"
+        canvas_width = self.canvas.winfo_width() or self.canvas_width
+        canvas_height = self.canvas.winfo_height() or self.canvas_height
+        usable_width = canvas_width - 2 * self.margin
+        lod_threshold = self.lod_threshold or usable_width
+        detail_mode = usable_width > 0 and len(memory_blocks) > lod_threshold
+
+        layout = (canvas_width, canvas_height, total_memory, buddy_mode, detail_mode)
+        if layout != self.layout:
+            self.layout = layout
+            self.buddy_mode = buddy_mode
+            self.detail_mode = detail_mode
+            self.canvas.delete("all")
+            self.block_items = {}
+            self.column_items = []
+            self.full_redraw = True
+
+            self.usable_width = usable_width
+            usable_height = canvas_height - 2 * self.margin
+            y_center = canvas_height // 2
+            block_height = min(usable_height, 80)
+            self.y_top = y_center - block_height // 2
+            self.y_bottom = y_center + block_height // 2
+            self.draw_scale(canvas_width, total_memory)
+
+        if self.detail_mode:
+            if self.full_redraw or self.memory_manager.engine is not None:
+                self.render_columns(memory_blocks)
+            else:
+                self.render_columns(
+                    memory_blocks, self.dirty_columns(memory_blocks, self.dirty_starts)
+                )
+        elif self.full_redraw or self.memory_manager.engine is not None:
+            self.render_all(memory_blocks)
+        else:
+            self.render_starts(memory_blocks, self.dirty_starts)
 
-        free_blocks = [block for block in memory_blocks if block.is_free]
-        fragmentation = 0
-        if free_blocks and sum(block.size for block in free_blocks) > 0:
-            fragmentation = (len(free_blocks) - 1) / len(free_blocks) * 100
+        self.full_redraw = False
+        self.dirty_starts = set()
 
+    def update_statistics(self):
+        """
+        Memperbarui label statistik penggunaan memori.
+
+        Statistik dibaca dari MemoryManager.stats() tanpa memindai blok.
+        """
+        stats = self.memory_manager.stats()
+        total_memory = stats["total_memory"]
+        used_memory = stats["used_memory"]
+        usage_percent = (used_memory / total_memory) * 100 if total_memory > 0 else 0
+        fragmentation = stats["fragmentation"]
+        largest_free_block = stats["largest_free_block"]
         active_processes = len(self.memory_manager.processes)
 
-        largest_free_block = max([block.size for block in free_blocks], default=0)
+        engine = self.memory_manager.engine
+        fragmentation_text = f"Fragmentation: {fragmentation:.1f}%"
+        if hasattr(engine, "internal_fragmentation"):
+            internal_fragmentation = engine.internal_fragmentation()
+            fragmentation_text += f" (Internal: {internal_fragmentation} MB)"
 
         self.memory_usage_var.set(
             f"Memory Usage: {used_memory} / {total_memory} MB ({usage_percent:.1f}%)"
         )
-        self.fragmentation_var.set(f"Fragmentation: {fragmentation:.1f}%")
+        self.fragmentation_var.set(fragmentation_text)
         self.process_count_var.set(f"Active Processes: {active_processes}")
         self.largest_free_var.set(f"Largest Free Block: {largest_free_block} MB")
 
-        canvas_width = self.canvas.winfo_width() or self.canvas_width
-        canvas_height = self.canvas.winfo_height() or self.canvas_height
-
-        usable_width = canvas_width - 2 * self.margin
-        usable_height = canvas_height - 2 * self.margin
+    def draw_scale(self, canvas_width, total_memory):
+        """
+        Menggambar elemen skala yang tidak bergantung pada blok.
 
-        y_center = canvas_height // 2
-        block_height = min(usable_height, 80)
+        Elemen ini hanya digambar sekali setiap kali canvas dibersihkan.
 
+        Args:
+            canvas_width (int): Lebar canvas dalam piksel
+            total_memory (int): Total ukuran memori dalam MB
+        """
         self.canvas.create_text(
             self.margin, self.margin - 10, text="0", fill="white", anchor="w"
         )
@@ -181,108 +299,426 @@ class MemoryVisualizer:
             anchor="e",
         )
 
-        partition_colors = [
-            "#3a7ebf",
-            "#bf3a3a",
-            "#3abf7e",
-            "#7e3abf",
-            "#bf7e3a",
-            "#7ebf3a",
-        ]
-
-        process_colors = {}
+        last_pos = self.margin + self.usable_width
+        self.canvas.create_line(
+            last_pos, self.y_bottom + 5, last_pos, self.y_bottom + 10, fill="white"
+        )
+        self.canvas.create_text(
+            last_pos,
+            self.y_bottom + 20,
+            text=str(total_memory),
+            fill="white",
+            font=("Arial", 8),
+        )
 
-        partitions = set()
+    def render_all(self, memory_blocks):
+        """
+        Membandingkan semua blok dengan gambar sebelumnya dan memperbarui yang berbeda.
 
+        Args:
+            memory_blocks (list): Daftar blok memori saat ini
+        """
+        seen = set()
         for block in memory_blocks:
-            if block.partition_id is not None:
-                partitions.add(block.partition_id)
+            self.draw_block(block)
+            seen.add(block.start)
 
-        for block in memory_blocks:
-            x_start = self.margin + (block.start / total_memory) * usable_width
-            x_end = (
-                self.margin + ((block.start + block.size) / total_memory) * usable_width
+        for start in [start for start in self.block_items if start not in seen]:
+            self.remove_block(start)
+
+        active = self.memory_manager.processes
+        self.process_colors = {
+            name: color for name, color in self.process_colors.items() if name in active
+        }
+
+    def process_color(self, process_name):
+        """
+        Mendapatkan warna proses, memilih warna acak untuk proses baru.
+
+        Args:
+            process_name (str): Nama proses
+
+        Returns:
+            str: Warna proses dalam format heksadesimal
+        """
+        if process_name not in self.process_colors:
+            self.process_colors[process_name] = random.choice(BLOCK_COLORS)
+        return self.process_colors[process_name]
+
+    def render_starts(self, memory_blocks, starts):
+        """
+        Memperbarui hanya blok dengan alamat awal tertentu.
+
+        Alamat yang tidak lagi menjadi awal sebuah blok, misalnya karena blok
+        tersebut sudah digabungkan, dihapus dari canvas.
+
+        Args:
+            memory_blocks (list): Daftar blok memori saat ini, terurut
+                                 berdasarkan alamat
+            starts (set): Alamat awal blok yang berubah
+        """
+        for start in starts:
+            index = bisect.bisect_left(memory_blocks, start, key=attrgetter("start"))
+            if index < len(memory_blocks) and memory_blocks[index].start == start:
+                self.draw_block(memory_blocks[index])
+            else:
+                self.remove_block(start)
+
+    def remove_block(self, start):
+        """
+        Menghapus semua item canvas milik blok dengan alamat awal tertentu.
+
+        Args:
+            start (int): Alamat awal blok dalam MB
+        """
+        entry = self.block_items.pop(start, None)
+        if entry is not None:
+            for item in entry[1].values():
+                self.canvas.delete(item)
+
+    def set_item(self, items, key, kind, coords, **options):
+        """
+        Membuat, memperbarui, atau menghapus satu item canvas milik sebuah blok.
+
+        Args:
+            items (dict): Item canvas milik blok (key: peran item)
+            key (str): Peran item, misalnya "rect" atau "label"
+            kind (str): Jenis item canvas, misalnya "rectangle", "text", atau "line"
+            coords (tuple): Koordinat item, atau None jika item tidak diperlukan
+            **options: Opsi item canvas seperti fill atau text
+        """
+        item = items.get(key)
+        if coords is None:
+            if item is not None:
+                self.canvas.delete(item)
+                del items[key]
+        elif item is None:
+            items[key] = getattr(self.canvas, f"create_{kind}")(*coords, **options)
+        else:
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, **options)
+
+    def draw_block(self, block):
+        """
+        Menggambar atau memperbarui satu blok memori.
+
+        Blok yang tidak berubah sejak digambar terakhir kali dilewati.
+
+        Args:
+            block (MemoryBlock): Blok memori yang akan digambar
+        """
+        signature = (block.size, block.is_free, block.process, block.partition_id)
+        entry = self.block_items.get(block.start)
+        if entry is not None and entry[0] == signature:
+            return
+        items = entry[1] if entry is not None else {}
+        self.block_items[block.start] = (signature, items)
+
+        total_memory = self.memory_manager.total_memory
+        usable_width = self.usable_width
+        y_top = self.y_top
+        y_bottom = self.y_bottom
+
+        x_start = self.margin + (block.start / total_memory) * usable_width
+        x_end = self.margin + ((block.start + block.size) / total_memory) * usable_width
+        wide = x_end - x_start > 50
+
+        partitioned = block.partition_id is not None
+        partition_color = ""
+        if partitioned:
+            partition_color = PARTITION_COLORS[
+                block.partition_id % len(PARTITION_COLORS)
+            ]
+        self.set_item(
+            items,
+            "partition",
+            "rectangle",
+            (x_start, y_top - 10, x_end, y_top - 2) if partitioned else None,
+            fill=partition_color,
+            outline="",
+        )
+        self.set_item(
+            items,
+            "partition_label",
+            "text",
+            ((x_start + x_end) / 2, y_top - 6) if partitioned and wide else None,
+            text=f"P{block.partition_id}",
+            fill="white",
+            font=("Arial", 8),
+        )
+
+        if block.is_free:
+            color = "#444444"
+            text_color = "white"
+            text = f"Free: {block.size} MB"
+        else:
+            color = self.process_color(block.process.name)
+            text_color = (
+                "black"
+                if sum(int(color[i : i + 2], 16) for i in (1, 3, 5)) > 380
+                else "white"
             )
+            text = f"{block.process.name}: {block.size} MB"
+
+        self.set_item(
+            items,
+            "rect",
+            "rectangle",
+            (x_start, y_top, x_end, y_bottom),
+            fill=color,
+            outline="black",
+            width=2 if partitioned else 1,
+        )
 
-            y_top = y_center - block_height // 2
-            y_bottom = y_center + block_height // 2
+        if self.buddy_mode:
+            self.draw_buddy_boundary(block, items, x_start, x_end, y_top, y_bottom)
 
-            if block.partition_id is not None:
-                partition_color = partition_colors[
-                    block.partition_id % len(partition_colors)
-                ]
-                self.canvas.create_rectangle(
-                    x_start,
-                    y_top - 10,
-                    x_end,
-                    y_top - 2,
-                    fill=partition_color,
-                    outline="",
+        self.set_item(
+            items,
+            "label",
+            "text",
+            ((x_start + x_end) / 2, (y_top + y_bottom) / 2) if wide else None,
+            text=text,
+            fill=text_color,
+        )
+        if "label" in items:
+            self.canvas.tag_raise(items["label"])
+
+        self.set_item(
+            items,
+            "tick",
+            "line",
+            (x_start, y_bottom + 5, x_start, y_bottom + 10),
+            fill="white",
+        )
+        self.set_item(
+            items,
+            "tick_label",
+            "text",
+            (x_start, y_bottom + 20),
+            text=str(block.start),
+            fill="white",
+            font=("Arial", 8),
+        )
+
+    def column_range(self, column):
+        """
+        Menghitung rentang alamat yang diwakili satu kolom piksel.
+
+        Args:
+            column (int): Indeks kolom piksel
+
+        Returns:
+            tuple: Alamat awal dan akhir (eksklusif) kolom dalam MB
+        """
+        total_memory = self.memory_manager.total_memory
+        width = self.usable_width
+        return column * total_memory / width, (column + 1) * total_memory / width
+
+    def dirty_columns(self, memory_blocks, starts):
+        """
+        Mencari kolom piksel yang dicakup oleh blok-blok yang berubah.
+
+        Untuk setiap alamat yang berubah, seluruh blok yang sekarang memuat
+        alamat tersebut dianggap berubah, termasuk blok hasil penggabungan.
+
+        Args:
+            memory_blocks (list): Daftar blok memori saat ini, terurut
+                                 berdasarkan alamat
+            starts (set): Alamat awal blok yang berubah
+
+        Returns:
+            set: Indeks kolom piksel yang perlu diperbarui
+        """
+        total_memory = self.memory_manager.total_memory
+        width = self.usable_width
+        columns = set()
+        for start in starts:
+            index = (
+                bisect.bisect_right(memory_blocks, start, key=attrgetter("start")) - 1
+            )
+            if index < 0:
+                continue
+            block = memory_blocks[index]
+            first = int(block.start * width / total_memory)
+            last = min(
+                int((block.start + block.size) * width / total_memory), width - 1
+            )
+            columns.update(range(first, last + 1))
+        return columns
+
+    def summarize_column(self, memory_blocks, column):
+        """
+        Merangkum blok-blok dalam satu kolom piksel.
+
+        Args:
+            memory_blocks (list): Daftar blok memori saat ini, terurut
+                                 berdasarkan alamat
+            column (int): Indeks kolom piksel
+
+        Returns:
+            tuple: Rasio memori terpakai dalam kolom (0 sampai 1) dan nama proses
+                  yang menempati bagian terbesar kolom (None jika kosong)
+        """
+        column_start, column_end = self.column_range(column)
+        index = (
+            bisect.bisect_right(memory_blocks, column_start, key=attrgetter("start"))
+            - 1
+        )
+        index = max(index, 0)
+
+        used = 0
+        dominant = None
+        dominant_size = 0
+        while index < len(memory_blocks):
+            block = memory_blocks[index]
+            if block.start >= column_end:
+                break
+            if not block.is_free:
+                overlap = min(block.start + block.size, column_end) - max(
+                    block.start, column_start
                 )
+                if overlap > 0:
+                    used += overlap
+                    if overlap > dominant_size:
+                        dominant = block.process.name
+                        dominant_size = overlap
+            index += 1
+
+        return used / (column_end - column_start), dominant
 
-                if x_end - x_start > 50:
-                    self.canvas.create_text(
-                        (x_start + x_end) / 2,
-                        y_top - 6,
-                        text=f"P{block.partition_id}",
-                        fill="white",
-                        font=("Arial", 8),
-                    )
-
-            if block.is_free:
-                color = "#444444"
-                text_color = "white"
-                text = f"Free: {block.size} MB"
+    def render_columns(self, memory_blocks, columns=None):
+        """
+        Menggambar ringkasan blok per kolom piksel.
+
+        Setiap kolom digambar sebagai satu garis vertikal di atas bar kosong.
+        Tinggi garis sebanding dengan rasio memori terpakai dalam kolom, dan
+        warnanya adalah warna proses yang menempati bagian terbesar kolom.
+
+        Args:
+            memory_blocks (list): Daftar blok memori saat ini, terurut
+                                 berdasarkan alamat
+            columns (iterable, optional): Kolom yang perlu diperbarui. Jika None,
+                                        semua kolom diperbarui. Defaults to None.
+        """
+        if not self.column_items:
+            self.draw_column_background(memory_blocks)
+            self.column_items = [None] * self.usable_width
+            columns = None
+        if columns is None:
+            columns = range(self.usable_width)
+
+        y_top = self.y_top
+        y_bottom = self.y_bottom
+        for column in columns:
+            ratio, process_name = self.summarize_column(memory_blocks, column)
+            height = round(ratio * (y_bottom - y_top))
+            color = self.process_color(process_name) if process_name else ""
+            entry = self.column_items[column]
+            if entry is not None and entry[1] == (height, color):
+                continue
+
+            x = self.margin + column + 0.5
+            coords = (x, y_bottom, x, y_bottom - height)
+            if entry is None:
+                item = self.canvas.create_line(*coords, fill=color)
             else:
-                process_name = block.process.name
-                if process_name not in process_colors:
-                    process_colors[process_name] = random.choice(BLOCK_COLORS)
-                color = process_colors[process_name]
-                text_color = (
-                    "black"
-                    if sum(int(color[i : i + 2], 16) for i in (1, 3, 5)) > 380
-                    else "white"
+                item = entry[0]
+                self.canvas.coords(item, *coords)
+                self.canvas.itemconfigure(item, fill=color)
+            self.column_items[column] = (item, (height, color))
+
+    def draw_column_background(self, memory_blocks):
+        """
+        Menggambar bar kosong dan strip partisi untuk mode ringkasan kolom.
+
+        Partisi hanya berubah ketika dibuat ulang, yang selalu menggambar ulang
+        seluruh canvas, sehingga elemen ini cukup digambar sekali.
+
+        Args:
+            memory_blocks (list): Daftar blok memori saat ini
+        """
+        x_start = self.margin
+        x_end = self.margin + self.usable_width
+        self.canvas.create_rectangle(
+            x_start, self.y_top, x_end, self.y_bottom, fill="#444444", outline="black"
+        )
+
+        partitions = {}
+        for block in memory_blocks:
+            if block.partition_id is not None:
+                start, end = partitions.get(
+                    block.partition_id, (block.start, block.end)
+                )
+                partitions[block.partition_id] = (
+                    min(start, block.start),
+                    max(end, block.end),
                 )
-                text = f"{block.process.name}: {block.size} MB"
 
-            border_width = 2 if block.partition_id is not None else 1
+        total_memory = self.memory_manager.total_memory
+        for partition_id, (start, end) in sorted(partitions.items()):
+            px_start = self.margin + (start / total_memory) * self.usable_width
+            px_end = self.margin + ((end + 1) / total_memory) * self.usable_width
             self.canvas.create_rectangle(
-                x_start,
-                y_top,
-                x_end,
-                y_bottom,
-                fill=color,
-                outline="black",
-                width=border_width,
+                px_start,
+                self.y_top - 10,
+                px_end,
+                self.y_top - 2,
+                fill=PARTITION_COLORS[partition_id % len(PARTITION_COLORS)],
+                outline="",
             )
-
-            if x_end - x_start > 50:
+            if px_end - px_start > 50:
                 self.canvas.create_text(
-                    (x_start + x_end) / 2,
-                    (y_top + y_bottom) / 2,
-                    text=text,
-                    fill=text_color,
+                    (px_start + px_end) / 2,
+                    self.y_top - 6,
+                    text=f"P{partition_id}",
+                    fill="white",
+                    font=("Arial", 8),
                 )
 
-            self.canvas.create_line(
-                x_start, y_bottom + 5, x_start, y_bottom + 10, fill="white"
-            )
-            self.canvas.create_text(
-                x_start,
-                y_bottom + 20,
-                text=str(block.start),
-                fill="white",
-                font=("Arial", 8),
-            )
+    def draw_buddy_boundary(self, block, items, x_start, x_end, y_top, y_bottom):
+        """
+        Menggambar batas pohon buddy untuk sebuah blok.
 
-            last_pos = self.margin + usable_width
-            self.canvas.create_line(
-                last_pos, y_bottom + 5, last_pos, y_bottom + 10, fill="white"
-            )
-            self.canvas.create_text(
-                last_pos,
-                y_bottom + 20,
-                text=str(total_memory),
-                fill="white",
-                font=("Arial", 8),
-            )
+        Setiap batas blok digambar sebagai garis vertikal di atas bar memori.
+        Tinggi garis sebanding dengan level batas tersebut dalam pohon buddy,
+        yaitu pangkat dua terbesar yang membagi alamat awal blok, sehingga
+        batas antar blok besar terlihat lebih tinggi daripada batas antar blok
+        kecil. Untuk blok terpakai, sisa blok yang tidak digunakan proses
+        (fragmentasi internal) diberi arsiran.
+
+        Args:
+            block (MemoryBlock): Blok memori yang akan ditandai
+            items (dict): Item canvas milik blok (key: peran item)
+            x_start (float): Koordinat x awal blok
+            x_end (float): Koordinat x akhir blok
+            y_top (float): Koordinat y atas blok
+            y_bottom (float): Koordinat y bawah blok
+        """
+        max_order = self.memory_manager.engine.max_order
+        if block.start == 0:
+            level = max_order
+        else:
+            level = min((block.start & -block.start).bit_length() - 1, max_order)
+
+        self.set_item(
+            items,
+            "buddy_boundary",
+            "line",
+            (x_start, y_top - 2 - (level + 1) * 3, x_start, y_top),
+            fill="#aaaaaa",
+        )
+
+        hatch = None
+        if not block.is_free and block.process.size < block.size:
+            x_used = x_start + (block.process.size / block.size) * (x_end - x_start)
+            hatch = (x_used, y_top, x_end, y_bottom)
+        self.set_item(
+            items,
+            "buddy_hatch",
+            "rectangle",
+            hatch,
+            fill="#222222",
+            stipple="gray50",
+            outline="",
+        )
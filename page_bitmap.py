@@ -0,0 +1,294 @@
+from free_index import FreeSizeStats
+from memory_block import MemoryBlock
+
+FREE = 0
+USED = 1
+
+
+class PageBitmap:
+    """
+    Mesin alokasi berbasis halaman dengan bitmap.
+
+    Memori dibagi menjadi halaman berukuran tetap dan status setiap halaman
+    disimpan sebagai satu byte dalam bytearray (0 kosong, 1 terpakai). Ukuran
+    proses dibulatkan ke atas menjadi kelipatan halaman. Pencarian blok kosong
+    dilakukan dengan operasi pencarian bytearray yang berjalan di C, sehingga
+    biaya per halaman sangat kecil dibandingkan pemindaian objek MemoryBlock:
+
+    - First Fit dan Next Fit mencari deretan byte kosong sepanjang proses.
+    - Best Fit dan Worst Fit melompati setiap deretan halaman kosong dengan
+      find, sehingga jumlah langkah Python sebanding dengan jumlah lubang,
+      bukan jumlah halaman.
+    - Dealokasi cukup berupa penugasan slice pada bitmap.
+
+    Daftar MemoryBlock hanya dibangun ketika diminta melalui get_blocks.
+
+    Attributes:
+        name (str): Nama mode alokasi
+        supports_algorithms (bool): Mesin ini memakai algoritma First/Best/Worst/Next Fit
+        supports_partitions (bool): Mesin ini tidak mendukung partisi
+        page_size (int): Ukuran satu halaman dalam MB
+        total_memory (int): Total ukuran memori dalam MB
+        page_count (int): Jumlah halaman yang dapat dialokasikan
+        bitmap (bytearray): Status setiap halaman
+        allocated (dict): Halaman terpakai (key: nama proses, value: (halaman
+                        awal, jumlah halaman, proses))
+        next_fit_page (int): Halaman setelah alokasi Next Fit terakhir
+        free_sizes (FreeSizeStats): Penghitung ukuran blok kosong untuk stats()
+    """
+
+    name = "Bitmap"
+    supports_algorithms = True
+    supports_partitions = False
+
+    def __init__(self, total_memory, page_size=1):
+        """
+        Inisialisasi mesin alokasi bitmap.
+
+        Args:
+            total_memory (int): Total ukuran memori dalam MB
+            page_size (int, optional): Ukuran satu halaman dalam MB. Defaults to 1.
+        """
+        self.page_size = page_size
+        self.reset(total_memory)
+
+    def reset(self, total_memory):
+        """
+        Mengosongkan seluruh halaman.
+
+        Sisa memori yang kurang dari satu halaman tidak dapat dialokasikan.
+
+        Args:
+            total_memory (int): Total ukuran memori dalam MB
+        """
+        self.total_memory = total_memory
+        self.page_count = total_memory // self.page_size
+        self.bitmap = bytearray(self.page_count)
+        self.allocated = {}
+        self.next_fit_page = 0
+        self.free_sizes = FreeSizeStats()
+        self._blocks = None
+        if self.run_size(0, self.page_count):
+            self.free_sizes.add(self.run_size(0, self.page_count))
+
+    def pages_for(self, size):
+        """
+        Menghitung jumlah halaman yang dibutuhkan untuk ukuran tertentu.
+
+        Args:
+            size (int): Ukuran yang dibutuhkan dalam MB
+
+        Returns:
+            int: Jumlah halaman (minimal 1)
+        """
+        return max(-(-size // self.page_size), 1)
+
+    def run_size(self, start, stop):
+        """
+        Menghitung ukuran blok kosong untuk deretan halaman tertentu.
+
+        Deretan yang berakhir di halaman terakhir ikut memuat sisa memori yang
+        kurang dari satu halaman, sama seperti blok kosong pada get_blocks.
+
+        Args:
+            start (int): Halaman awal deretan
+            stop (int): Halaman setelah akhir deretan
+
+        Returns:
+            int: Ukuran blok kosong dalam MB
+        """
+        size = (stop - start) * self.page_size
+        if stop == self.page_count:
+            size += self.total_memory - self.page_count * self.page_size
+        return size
+
+    def run_bounds(self, start, stop):
+        """
+        Mencari batas deretan halaman kosong di sekitar rentang halaman.
+
+        Args:
+            start (int): Halaman awal rentang
+            stop (int): Halaman setelah akhir rentang
+
+        Returns:
+            tuple: Halaman awal deretan kosong di kiri rentang dan halaman
+                  setelah akhir deretan kosong di kanan rentang
+        """
+        stop = self.bitmap.find(USED, stop)
+        if stop == -1:
+            stop = self.page_count
+        return self.bitmap.rfind(USED, 0, start) + 1, stop
+
+    def free_runs(self):
+        """
+        Menghasilkan setiap deretan halaman kosong secara berurutan.
+
+        Yields:
+            tuple: (halaman awal, jumlah halaman) untuk setiap deretan kosong
+        """
+        bitmap = self.bitmap
+        end = self.page_count
+        start = bitmap.find(FREE)
+        while start != -1:
+            stop = bitmap.find(USED, start)
+            if stop == -1:
+                stop = end
+            yield start, stop - start
+            if stop == end:
+                return
+            start = bitmap.find(FREE, stop)
+
+    def find_fit(self, pages, algorithm):
+        """
+        Mencari halaman awal untuk sejumlah halaman sesuai algoritma alokasi.
+
+        Args:
+            pages (int): Jumlah halaman yang dibutuhkan
+            algorithm (str): "First Fit", "Best Fit", "Worst Fit", atau "Next Fit"
+
+        Returns:
+            int: Halaman awal yang dipilih, atau None jika tidak ada yang muat
+        """
+        if algorithm in ("First Fit", "Next Fit"):
+            pattern = bytes(pages)
+            start = 0
+            if algorithm == "Next Fit" and self.next_fit_page < self.page_count:
+                # Mulai dari awal blok yang memuat posisi terakhir, sama seperti
+                # Next Fit pada partisi variabel
+                start = self.next_fit_page
+                if self.bitmap[start] == FREE:
+                    start = self.bitmap.rfind(USED, 0, start) + 1
+            index = self.bitmap.find(pattern, start)
+            if index == -1 and start > 0:
+                index = self.bitmap.find(pattern, 0, start + pages - 1)
+            return index if index != -1 else None
+
+        chosen = None
+        chosen_pages = None
+        for start, run in self.free_runs():
+            if run < pages:
+                continue
+            if (
+                chosen is None
+                or (algorithm == "Best Fit" and run < chosen_pages)
+                or (algorithm == "Worst Fit" and run > chosen_pages)
+            ):
+                chosen = start
+                chosen_pages = run
+                if algorithm == "Best Fit" and run == pages:
+                    break
+        return chosen
+
+    def allocate(self, process, algorithm="First Fit"):
+        """
+        Mengalokasikan halaman untuk proses menggunakan algoritma tertentu.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+            algorithm (str, optional): Algoritma alokasi. Defaults to "First Fit".
+
+        Returns:
+            MemoryBlock: Blok yang dialokasikan, atau None jika gagal
+        """
+        if algorithm not in ("First Fit", "Best Fit", "Worst Fit", "Next Fit"):
+            return None
+
+        pages = self.pages_for(process.size)
+        start = self.find_fit(pages, algorithm)
+        if start is None:
+            return None
+
+        left, stop = self.run_bounds(start, start + pages)
+        self.free_sizes.remove(self.run_size(left, stop))
+        if start > left:
+            self.free_sizes.add((start - left) * self.page_size)
+        if self.run_size(start + pages, stop):
+            self.free_sizes.add(self.run_size(start + pages, stop))
+
+        self.bitmap[start : start + pages] = b"\x01" * pages
+        self.allocated[process.name] = (start, pages, process)
+        if algorithm == "Next Fit":
+            self.next_fit_page = start + pages
+        self._blocks = None
+        return MemoryBlock(
+            start * self.page_size, pages * self.page_size, False, process
+        )
+
+    def free(self, process_name):
+        """
+        Membebaskan halaman yang ditempati proses.
+
+        Args:
+            process_name (str): Nama proses yang akan dibebaskan
+
+        Returns:
+            bool: True jika berhasil, False jika proses tidak ditemukan
+        """
+        if process_name not in self.allocated:
+            return False
+
+        start, pages, _ = self.allocated.pop(process_name)
+        left, stop = self.run_bounds(start, start + pages)
+        if start > left:
+            self.free_sizes.remove((start - left) * self.page_size)
+        if self.run_size(start + pages, stop):
+            self.free_sizes.remove(self.run_size(start + pages, stop))
+        self.free_sizes.add(self.run_size(left, stop))
+
+        self.bitmap[start : start + pages] = bytes(pages)
+        self._blocks = None
+        return True
+
+    def rename(self, process_name, new_name):
+        """
+        Mengganti kunci blok terpakai milik proses tanpa memindahkan bloknya.
+
+        Args:
+            process_name (str): Kunci blok saat ini
+            new_name: Kunci baru untuk blok tersebut
+        """
+        self.allocated[new_name] = self.allocated.pop(process_name)
+
+    def internal_fragmentation(self):
+        """
+        Menghitung memori yang terbuang karena pembulatan ke kelipatan halaman.
+
+        Returns:
+            int: Total memori yang terbuang di dalam halaman terpakai dalam MB
+        """
+        return sum(
+            pages * self.page_size - process.size
+            for _, pages, process in self.allocated.values()
+        )
+
+    def get_blocks(self):
+        """
+        Mendapatkan daftar blok memori terurut berdasarkan alamat.
+
+        Blok terpakai dibentuk dari daftar alokasi dan blok kosong dari deretan
+        halaman kosong. Daftar hanya dibangun ulang jika ada perubahan.
+
+        Returns:
+            list[MemoryBlock]: Daftar blok memori
+        """
+        if self._blocks is None:
+            page_size = self.page_size
+            blocks = [
+                MemoryBlock(start * page_size, pages * page_size, False, process)
+                for start, pages, process in self.allocated.values()
+            ]
+            blocks.extend(
+                MemoryBlock(start * page_size, run * page_size)
+                for start, run in self.free_runs()
+            )
+            blocks.sort(key=lambda b: b.start)
+
+            tail = self.page_count * page_size
+            if tail < self.total_memory:
+                if blocks and blocks[-1].is_free:
+                    blocks[-1].size += self.total_memory - tail
+                    blocks[-1].end = blocks[-1].start + blocks[-1].size - 1
+                else:
+                    blocks.append(MemoryBlock(tail, self.total_memory - tail))
+            self._blocks = blocks
+        return self._blocks
@@ -6,13 +6,31 @@ class Process:
     nama proses, ukuran memori yang dibutuhkan, dan durasi proses. Kelas ini juga
     melacak waktu yang telah berlalu sejak proses dimulai.
 
+    Saat proses dijalankan oleh timer, waktu yang telah berlalu dihitung
+    langsung dari jam timer setiap kali dibaca, sehingga tidak perlu
+    diperbarui setiap detik dan durasi di bawah satu detik juga didukung.
+
     Attributes:
         name (str): Nama unik dari proses yang digunakan untuk identifikasi
         size (int): Ukuran memori yang dibutuhkan proses dalam megabyte (MB)
-        duration (int): Durasi proses dalam detik sebelum proses selesai
-        elapsed_time (int): Waktu yang telah berlalu sejak proses dimulai dalam detik
+        duration (float): Durasi proses dalam detik sebelum proses selesai
+        elapsed_time (float): Waktu yang telah berlalu sejak proses dimulai dalam detik
+        start_time (float): Waktu mulai menurut jam timer (None jika tidak berjalan)
+        clock (function): Jam yang digunakan timer (None jika tidak berjalan)
+        algorithm (str): Algoritma atau mode alokasi yang menempatkan proses
+                       (None jika belum dialokasikan)
     """
 
+    __slots__ = (
+        "name",
+        "size",
+        "duration",
+        "algorithm",
+        "start_time",
+        "clock",
+        "_elapsed_time",
+    )
+
     def __init__(self, name, size, duration):
         """
         Inisialisasi objek Process baru.
@@ -23,7 +41,7 @@ class Process:
         Args:
             name (str): Nama proses yang akan digunakan untuk identifikasi
             size (int): Ukuran memori yang dibutuhkan dalam megabyte (MB)
-            duration (int): Durasi proses dalam detik sebelum proses selesai
+            duration (float): Durasi proses dalam detik sebelum proses selesai
 
         Raises:
             ValueError: Jika size atau duration bernilai negatif atau nol
@@ -31,8 +49,55 @@ class Process:
         self.name = name
         self.size = size
         self.duration = duration
+        self.algorithm = None
+        self.start_time = None
+        self.clock = None
         self.elapsed_time = 0
 
+    @property
+    def elapsed_time(self):
+        """
+        Waktu yang telah berlalu sejak proses dimulai dalam detik.
+
+        Jika proses sedang berjalan pada timer, nilai dihitung dari jam timer.
+        Jika tidak, nilai terakhir yang disimpan dikembalikan.
+
+        Returns:
+            float: Waktu yang telah berlalu dalam detik
+        """
+        if self.clock is None:
+            return self._elapsed_time
+        return self._elapsed_time + self.clock() - self.start_time
+
+    @elapsed_time.setter
+    def elapsed_time(self, value):
+        self._elapsed_time = value
+        if self.clock is not None:
+            self.start_time = self.clock()
+
+    def start(self, clock):
+        """
+        Memulai perhitungan waktu proses menggunakan jam tertentu.
+
+        Args:
+            clock (function): Fungsi jam yang mengembalikan waktu dalam detik
+
+        Returns:
+            float: Batas waktu berakhirnya proses menurut jam tersebut
+        """
+        self.clock = clock
+        self.start_time = clock()
+        return self.start_time + self.duration - self._elapsed_time
+
+    def stop(self):
+        """
+        Menghentikan perhitungan waktu proses dan menyimpan waktu terakhirnya.
+        """
+        if self.clock is not None:
+            self._elapsed_time = self.elapsed_time
+            self.clock = None
+            self.start_time = None
+
     def __str__(self):
         """
         Mengembalikan representasi string dari proses.
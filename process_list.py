@@ -0,0 +1,329 @@
+import customtkinter as ctk
+from config import ALGORITHM_COLORS, PARTITION_COLORS, SECONDARY_COLOR
+
+
+class ProcessRow:
+    """
+    Satu baris widget dalam VirtualProcessList yang dapat dipakai ulang.
+
+    Attributes:
+        frame (CTkFrame): Frame baris
+        name_label (CTkLabel): Label nama dan ukuran proses
+        partition_label (CTkLabel): Label partisi proses
+        algorithm_label (CTkLabel): Label algoritma alokasi proses
+        time_label (CTkLabel): Label waktu proses
+        remove_button (CTkButton): Tombol untuk menghapus proses
+        process (Process): Proses yang sedang ditampilkan (None jika kosong)
+    """
+
+    def __init__(self, parent, on_remove, height):
+        """
+        Membuat widget baris kosong.
+
+        Args:
+            parent: Widget induk baris
+            on_remove (function): Fungsi yang dipanggil dengan nama proses saat
+                                tombol Remove ditekan
+            height (int): Tinggi baris dalam piksel
+        """
+        self.process = None
+
+        self.frame = ctk.CTkFrame(parent, height=height)
+        self.frame.grid_propagate(False)
+        self.frame.grid_columnconfigure(0, weight=1)
+
+        header_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        header_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=2)
+
+        self.name_label = ctk.CTkLabel(header_frame, text="", anchor="w")
+        self.name_label.pack(side="left")
+
+        self.algorithm_label = ctk.CTkLabel(
+            header_frame,
+            text="",
+            text_color="white",
+            corner_radius=10,
+            width=30,
+            height=20,
+        )
+        self.partition_label = ctk.CTkLabel(
+            header_frame,
+            text="",
+            text_color="white",
+            corner_radius=10,
+            width=30,
+            height=20,
+        )
+
+        self.time_label = ctk.CTkLabel(self.frame, text="")
+        self.time_label.grid(row=1, column=0, sticky="w", padx=5, pady=2)
+
+        self.remove_button = ctk.CTkButton(
+            self.frame,
+            text="Remove",
+            width=70,
+            height=25,
+            command=lambda: self.process and on_remove(self.process.name),
+            fg_color=SECONDARY_COLOR,
+        )
+        self.remove_button.grid(row=0, column=1, rowspan=2, padx=5, pady=2)
+
+    def show(self, process, partition_id):
+        """
+        Menampilkan sebuah proses pada baris ini.
+
+        Args:
+            process (Process): Proses yang ditampilkan
+            partition_id (int): ID partisi proses, atau None jika tidak dipartisi
+        """
+        self.process = process
+        self.name_label.configure(text=f"{process.name} ({process.size} MB)")
+
+        self.partition_label.pack_forget()
+        self.algorithm_label.pack_forget()
+
+        if partition_id is not None:
+            self.partition_label.configure(
+                text=f"P{partition_id}",
+                fg_color=PARTITION_COLORS[partition_id % len(PARTITION_COLORS)],
+            )
+            self.partition_label.pack(side="right", padx=5)
+
+        if process.algorithm:
+            self.algorithm_label.configure(
+                text="".join(word[0] for word in process.algorithm.split()),
+                fg_color=ALGORITHM_COLORS.get(process.algorithm, "#9C27B0"),
+            )
+            self.algorithm_label.pack(side="right", padx=5)
+
+    def show_time(self, process, running):
+        """
+        Memperbarui label waktu baris.
+
+        Args:
+            process (Process): Proses yang ditampilkan
+            running (bool): Status apakah proses masih berjalan
+        """
+        elapsed_time = int(process.elapsed_time)
+        if running:
+            remaining_time = process.duration - elapsed_time
+            text = (
+                f"Time: {elapsed_time}s / {process.duration}s "
+                f"({remaining_time}s left)"
+            )
+        else:
+            text = f"Time: {elapsed_time}s / {process.duration}s"
+        self.time_label.configure(text=text)
+
+
+class VirtualProcessList:
+    """
+    Daftar proses virtual yang hanya membuat widget untuk baris yang terlihat.
+
+    Daftar ini menyimpan semua proses sebagai data biasa, tetapi hanya memiliki
+    sejumlah kecil baris widget sebanyak yang muat di layar. Saat daftar
+    digulir, baris yang sama dipakai ulang untuk menampilkan proses lain, dan
+    pembaruan waktu setiap detik hanya menyentuh baris yang terlihat. Dengan
+    begitu, ribuan proses tidak membuat ribuan frame, label, dan tombol.
+
+    Attributes:
+        row_height (int): Tinggi setiap baris dalam piksel
+        on_remove (function): Fungsi yang dipanggil dengan nama proses saat
+                            tombol Remove sebuah baris ditekan
+        process_names (list): Nama proses sesuai urutan tampilan
+        entries (dict): Proses dan ID partisinya (key: nama proses)
+        rows (list[ProcessRow]): Baris widget yang dipakai ulang
+        first_index (int): Indeks proses pada baris teratas
+        visible_rows (int): Jumlah baris yang muat dalam tinggi daftar
+    """
+
+    row_height = 64
+
+    def __init__(self, parent, on_remove, height=200):
+        """
+        Membuat daftar proses virtual.
+
+        Args:
+            parent: Widget induk daftar
+            on_remove (function): Fungsi yang menerima nama proses yang dihapus
+                                melalui tombol Remove
+            height (int, optional): Tinggi daftar dalam piksel. Defaults to 200.
+        """
+        self.on_remove = on_remove
+        self.process_names = []
+        self.entries = {}
+        self.rows = []
+        self.first_index = 0
+        self.visible_rows = height // self.row_height + 1
+
+        self.frame = ctk.CTkFrame(parent, height=height)
+        self.frame.pack(fill="x", padx=5, pady=5)
+        self.frame.pack_propagate(False)
+
+        self.scrollbar = ctk.CTkScrollbar(self.frame, command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.row_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        self.row_frame.pack(side="left", fill="both", expand=True)
+        self.row_frame.bind("<Configure>", self.on_resize)
+        self.bind_scroll(self.row_frame)
+
+        self.render()
+
+    def __len__(self):
+        return len(self.process_names)
+
+    def __contains__(self, process_name):
+        return process_name in self.entries
+
+    def bind_scroll(self, widget):
+        """
+        Menghubungkan roda mouse pada sebuah widget ke pengguliran daftar.
+
+        Args:
+            widget: Widget yang menerima event roda mouse
+        """
+        widget.bind("<MouseWheel>", self.on_mouse_wheel)
+        widget.bind("<Button-4>", lambda event: self.scroll_to(self.first_index - 1))
+        widget.bind("<Button-5>", lambda event: self.scroll_to(self.first_index + 1))
+
+    def add(self, process, partition_id=None):
+        """
+        Menambahkan proses ke akhir daftar.
+
+        Args:
+            process (Process): Proses yang ditambahkan
+            partition_id (int, optional): ID partisi proses. Defaults to None.
+        """
+        if process.name in self.entries:
+            self.process_names.remove(process.name)
+        self.entries[process.name] = (process, partition_id)
+        self.process_names.append(process.name)
+        self.render()
+
+    def remove(self, process_name):
+        """
+        Menghapus proses dari daftar.
+
+        Args:
+            process_name (str): Nama proses yang dihapus
+
+        Returns:
+            bool: True jika proses ada dalam daftar, False jika tidak
+        """
+        if process_name not in self.entries:
+            return False
+        del self.entries[process_name]
+        self.process_names.remove(process_name)
+        self.render()
+        return True
+
+    def clear(self):
+        """
+        Menghapus semua proses dari daftar.
+        """
+        self.process_names = []
+        self.entries = {}
+        self.first_index = 0
+        self.render()
+
+    def on_resize(self, event):
+        """
+        Menyesuaikan jumlah baris widget dengan tinggi daftar.
+
+        Args:
+            event: Event Configure dari frame baris
+        """
+        visible_rows = max(event.height // self.row_height + 1, 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.render()
+
+    def on_scroll(self, action, amount, unit=None):
+        """
+        Menangani perintah dari scrollbar.
+
+        Args:
+            action (str): "moveto" atau "scroll"
+            amount (str): Posisi relatif (untuk "moveto") atau jumlah langkah
+                        (untuk "scroll")
+            unit (str, optional): "units" atau "pages" untuk "scroll".
+                                Defaults to None.
+        """
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * len(self.process_names)))
+        elif unit == "pages":
+            page = max(self.visible_rows - 1, 1)
+            self.scroll_to(self.first_index + int(amount) * page)
+        else:
+            self.scroll_to(self.first_index + int(amount))
+
+    def on_mouse_wheel(self, event):
+        """
+        Menggulir daftar dengan roda mouse.
+
+        Args:
+            event: Event MouseWheel
+        """
+        self.scroll_to(self.first_index - (1 if event.delta > 0 else -1))
+
+    def scroll_to(self, index):
+        """
+        Menggulir daftar sehingga proses pada indeks tertentu berada di atas.
+
+        Args:
+            index (int): Indeks proses yang ditampilkan pada baris teratas
+        """
+        last_index = max(len(self.process_names) - self.visible_rows + 1, 0)
+        index = min(max(index, 0), last_index)
+        if index != self.first_index:
+            self.first_index = index
+            self.render()
+
+    def render(self):
+        """
+        Menampilkan proses yang terlihat pada baris-baris widget.
+
+        Baris widget baru hanya dibuat jika daftar bertambah tinggi. Baris yang
+        tidak dipakai disembunyikan.
+        """
+        count = len(self.process_names)
+        self.first_index = min(self.first_index, max(count - self.visible_rows + 1, 0))
+
+        while len(self.rows) < min(self.visible_rows, count):
+            row = ProcessRow(self.row_frame, self.on_remove, self.row_height)
+            for widget in (row.frame, row.name_label, row.time_label):
+                self.bind_scroll(widget)
+            self.rows.append(row)
+
+        for offset, row in enumerate(self.rows):
+            index = self.first_index + offset
+            if offset < self.visible_rows and index < count:
+                process, partition_id = self.entries[self.process_names[index]]
+                if row.process is not process:
+                    row.show(process, partition_id)
+                    row.show_time(process, True)
+                row.frame.pack(fill="x", padx=5, pady=2)
+            elif row.process is not None:
+                row.process = None
+                row.frame.pack_forget()
+
+        if count:
+            self.scrollbar.set(
+                self.first_index / count,
+                min(self.first_index + self.visible_rows - 1, count) / count,
+            )
+        else:
+            self.scrollbar.set(0, 1)
+
+    def update_times(self, running_processes):
+        """
+        Memperbarui label waktu pada baris yang terlihat saja.
+
+        Args:
+            running_processes (dict): Proses yang masih berjalan (key: nama proses)
+        """
+        for row in self.rows:
+            if row.process is not None:
+                running = running_processes.get(row.process.name) is row.process
+                row.show_time(row.process, running)
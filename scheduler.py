@@ -0,0 +1,188 @@
+import heapq
+import itertools
+import math
+import threading
+import time
+
+
+class ExpiryScheduler:
+    """
+    Penjadwal berakhirnya proses berbasis min-heap.
+
+    Kelas ini menyimpan batas waktu absolut setiap proses dalam min-heap dan
+    menjalankan satu thread yang tidur pada condition variable hingga batas
+    waktu paling awal. Thread dibangunkan lebih awal ketika proses ditambahkan
+    atau dihapus, sehingga tidak perlu memindai semua proses setiap detik.
+    Thread tetap hidup selama penjadwal berjalan, meskipun tidak ada proses.
+
+    Proses yang dihapus tidak langsung dikeluarkan dari heap, tetapi ditandai
+    tidak berlaku dan diabaikan saat mencapai puncak heap.
+
+    Attributes:
+        on_expire (function): Fungsi yang dipanggil dengan nama proses yang berakhir
+        on_tick (function): Fungsi yang dipanggil secara berkala (None jika tidak ada)
+        tick_interval (float): Jarak antar pemanggilan on_tick dalam detik
+        clock (function): Jam yang digunakan untuk batas waktu
+        condition (threading.Condition): Condition variable untuk membangunkan thread
+        heap (list): Min-heap berisi (batas waktu, urutan, nama proses, proses)
+        entries (dict): Proses yang masih terjadwal (key: nama proses)
+        running (bool): Status apakah thread penjadwal berjalan
+    """
+
+    def __init__(
+        self, on_expire, on_tick=None, tick_interval=1.0, clock=time.monotonic
+    ):
+        """
+        Inisialisasi penjadwal tanpa menjalankan thread.
+
+        Args:
+            on_expire (function): Fungsi yang menerima nama proses yang berakhir
+            on_tick (function, optional): Fungsi yang dipanggil setiap tick_interval
+                                        detik. Defaults to None.
+            tick_interval (float, optional): Jarak antar tick dalam detik.
+                                           Defaults to 1.0.
+            clock (function, optional): Jam monotonic dalam detik.
+                                      Defaults to time.monotonic.
+        """
+        self.on_expire = on_expire
+        self.on_tick = on_tick
+        self.tick_interval = tick_interval
+        self.clock = clock
+        self.condition = threading.Condition()
+        self.heap = []
+        self.entries = {}
+        self.sequence = itertools.count()
+        self.running = False
+        self.next_tick = None
+
+    def start(self):
+        """
+        Menjalankan thread penjadwal jika belum berjalan.
+        """
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+
+        thread = threading.Thread(target=self.run)
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        """
+        Menghentikan thread penjadwal.
+        """
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+    def add(self, process):
+        """
+        Menjadwalkan berakhirnya proses dan mulai menghitung waktunya.
+
+        Proses dengan durasi tak hingga tetap dihitung waktunya tetapi tidak
+        pernah dijadwalkan berakhir.
+
+        Args:
+            process (Process): Proses yang akan dijadwalkan
+        """
+        with self.condition:
+            deadline = process.start(self.clock)
+            self.entries[process.name] = process
+            if math.isfinite(deadline):
+                heapq.heappush(
+                    self.heap, (deadline, next(self.sequence), process.name, process)
+                )
+            self.condition.notify()
+
+    def remove(self, process_name):
+        """
+        Membatalkan jadwal proses dan menghentikan perhitungan waktunya.
+
+        Args:
+            process_name (str): Nama proses yang dibatalkan
+        """
+        with self.condition:
+            process = self.entries.pop(process_name, None)
+            if process is not None:
+                process.stop()
+            self.condition.notify()
+
+    def clear(self):
+        """
+        Membatalkan semua jadwal proses.
+        """
+        with self.condition:
+            for process in self.entries.values():
+                process.stop()
+            self.entries = {}
+            self.heap = []
+            self.condition.notify()
+
+    def wake(self):
+        """
+        Membangunkan thread agar menghitung ulang waktu tunggunya.
+        """
+        with self.condition:
+            self.condition.notify()
+
+    def wait_for_work(self):
+        """
+        Menunggu hingga ada proses yang berakhir atau tick berikutnya tiba.
+
+        Method ini harus dipanggil dengan condition variable terkunci.
+
+        Returns:
+            tuple: Daftar nama proses yang berakhir dan status apakah tick tiba
+        """
+        while self.running:
+            now = self.clock()
+            expired = []
+            while self.heap and self.heap[0][0] <= now:
+                _, _, name, process = heapq.heappop(self.heap)
+                if self.entries.get(name) is process:
+                    del self.entries[name]
+                    process.stop()
+                    expired.append(name)
+
+            while (
+                self.heap and self.entries.get(self.heap[0][2]) is not self.heap[0][3]
+            ):
+                heapq.heappop(self.heap)
+
+            tick = False
+            if self.on_tick is not None:
+                if self.next_tick is None:
+                    self.next_tick = now + self.tick_interval
+                elif now >= self.next_tick:
+                    self.next_tick = now + self.tick_interval
+                    tick = True
+
+            if expired or tick:
+                return expired, tick
+
+            timeout = self.heap[0][0] - now if self.heap else None
+            if self.on_tick is not None:
+                until_tick = self.next_tick - now
+                timeout = until_tick if timeout is None else min(timeout, until_tick)
+            self.condition.wait(timeout)
+
+        return [], False
+
+    def run(self):
+        """
+        Loop utama thread penjadwal.
+
+        Fungsi on_expire dan on_tick dipanggil di luar kunci, sehingga boleh
+        memanggil add atau remove tanpa menyebabkan deadlock.
+        """
+        while True:
+            with self.condition:
+                expired, tick = self.wait_for_work()
+                if not self.running:
+                    return
+
+            if tick:
+                self.on_tick()
+            for name in expired:
+                self.on_expire(name)
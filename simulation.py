@@ -0,0 +1,199 @@
+import heapq
+import itertools
+
+from memory_manager import MemoryManager
+
+ARRIVAL = 0
+EXPIRY = 1
+
+
+class Simulation:
+    """
+    Mesin simulasi headless berbasis event dengan waktu virtual.
+
+    Kelas ini menjalankan MemoryManager tanpa antarmuka grafis dan tanpa timer
+    waktu nyata. Kedatangan dan berakhirnya proses disimpan sebagai event dalam
+    antrian prioritas yang diurutkan berdasarkan waktu virtual. Simulasi
+    langsung melompat ke event berikutnya, sehingga jutaan masa hidup proses
+    dapat disimulasikan dalam hitungan detik.
+
+    Kedatangan dapat dijadwalkan satu per satu atau diberikan sebagai iterator.
+    Iterator hanya dibaca satu elemen di depan, sehingga generator beban kerja
+    yang sangat panjang tidak perlu dimuat seluruhnya ke memori.
+
+    Attributes:
+        memory_manager (MemoryManager): Pengelola memori yang disimulasikan
+        algorithm (str): Algoritma alokasi default untuk proses yang datang
+        now (float): Waktu virtual saat ini dalam detik
+        events (list): Antrian prioritas event (waktu, urutan, jenis, data)
+        statistics (dict): Penghitung event selama simulasi berjalan
+    """
+
+    def __init__(self, memory_manager=None, algorithm="First Fit"):
+        """
+        Inisialisasi simulasi baru.
+
+        Args:
+            memory_manager (MemoryManager, optional): Pengelola memori yang akan
+                                                    disimulasikan. Jika None,
+                                                    dibuat MemoryManager 1024 MB
+                                                    tanpa timer. Defaults to None.
+            algorithm (str, optional): Algoritma alokasi default.
+                                     Defaults to "First Fit".
+        """
+        if memory_manager is None:
+            memory_manager = MemoryManager(use_timer=False)
+        self.memory_manager = memory_manager
+        self.algorithm = algorithm
+        self.now = 0.0
+        self.events = []
+        self.sequence = itertools.count()
+        self.arrival_streams = {}
+        self.start_times = {}
+        self.statistics = {
+            "arrivals": 0,
+            "allocated": 0,
+            "failed": 0,
+            "expired": 0,
+        }
+
+    def schedule_arrival(self, time, process, algorithm=None):
+        """
+        Menjadwalkan kedatangan sebuah proses.
+
+        Args:
+            time (float): Waktu virtual kedatangan dalam detik
+            process (Process): Proses yang datang
+            algorithm (str, optional): Algoritma alokasi untuk proses ini.
+                                     Defaults to algoritma simulasi.
+        """
+        heapq.heappush(
+            self.events,
+            (time, next(self.sequence), ARRIVAL, (process, algorithm, None)),
+        )
+
+    def add_arrivals(self, arrivals, algorithm=None):
+        """
+        Menambahkan aliran kedatangan proses.
+
+        Aliran dibaca secara malas: hanya satu kedatangan berikutnya dari setiap
+        aliran yang disimpan dalam antrian event pada satu waktu.
+
+        Args:
+            arrivals (iterable): Pasangan (waktu kedatangan, proses) yang terurut
+                               berdasarkan waktu
+            algorithm (str, optional): Algoritma alokasi untuk proses dari aliran
+                                     ini. Defaults to algoritma simulasi.
+        """
+        stream = iter(arrivals)
+        stream_id = next(self.sequence)
+        self.arrival_streams[stream_id] = (stream, algorithm)
+        self.pull_arrival(stream_id)
+
+    def pull_arrival(self, stream_id):
+        """
+        Mengambil kedatangan berikutnya dari sebuah aliran ke antrian event.
+
+        Args:
+            stream_id (int): ID aliran kedatangan
+        """
+        stream, algorithm = self.arrival_streams[stream_id]
+        arrival = next(stream, None)
+        if arrival is None:
+            del self.arrival_streams[stream_id]
+            return
+
+        time, process = arrival
+        heapq.heappush(
+            self.events,
+            (time, next(self.sequence), ARRIVAL, (process, algorithm, stream_id)),
+        )
+
+    def run(self, until=None, max_events=None):
+        """
+        Menjalankan simulasi hingga antrian event habis atau batas tercapai.
+
+        Args:
+            until (float, optional): Batas waktu virtual dalam detik. Event setelah
+                                   waktu ini tidak diproses. Defaults to None.
+            max_events (int, optional): Jumlah maksimum event yang diproses.
+                                      Defaults to None.
+
+        Returns:
+            dict: Statistik simulasi beserta waktu virtual akhir
+        """
+        processed = 0
+        while self.events:
+            if max_events is not None and processed >= max_events:
+                break
+            if until is not None and self.events[0][0] > until:
+                self.now = until
+                break
+
+            time, _, kind, data = heapq.heappop(self.events)
+            self.now = time
+            processed += 1
+
+            if kind == ARRIVAL:
+                self.handle_arrival(*data)
+            else:
+                self.handle_expiry(data)
+
+        return self.get_statistics()
+
+    def handle_arrival(self, process, algorithm, stream_id):
+        """
+        Memproses event kedatangan proses.
+
+        Proses dialokasikan ke memori. Jika berhasil, event berakhirnya proses
+        dijadwalkan pada waktu sekarang ditambah durasi proses.
+
+        Args:
+            process (Process): Proses yang datang
+            algorithm (str): Algoritma alokasi, atau None untuk algoritma default
+            stream_id (int): ID aliran asal proses, atau None jika dijadwalkan manual
+        """
+        if stream_id is not None:
+            self.pull_arrival(stream_id)
+
+        self.statistics["arrivals"] += 1
+        if self.memory_manager.allocate_process(process, algorithm or self.algorithm):
+            self.statistics["allocated"] += 1
+            self.start_times[process.name] = self.now
+            heapq.heappush(
+                self.events,
+                (self.now + process.duration, next(self.sequence), EXPIRY, process),
+            )
+        else:
+            self.statistics["failed"] += 1
+
+    def handle_expiry(self, process):
+        """
+        Memproses event berakhirnya proses.
+
+        Event diabaikan jika proses sudah dihapus atau digantikan oleh proses
+        lain dengan nama yang sama sebelum waktunya berakhir.
+
+        Args:
+            process (Process): Proses yang berakhir
+        """
+        if self.memory_manager.processes.get(process.name) is not process:
+            return
+
+        process.elapsed_time = self.now - self.start_times.pop(process.name)
+        self.statistics["expired"] += 1
+        self.memory_manager.expire_process(process.name)
+
+    def get_statistics(self):
+        """
+        Mendapatkan statistik simulasi saat ini.
+
+        Returns:
+            dict: Jumlah kedatangan, alokasi berhasil, alokasi gagal, proses
+                 yang berakhir, proses yang masih aktif, dan waktu virtual
+        """
+        return {
+            **self.statistics,
+            "active": len(self.memory_manager.processes),
+            "time": self.now,
+        }
@@ -0,0 +1,288 @@
+from process import Process
+
+
+class Slab:
+    """
+    Kelas yang merepresentasikan satu slab dalam SlabCache.
+
+    Slab adalah satu blok memori yang diambil dari ruang kosong umum dan dibagi
+    menjadi beberapa slot berukuran sama. Setiap slot dapat menampung satu
+    proses dari kelas ukuran slab tersebut.
+
+    Attributes:
+        process (Process): Proses semu yang menempati blok slab di MemoryManager
+        object_size (int): Ukuran setiap slot dalam MB
+        free_slots (list): Daftar indeks slot yang masih kosong
+        used (int): Jumlah slot yang sedang terpakai
+    """
+
+    __slots__ = ("process", "object_size", "free_slots", "used")
+
+    def __init__(self, process, object_size, object_count):
+        """
+        Inisialisasi slab baru dengan semua slot kosong.
+
+        Args:
+            process (Process): Proses semu yang menempati blok slab
+            object_size (int): Ukuran setiap slot dalam MB
+            object_count (int): Jumlah slot dalam slab
+        """
+        self.process = process
+        self.object_size = object_size
+        self.free_slots = list(range(object_count - 1, -1, -1))
+        self.used = 0
+
+
+class SizeClass:
+    """
+    Kelas yang menyimpan slab dan statistik untuk satu kelas ukuran.
+
+    Attributes:
+        object_size (int): Ukuran proses yang dilayani kelas ini dalam MB
+        partial_slabs (dict): Slab yang masih memiliki slot kosong (key: nama slab)
+        slab_count (int): Jumlah slab yang sedang dimiliki kelas ini
+        in_use (int): Jumlah slot yang sedang terpakai
+        hits (int): Jumlah alokasi yang dilayani dari slot kosong yang sudah ada
+        misses (int): Jumlah alokasi yang membutuhkan slab baru atau gagal
+    """
+
+    __slots__ = (
+        "object_size",
+        "partial_slabs",
+        "slab_count",
+        "in_use",
+        "hits",
+        "misses",
+    )
+
+    def __init__(self, object_size):
+        """
+        Inisialisasi kelas ukuran tanpa slab.
+
+        Args:
+            object_size (int): Ukuran proses yang dilayani kelas ini dalam MB
+        """
+        self.object_size = object_size
+        self.partial_slabs = {}
+        self.slab_count = 0
+        self.in_use = 0
+        self.hits = 0
+        self.misses = 0
+
+
+class SlabCache:
+    """
+    Lapisan cache slab di depan MemoryManager untuk ukuran proses yang berulang.
+
+    Untuk setiap kelas ukuran yang terdaftar, SlabCache mengambil blok besar
+    (slab) dari ruang kosong umum melalui MemoryManager, lalu membaginya menjadi
+    slot-slot berukuran sama. Proses dengan ukuran yang sama persis dengan
+    sebuah kelas ukuran dialokasikan ke slot kosong dalam O(1) tanpa membelah
+    blok memori baru, dan dealokasinya hanya mengembalikan slot ke daftar slot
+    kosong tanpa proses penggabungan. Slab baru dikembalikan ke ruang kosong
+    umum hanya ketika semua slotnya sudah kosong.
+
+    Attributes:
+        memory_manager (MemoryManager): Pengelola memori tempat slab diambil
+        objects_per_slab (int): Jumlah slot dalam setiap slab
+        size_classes (dict): Kelas ukuran yang dilayani (key: ukuran dalam MB)
+        allocations (dict): Lokasi proses yang di-cache (key: nama proses,
+                          value: tuple (slab, indeks slot))
+        slabs (dict): Semua slab yang sedang dimiliki cache (key: nama slab)
+    """
+
+    def __init__(self, memory_manager, size_classes, objects_per_slab=8):
+        """
+        Inisialisasi SlabCache.
+
+        Args:
+            memory_manager (MemoryManager): Pengelola memori tempat slab diambil
+            size_classes (list): Daftar ukuran proses dalam MB yang akan di-cache
+            objects_per_slab (int, optional): Jumlah slot dalam setiap slab.
+                                            Defaults to 8.
+        """
+        self.memory_manager = memory_manager
+        self.objects_per_slab = objects_per_slab
+        self.size_classes = {size: SizeClass(size) for size in size_classes}
+        self.allocations = {}
+        self.slabs = {}
+        self.slab_counter = 0
+
+    def handles(self, process):
+        """
+        Memeriksa apakah proses dilayani oleh cache.
+
+        Proses dilayani jika ukurannya sama dengan salah satu kelas ukuran.
+        Proses semu milik slab sendiri tidak pernah dilayani oleh cache.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+
+        Returns:
+            bool: True jika proses dialokasikan melalui cache
+        """
+        return process.size in self.size_classes and process.name not in self.slabs
+
+    def allocate(self, process, algorithm="First Fit"):
+        """
+        Mengalokasikan proses ke slot slab dari kelas ukurannya.
+
+        Jika kelas ukuran tidak memiliki slab dengan slot kosong, slab baru
+        diambil dari ruang kosong umum menggunakan algoritma yang dipilih.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+            algorithm (str, optional): Algoritma untuk mengambil slab baru.
+                                     Defaults to "First Fit".
+
+        Returns:
+            bool: True jika berhasil mengalokasikan, False jika gagal
+        """
+        size_class = self.size_classes[process.size]
+
+        if size_class.partial_slabs:
+            size_class.hits += 1
+            slab = next(iter(size_class.partial_slabs.values()))
+        else:
+            size_class.misses += 1
+            slab = self.create_slab(size_class, algorithm)
+            if slab is None:
+                return False
+
+        slot = slab.free_slots.pop()
+        slab.used += 1
+        size_class.in_use += 1
+        if not slab.free_slots:
+            del size_class.partial_slabs[slab.process.name]
+
+        self.allocations[process.name] = (slab, slot)
+        return True
+
+    def create_slab(self, size_class, algorithm):
+        """
+        Mengambil slab baru dari ruang kosong umum.
+
+        Slab ditempatkan di MemoryManager melalui allocate_slab sebagai proses
+        semu tanpa batas waktu, sehingga terlihat sebagai satu blok terpakai
+        dalam visualisasi tetapi tidak terhitung sebagai proses aktif.
+
+        Args:
+            size_class (SizeClass): Kelas ukuran yang membutuhkan slab
+            algorithm (str): Algoritma alokasi yang digunakan
+
+        Returns:
+            Slab: Slab baru, atau None jika tidak ada ruang yang cukup
+        """
+        self.slab_counter += 1
+        slab_process = Process(
+            f"Slab {size_class.object_size} MB #{self.slab_counter}",
+            size_class.object_size * self.objects_per_slab,
+            float("inf"),
+        )
+        slab = Slab(slab_process, size_class.object_size, self.objects_per_slab)
+        self.slabs[slab_process.name] = slab
+        if not self.memory_manager.allocate_slab(slab_process, algorithm):
+            del self.slabs[slab_process.name]
+            return None
+
+        size_class.partial_slabs[slab_process.name] = slab
+        size_class.slab_count += 1
+        return slab
+
+    def free(self, process_name):
+        """
+        Mengembalikan slot proses ke slab-nya.
+
+        Jika slab menjadi kosong sepenuhnya, slab dikembalikan ke ruang kosong
+        umum melalui MemoryManager.
+
+        Args:
+            process_name (str): Nama proses yang akan dibebaskan
+
+        Returns:
+            bool: True jika berhasil, False jika proses tidak ada dalam cache
+        """
+        if process_name not in self.allocations:
+            return False
+
+        slab, slot = self.allocations.pop(process_name)
+        size_class = self.size_classes[slab.object_size]
+        slab.free_slots.append(slot)
+        slab.used -= 1
+        size_class.in_use -= 1
+
+        if slab.used == 0:
+            size_class.partial_slabs.pop(slab.process.name, None)
+            size_class.slab_count -= 1
+            del self.slabs[slab.process.name]
+            self.memory_manager.free_slab(slab.process.name)
+        else:
+            size_class.partial_slabs[slab.process.name] = slab
+        return True
+
+    def get_address(self, process_name):
+        """
+        Mendapatkan alamat awal slot yang ditempati proses.
+
+        Args:
+            process_name (str): Nama proses yang dicari
+
+        Returns:
+            int: Alamat awal slot dalam MB, atau None jika tidak ditemukan
+        """
+        if process_name not in self.allocations:
+            return None
+        slab, slot = self.allocations[process_name]
+        block = self.memory_manager.process_blocks.get(slab.process.name)
+        if block is None:
+            return None
+        return block.start + slot * slab.object_size
+
+    def get_slab_process(self, process_name):
+        """
+        Mendapatkan proses semu slab yang menampung sebuah proses.
+
+        Args:
+            process_name (str): Nama proses yang dicari
+
+        Returns:
+            Process: Proses semu slab, atau None jika proses tidak di-cache
+        """
+        if process_name not in self.allocations:
+            return None
+        return self.allocations[process_name][0].process
+
+    def reset(self):
+        """
+        Melupakan semua slab dan alokasi tanpa menyentuh MemoryManager.
+
+        Dipanggil ketika MemoryManager mengosongkan seluruh memorinya sendiri,
+        misalnya saat membuat partisi atau mengganti mode alokasi. Statistik
+        hit dan miss tetap dipertahankan.
+        """
+        self.allocations = {}
+        self.slabs = {}
+        for size_class in self.size_classes.values():
+            size_class.partial_slabs = {}
+            size_class.slab_count = 0
+            size_class.in_use = 0
+
+    def get_statistics(self):
+        """
+        Mendapatkan statistik cache untuk setiap kelas ukuran.
+
+        Returns:
+            dict: Statistik per kelas ukuran (key: ukuran dalam MB) berisi
+                 hits, misses, hit_rate, slabs, dan in_use
+        """
+        statistics = {}
+        for size, size_class in self.size_classes.items():
+            requests = size_class.hits + size_class.misses
+            statistics[size] = {
+                "hits": size_class.hits,
+                "misses": size_class.misses,
+                "hit_rate": size_class.hits / requests if requests else 0.0,
+                "slabs": size_class.slab_count,
+                "in_use": size_class.in_use,
+            }
+        return statistics
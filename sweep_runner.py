@@ -0,0 +1,303 @@
+import argparse
+import concurrent.futures
+import itertools
+import json
+import os
+import sys
+
+from memory_manager import MemoryManager
+from simulation import Simulation
+from workload import (
+    BurstyArrivals,
+    DiurnalArrivals,
+    LogNormal,
+    PoissonArrivals,
+    Uniform,
+    Zipf,
+    generate_workload,
+)
+
+ALGORITHMS = ("First Fit", "Best Fit", "Worst Fit")
+
+WORKLOADS = {
+    "poisson": lambda memory: (
+        PoissonArrivals(2),
+        LogNormal(memory / 64, 1, 1, memory / 4),
+        Uniform(1, 60),
+    ),
+    "bursty": lambda memory: (
+        BurstyArrivals(1, 20, 60, 5),
+        LogNormal(memory / 64, 1, 1, memory / 4),
+        Uniform(1, 60),
+    ),
+    "diurnal": lambda memory: (
+        DiurnalArrivals(2, 0.8, 3600),
+        LogNormal(memory / 64, 1, 1, memory / 4),
+        Uniform(1, 60),
+    ),
+    "zipf": lambda memory: (
+        PoissonArrivals(2),
+        Zipf(1.2, 1, max(memory // 4, 1)),
+        LogNormal(20, 1, 1, 600),
+    ),
+}
+
+PARTITION_LAYOUTS = {
+    "none": [],
+    "halves": [50, 50],
+    "quarters": [25, 25, 25, 25],
+    "skewed": [60, 25, 10, 5],
+}
+
+
+def sweep_tasks(
+    algorithms=ALGORITHMS,
+    layouts=("none",),
+    memory_sizes=(1024,),
+    seeds=(0,),
+    workloads=("poisson",),
+    count=10000,
+    samples=20,
+):
+    """
+    Membuat semua kombinasi parameter sapuan secara malas.
+
+    Args:
+        algorithms (iterable, optional): Algoritma alokasi. Defaults to ALGORITHMS.
+        layouts (iterable, optional): Nama tata letak partisi dalam
+                                    PARTITION_LAYOUTS. Defaults to ("none",).
+        memory_sizes (iterable, optional): Ukuran memori dalam MB.
+                                         Defaults to (1024,).
+        seeds (iterable, optional): Seed beban kerja. Defaults to (0,).
+        workloads (iterable, optional): Nama beban kerja dalam WORKLOADS.
+                                      Defaults to ("poisson",).
+        count (int, optional): Jumlah proses per simulasi. Defaults to 10000.
+        samples (int, optional): Jumlah pengambilan statistik memori selama
+                               simulasi. Defaults to 20.
+
+    Yields:
+        dict: Parameter satu simulasi
+    """
+    for algorithm, layout, memory, seed, workload in itertools.product(
+        algorithms, layouts, memory_sizes, seeds, workloads
+    ):
+        yield {
+            "algorithm": algorithm,
+            "layout": layout,
+            "memory": memory,
+            "seed": seed,
+            "workload": workload,
+            "count": count,
+            "samples": samples,
+        }
+
+
+def run_task(task):
+    """
+    Menjalankan satu simulasi headless sesuai parameter sapuan.
+
+    Statistik memori diambil beberapa kali selama simulasi berjalan, karena
+    setelah semua proses berakhir memori selalu kosong kembali.
+
+    Args:
+        task (dict): Parameter simulasi dari sweep_tasks
+
+    Returns:
+        dict: Parameter simulasi beserta statistik simulasi, rata-rata
+             utilization dan fragmentation (dalam persen), dan
+             failure_rate (dalam persen)
+    """
+    memory_manager = MemoryManager(task["memory"], use_timer=False)
+    partitions = PARTITION_LAYOUTS[task["layout"]]
+    if partitions:
+        memory_manager.create_partitions(partitions)
+
+    arrivals, sizes, durations = WORKLOADS[task["workload"]](task["memory"])
+    simulation = Simulation(memory_manager, task["algorithm"])
+    simulation.add_arrivals(
+        generate_workload(
+            arrivals, sizes, durations, seed=task["seed"], count=task["count"]
+        )
+    )
+
+    step = max(task["count"] * 2 // task["samples"], 1)
+    utilization = 0
+    fragmentation = 0
+    taken = 0
+    while simulation.events:
+        simulation.run(max_events=step)
+        stats = memory_manager.stats()
+        utilization += stats["used_memory"] / stats["total_memory"] * 100
+        fragmentation += stats["fragmentation"]
+        taken += 1
+
+    statistics = simulation.get_statistics()
+    arrivals = statistics["arrivals"]
+    return {
+        **task,
+        **statistics,
+        "failure_rate": statistics["failed"] / arrivals * 100 if arrivals else 0,
+        "utilization": utilization / taken if taken else 0,
+        "fragmentation": fragmentation / taken if taken else 0,
+    }
+
+
+def run_chunk(tasks):
+    """
+    Menjalankan sekelompok simulasi dalam satu proses pekerja.
+
+    Args:
+        tasks (list[dict]): Parameter simulasi
+
+    Returns:
+        list[dict]: Hasil setiap simulasi sesuai urutan masukan
+    """
+    return [run_task(task) for task in tasks]
+
+
+def run_sweep(tasks, max_workers=None, chunk_size=4, max_pending=None):
+    """
+    Menjalankan simulasi secara paralel di semua inti CPU.
+
+    Simulasi bersifat independen, sehingga dibagikan ke ProcessPoolExecutor
+    dalam kelompok berisi chunk_size simulasi untuk mengurangi biaya
+    komunikasi antar proses. Kelompok dikirim secara bertahap: hanya
+    max_pending kelompok yang menunggu pada satu waktu, sehingga sapuan yang
+    sangat besar tidak perlu dibuat seluruhnya di memori. Hasil dikembalikan
+    segera setelah kelompoknya selesai, tidak menunggu seluruh sapuan.
+
+    Args:
+        tasks (iterable): Parameter simulasi, misalnya dari sweep_tasks
+        max_workers (int, optional): Jumlah proses pekerja. Defaults to None
+                                   (jumlah inti CPU).
+        chunk_size (int, optional): Jumlah simulasi per kelompok. Defaults to 4.
+        max_pending (int, optional): Jumlah maksimum kelompok yang menunggu.
+                                   Defaults to dua kali jumlah pekerja.
+
+    Yields:
+        dict: Hasil setiap simulasi sesuai urutan selesainya
+    """
+    tasks = iter(tasks)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = max_workers * 2
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending = set()
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(itertools.islice(tasks, chunk_size))
+                if not chunk:
+                    break
+                pending.add(executor.submit(run_chunk, chunk))
+            if not pending:
+                return
+
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                yield from future.result()
+
+
+class SweepAggregator:
+    """
+    Penggabung hasil sapuan secara bertahap.
+
+    Hasil dikelompokkan berdasarkan kombinasi parameter selain seed, dan
+    hanya jumlah berjalan yang disimpan, sehingga hasil dapat digabungkan
+    langsung saat tiba dari run_sweep.
+
+    Attributes:
+        keys (tuple): Nama parameter yang menjadi kunci kelompok
+        metrics (tuple): Nama nilai hasil yang dirata-rata
+        groups (dict): Jumlah hasil dan jumlah setiap nilai per kelompok
+    """
+
+    keys = ("algorithm", "layout", "memory", "workload")
+    metrics = ("failure_rate", "utilization", "fragmentation")
+
+    def __init__(self):
+        """
+        Inisialisasi penggabung kosong.
+        """
+        self.groups = {}
+
+    def add(self, result):
+        """
+        Menambahkan satu hasil simulasi.
+
+        Args:
+            result (dict): Hasil dari run_task
+        """
+        key = tuple(result[name] for name in self.keys)
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = [0, [0.0] * len(self.metrics)]
+        group[0] += 1
+        totals = group[1]
+        for index, name in enumerate(self.metrics):
+            totals[index] += result[name]
+
+    def summary(self):
+        """
+        Mendapatkan rata-rata setiap kelompok.
+
+        Returns:
+            list[dict]: Parameter kelompok, jumlah simulasi (runs), dan
+                       rata-rata setiap nilai
+        """
+        rows = []
+        for key, (runs, totals) in sorted(self.groups.items()):
+            row = dict(zip(self.keys, key))
+            row["runs"] = runs
+            for name, total in zip(self.metrics, totals):
+                row[name] = total / runs
+            rows.append(row)
+        return rows
+
+
+def main():
+    """
+    Menjalankan sapuan parameter dari command line.
+
+    Setiap hasil simulasi dicetak sebagai satu baris JSON segera setelah
+    selesai, lalu ringkasan rata-rata per kelompok dicetak di akhir.
+    """
+    parser = argparse.ArgumentParser(description="Parallel allocator sweep")
+    parser.add_argument(
+        "--algorithm", nargs="+", default=ALGORITHMS, choices=ALGORITHMS
+    )
+    parser.add_argument(
+        "--layout", nargs="+", default=["none"], choices=sorted(PARTITION_LAYOUTS)
+    )
+    parser.add_argument("--memory", nargs="+", type=int, default=[1024])
+    parser.add_argument("--seeds", type=int, default=4)
+    parser.add_argument(
+        "--workload", nargs="+", default=["poisson"], choices=sorted(WORKLOADS)
+    )
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--chunk-size", type=int, default=4)
+    args = parser.parse_args()
+
+    tasks = sweep_tasks(
+        args.algorithm,
+        args.layout,
+        args.memory,
+        range(args.seeds),
+        args.workload,
+        args.count,
+    )
+    aggregator = SweepAggregator()
+    for result in run_sweep(tasks, args.workers, args.chunk_size):
+        aggregator.add(result)
+        print(json.dumps(result), file=sys.stderr)
+
+    json.dump(aggregator.summary(), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
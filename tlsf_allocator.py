@@ -0,0 +1,320 @@
+from free_index import FreeSizeStats
+from memory_block import MemoryBlock
+
+SL_INDEX_COUNT_LOG2 = 4
+SL_INDEX_COUNT = 1 << SL_INDEX_COUNT_LOG2
+
+
+class _TLSFBlock:
+    """
+    Blok fisik yang dikelola oleh TLSFAllocator.
+
+    Setiap blok terhubung dengan tetangga fisiknya (blok sebelum dan sesudahnya
+    dalam memori) dan, jika kosong, dengan blok lain dalam daftar kosong kelas
+    ukurannya.
+
+    Attributes:
+        start (int): Alamat awal blok dalam MB
+        size (int): Ukuran blok dalam MB
+        process (Process): Proses yang menempati blok (None jika kosong)
+        prev_phys (_TLSFBlock): Tetangga fisik sebelumnya
+        next_phys (_TLSFBlock): Tetangga fisik berikutnya
+        prev_free (_TLSFBlock): Blok sebelumnya dalam daftar kosong
+        next_free (_TLSFBlock): Blok berikutnya dalam daftar kosong
+    """
+
+    __slots__ = (
+        "start",
+        "size",
+        "process",
+        "prev_phys",
+        "next_phys",
+        "prev_free",
+        "next_free",
+    )
+
+    def __init__(self, start, size):
+        self.start = start
+        self.size = size
+        self.process = None
+        self.prev_phys = None
+        self.next_phys = None
+        self.prev_free = None
+        self.next_free = None
+
+    @property
+    def is_free(self):
+        return self.process is None
+
+
+class TLSFAllocator:
+    """
+    Mesin alokasi memori Two-Level Segregated Fit (TLSF).
+
+    Blok kosong dikelompokkan ke dalam kelas ukuran dua tingkat. Tingkat
+    pertama (first level) membagi ukuran berdasarkan pangkat dua, dan tingkat
+    kedua (second level) membagi setiap rentang pangkat dua menjadi
+    SL_INDEX_COUNT bagian yang sama besar. Setiap tingkat memiliki bitmap
+    yang menandai daftar kosong yang tidak kosong, sehingga daftar yang cocok
+    dapat ditemukan dengan beberapa operasi bit saja.
+
+    Saat dealokasi, blok langsung digabungkan dengan tetangga fisiknya yang
+    kosong melalui pointer batas blok. Dengan demikian biaya alokasi dan
+    dealokasi tetap konstan, tidak bergantung pada jumlah blok dalam memori.
+
+    Attributes:
+        name (str): Nama mode alokasi
+        supports_algorithms (bool): Mesin ini tidak memakai algoritma First/Best/Worst Fit
+        supports_partitions (bool): Mesin ini tidak mendukung partisi
+        total_memory (int): Total ukuran memori dalam MB
+        fl_bitmap (int): Bitmap tingkat pertama
+        sl_bitmap (list[int]): Bitmap tingkat kedua untuk setiap tingkat pertama
+        free_lists (list[list]): Kepala daftar kosong untuk setiap pasangan (fl, sl)
+        allocated (dict): Blok terpakai (key: nama proses)
+        free_sizes (FreeSizeStats): Penghitung ukuran blok kosong untuk stats()
+    """
+
+    name = "TLSF"
+    supports_algorithms = False
+    supports_partitions = False
+
+    def __init__(self, total_memory):
+        """
+        Inisialisasi mesin alokasi TLSF.
+
+        Args:
+            total_memory (int): Total ukuran memori dalam MB
+        """
+        self.reset(total_memory)
+
+    def reset(self, total_memory):
+        """
+        Mengosongkan seluruh memori menjadi satu blok kosong.
+
+        Args:
+            total_memory (int): Total ukuran memori dalam MB
+        """
+        self.total_memory = total_memory
+        fl_count = self.mapping(max(total_memory, 1))[0] + 1
+        self.fl_bitmap = 0
+        self.sl_bitmap = [0] * fl_count
+        self.free_lists = [[None] * SL_INDEX_COUNT for _ in range(fl_count)]
+        self.allocated = {}
+        self.free_sizes = FreeSizeStats()
+        self._blocks = None
+
+        self.head = _TLSFBlock(0, total_memory)
+        if total_memory > 0:
+            self.insert_free_block(self.head)
+
+    @staticmethod
+    def mapping(size):
+        """
+        Menghitung indeks kelas ukuran (fl, sl) untuk sebuah ukuran blok.
+
+        Args:
+            size (int): Ukuran blok dalam MB
+
+        Returns:
+            tuple: Pasangan indeks (fl, sl)
+        """
+        if size < SL_INDEX_COUNT:
+            return 0, size
+        fl = size.bit_length() - 1
+        sl = (size >> (fl - SL_INDEX_COUNT_LOG2)) ^ SL_INDEX_COUNT
+        return fl - SL_INDEX_COUNT_LOG2 + 1, sl
+
+    @classmethod
+    def mapping_search(cls, size):
+        """
+        Menghitung kelas ukuran terkecil yang semua bloknya cukup besar.
+
+        Ukuran dibulatkan ke atas ke batas kelas berikutnya, sehingga setiap
+        blok dalam kelas hasil dijamin dapat menampung ukuran yang diminta.
+
+        Args:
+            size (int): Ukuran yang dibutuhkan dalam MB
+
+        Returns:
+            tuple: Pasangan indeks (fl, sl)
+        """
+        if size >= SL_INDEX_COUNT:
+            size += (1 << (size.bit_length() - 1 - SL_INDEX_COUNT_LOG2)) - 1
+        return cls.mapping(size)
+
+    def find_suitable(self, fl, sl):
+        """
+        Mencari daftar kosong tidak kosong pertama mulai dari kelas (fl, sl).
+
+        Args:
+            fl (int): Indeks tingkat pertama
+            sl (int): Indeks tingkat kedua
+
+        Returns:
+            tuple: Pasangan indeks (fl, sl), atau None jika tidak ada blok
+        """
+        if fl >= len(self.sl_bitmap):
+            return None
+
+        sl_map = self.sl_bitmap[fl] & (-1 << sl)
+        if not sl_map:
+            fl_map = self.fl_bitmap & (-1 << (fl + 1))
+            if not fl_map:
+                return None
+            fl = (fl_map & -fl_map).bit_length() - 1
+            sl_map = self.sl_bitmap[fl]
+
+        return fl, (sl_map & -sl_map).bit_length() - 1
+
+    def insert_free_block(self, block):
+        """
+        Memasukkan blok kosong ke daftar kelas ukurannya.
+
+        Args:
+            block (_TLSFBlock): Blok kosong
+        """
+        fl, sl = self.mapping(block.size)
+        head = self.free_lists[fl][sl]
+        block.prev_free = None
+        block.next_free = head
+        if head is not None:
+            head.prev_free = block
+        self.free_lists[fl][sl] = block
+        self.fl_bitmap |= 1 << fl
+        self.sl_bitmap[fl] |= 1 << sl
+        self.free_sizes.add(block.size)
+
+    def remove_free_block(self, block):
+        """
+        Mengeluarkan blok kosong dari daftar kelas ukurannya.
+
+        Args:
+            block (_TLSFBlock): Blok kosong
+        """
+        fl, sl = self.mapping(block.size)
+        if block.prev_free is not None:
+            block.prev_free.next_free = block.next_free
+        else:
+            self.free_lists[fl][sl] = block.next_free
+        if block.next_free is not None:
+            block.next_free.prev_free = block.prev_free
+        block.prev_free = None
+        block.next_free = None
+        self.free_sizes.remove(block.size)
+
+        if self.free_lists[fl][sl] is None:
+            self.sl_bitmap[fl] &= ~(1 << sl)
+            if not self.sl_bitmap[fl]:
+                self.fl_bitmap &= ~(1 << fl)
+
+    def allocate(self, process, algorithm=None):
+        """
+        Mengalokasikan blok untuk proses.
+
+        Kelas ukuran dibulatkan ke atas agar blok pertama dalam daftar selalu
+        cukup besar. Jika tidak ada kelas yang lebih besar, kepala daftar pada
+        kelas ukuran yang sama tetap diperiksa, sehingga blok yang tepat pas
+        (misalnya seluruh memori) tidak ditolak.
+
+        Args:
+            process (Process): Proses yang akan dialokasikan
+            algorithm (str, optional): Diabaikan, karena penempatan ditentukan
+                                     oleh mesin ini sendiri. Defaults to None.
+
+        Returns:
+            MemoryBlock: Blok yang dialokasikan, atau None jika tidak ada ruang
+        """
+        size = max(process.size, 1)
+        index = self.find_suitable(*self.mapping_search(size))
+        if index is not None:
+            block = self.free_lists[index[0]][index[1]]
+        else:
+            fl, sl = self.mapping(size)
+            block = self.free_lists[fl][sl] if fl < len(self.free_lists) else None
+            if block is None or block.size < size:
+                return None
+
+        self.remove_free_block(block)
+
+        if block.size > size:
+            remainder = _TLSFBlock(block.start + size, block.size - size)
+            remainder.prev_phys = block
+            remainder.next_phys = block.next_phys
+            if block.next_phys is not None:
+                block.next_phys.prev_phys = remainder
+            block.next_phys = remainder
+            block.size = size
+            self.insert_free_block(remainder)
+
+        block.process = process
+        self.allocated[process.name] = block
+        self._blocks = None
+        return MemoryBlock(block.start, block.size, False, process)
+
+    def free(self, process_name):
+        """
+        Membebaskan blok proses dan menggabungkannya dengan tetangga fisik.
+
+        Args:
+            process_name (str): Nama proses yang akan dibebaskan
+
+        Returns:
+            bool: True jika berhasil, False jika proses tidak ditemukan
+        """
+        block = self.allocated.pop(process_name, None)
+        if block is None:
+            return False
+
+        block.process = None
+
+        prev_block = block.prev_phys
+        if prev_block is not None and prev_block.is_free:
+            self.remove_free_block(prev_block)
+            prev_block.size += block.size
+            prev_block.next_phys = block.next_phys
+            if block.next_phys is not None:
+                block.next_phys.prev_phys = prev_block
+            block = prev_block
+
+        next_block = block.next_phys
+        if next_block is not None and next_block.is_free:
+            self.remove_free_block(next_block)
+            block.size += next_block.size
+            block.next_phys = next_block.next_phys
+            if next_block.next_phys is not None:
+                next_block.next_phys.prev_phys = block
+
+        self.insert_free_block(block)
+        self._blocks = None
+        return True
+
+    def rename(self, process_name, new_name):
+        """
+        Mengganti kunci blok terpakai milik proses tanpa memindahkan bloknya.
+
+        Args:
+            process_name (str): Kunci blok saat ini
+            new_name: Kunci baru untuk blok tersebut
+        """
+        self.allocated[new_name] = self.allocated.pop(process_name)
+
+    def get_blocks(self):
+        """
+        Mendapatkan daftar blok memori terurut berdasarkan alamat.
+
+        Daftar blok dibangun dengan menelusuri tetangga fisik dan hanya
+        dibangun ulang ketika ada perubahan sejak pemanggilan terakhir.
+
+        Returns:
+            list[MemoryBlock]: Daftar blok memori
+        """
+        if self._blocks is None:
+            blocks = []
+            block = self.head
+            while block is not None:
+                blocks.append(
+                    MemoryBlock(block.start, block.size, block.is_free, block.process)
+                )
+                block = block.next_phys
+            self._blocks = blocks
+        return self._blocks
@@ -0,0 +1,267 @@
+import struct
+import time
+
+from compaction import COMPACTION_MODES
+
+TRACE_MAGIC = b"MMTRACE1"
+HEADER = struct.Struct("<8sI4x")
+RECORD = struct.Struct("<dBBxxIqqd")
+
+ALLOCATE = 1
+FREE = 2
+EXPIRE = 3
+RESIZE = 4
+PARTITION = 5
+PARTITION_VALUE = 6
+MODE = 7
+CLEAR = 8
+COMPACT = 9
+AUTO_COMPACT = 10
+
+ALGORITHMS = ("First Fit", "Best Fit", "Worst Fit", "Next Fit")
+MODES = ("Variable", "Buddy", "TLSF", "Compact", "Bitmap")
+NO_CODE = 255
+NO_ADDRESS = -1
+
+ALGORITHM_CODES = {algorithm: code for code, algorithm in enumerate(ALGORITHMS)}
+MODE_CODES = {mode: code for code, mode in enumerate(MODES)}
+COMPACTION_CODES = {mode: code for code, mode in enumerate(COMPACTION_MODES)}
+
+
+class TraceRecorder:
+    """
+    Perekam operasi MemoryManager ke file trace biner berukuran tetap.
+
+    File trace diawali header berisi TRACE_MAGIC dan ukuran record, diikuti
+    record-record RECORD berukuran 40 byte dengan isi:
+
+    - timestamp (float): Waktu sejak perekaman dimulai dalam detik
+    - op (int): Jenis operasi (ALLOCATE, FREE, EXPIRE, RESIZE, PARTITION,
+      PARTITION_VALUE, MODE, CLEAR, COMPACT, atau AUTO_COMPACT)
+    - code (int): Indeks algoritma dalam ALGORITHMS untuk ALLOCATE, indeks mode
+      dalam MODES untuk MODE, indeks mode dalam COMPACTION_MODES untuk
+      COMPACT dan AUTO_COMPACT, atau NO_CODE
+    - handle (int): Nomor proses. Nama proses yang sama selalu mendapat nomor
+      yang sama, sehingga alokasi ulang dengan nama yang sama dapat diputar
+      ulang dengan tepat.
+    - size (int): Ukuran proses untuk ALLOCATE, ukuran memori baru untuk
+      RESIZE, jumlah partisi untuk PARTITION, atau ukuran blok kosong
+      (Minimal) maupun batas pemindahan (Incremental) untuk COMPACT dan
+      AUTO_COMPACT
+    - address (int): Alamat hasil ALLOCATE atau alamat blok yang dibebaskan
+      oleh FREE dan EXPIRE, NO_ADDRESS jika operasi gagal (termasuk pemadatan
+      Minimal yang tidak dijalankan), dan 0 untuk operasi lain yang berhasil
+    - value (float): Durasi proses untuk ALLOCATE, persentase satu partisi
+      untuk PARTITION_VALUE, atau ukuran yang dipindahkan untuk COMPACT dan
+      AUTO_COMPACT
+
+    Setiap PARTITION diikuti record PARTITION_VALUE sebanyak jumlah partisinya.
+    COMPACT mencatat pemadatan yang dipanggil langsung melalui
+    MemoryManager.compact. Pemadatan otomatis di dalam alokasi (lihat
+    MemoryManager.enable_compaction) ditulis sebagai record AUTO_COMPACT
+    Minimal tersendiri tepat sebelum record ALLOCATE-nya, sehingga trace dapat
+    diputar ulang dengan tepat tanpa mengetahui batas biaya pemadatan saat
+    perekaman.
+    Record dikumpulkan dalam buffer dan ditulis ke file sekaligus ketika
+    buffer penuh, sehingga perekaman jutaan operasi hanya menambah sedikit
+    biaya pada setiap operasi.
+
+    Attributes:
+        memory_manager (MemoryManager): Pengelola memori yang direkam
+        clock (function): Jam untuk timestamp record
+        buffer_size (int): Ukuran buffer dalam byte sebelum ditulis ke file
+        handles (dict): Nomor setiap proses (key: nama proses)
+        addresses (dict): Alamat setiap proses yang masih dialokasikan
+                        (key: nomor proses)
+        record_count (int): Jumlah record yang sudah direkam
+    """
+
+    def __init__(
+        self, memory_manager, path, clock=time.perf_counter, buffer_size=1 << 16
+    ):
+        """
+        Membuka file trace dan mulai merekam operasi MemoryManager.
+
+        Args:
+            memory_manager (MemoryManager): Pengelola memori yang direkam
+            path (str): Lokasi file trace
+            clock (function, optional): Jam untuk timestamp, misalnya waktu
+                                      virtual simulasi. Defaults to
+                                      time.perf_counter.
+            buffer_size (int, optional): Ukuran buffer dalam byte.
+                                       Defaults to 65536.
+        """
+        self.memory_manager = memory_manager
+        self.clock = clock
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        self.handles = {}
+        self.addresses = {}
+        self.record_count = 0
+        self.start_time = clock()
+
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(TRACE_MAGIC, RECORD.size))
+        memory_manager.register_operation_callback(self.record)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def handle_for(self, process_name):
+        """
+        Mendapatkan nomor proses, membuat nomor baru untuk nama baru.
+
+        Args:
+            process_name (str): Nama proses
+
+        Returns:
+            int: Nomor proses
+        """
+        handle = self.handles.get(process_name)
+        if handle is None:
+            handle = self.handles[process_name] = len(self.handles)
+        return handle
+
+    def write(self, op, code=NO_CODE, handle=0, size=0, address=0, value=0.0):
+        """
+        Menambahkan satu record ke buffer.
+
+        Args:
+            op (int): Jenis operasi
+            code (int, optional): Kode algoritma atau mode. Defaults to NO_CODE.
+            handle (int, optional): Nomor proses. Defaults to 0.
+            size (int, optional): Ukuran terkait operasi. Defaults to 0.
+            address (int, optional): Alamat hasil operasi. Defaults to 0.
+            value (float, optional): Nilai tambahan operasi. Defaults to 0.0.
+        """
+        self.buffer += RECORD.pack(
+            self.clock() - self.start_time, op, code, handle, size, address, value
+        )
+        self.record_count += 1
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def record(self, operation, arguments, result):
+        """
+        Merekam satu operasi MemoryManager.
+
+        Method ini didaftarkan sebagai callback operasi MemoryManager.
+
+        Args:
+            operation (str): Nama operasi
+            arguments (dict): Argumen operasi
+            result: Hasil operasi
+        """
+        status = 0 if result else NO_ADDRESS
+
+        if operation == "allocate":
+            process = arguments["process"]
+            handle = self.handle_for(process.name)
+            self.addresses.pop(handle, None)
+            address = NO_ADDRESS
+            compaction = self.memory_manager.last_compaction
+            if compaction is not None:
+                self.write(
+                    AUTO_COMPACT,
+                    COMPACTION_CODES[compaction["mode"]],
+                    size=compaction["size"],
+                    value=compaction["moved"],
+                )
+                self.refresh_addresses()
+            if result:
+                address = self.memory_manager.get_process_address(process.name)
+                self.addresses[handle] = address
+            self.write(
+                ALLOCATE,
+                ALGORITHM_CODES.get(arguments["algorithm"], NO_CODE),
+                handle,
+                process.size,
+                address,
+                process.duration,
+            )
+        elif operation in ("free", "expire"):
+            handle = self.handle_for(arguments["process_name"])
+            address = self.addresses.pop(handle, NO_ADDRESS)
+            self.write(
+                FREE if operation == "free" else EXPIRE,
+                handle=handle,
+                address=address if result else NO_ADDRESS,
+            )
+        elif operation == "resize":
+            self.forget_processes()
+            self.write(RESIZE, size=arguments["new_size"], address=status)
+        elif operation == "partition":
+            self.forget_processes()
+            percentages = arguments["partition_percentages"] or []
+            self.write(PARTITION, size=len(percentages), address=status)
+            for percentage in percentages:
+                self.write(PARTITION_VALUE, value=percentage)
+        elif operation == "mode":
+            self.forget_processes()
+            mode = arguments["mode"]
+            self.write(MODE, MODE_CODES.get(mode, NO_CODE), address=status)
+        elif operation == "clear":
+            self.forget_processes()
+            self.write(CLEAR)
+        elif operation == "compact":
+            refused = arguments["mode"] == "Minimal" and not result["complete"]
+            self.write(
+                COMPACT,
+                COMPACTION_CODES.get(arguments["mode"], NO_CODE),
+                size=arguments["size"] or arguments["budget"] or 0,
+                address=NO_ADDRESS if refused else 0,
+                value=result["moved"],
+            )
+            self.refresh_addresses()
+
+    def forget_processes(self):
+        """
+        Menyelaraskan catatan alamat dengan proses yang masih berjalan.
+
+        Dipanggil setelah operasi yang dapat menghapus banyak proses sekaligus.
+        """
+        active = {
+            self.handles[name]
+            for name in self.memory_manager.processes
+            if name in self.handles
+        }
+        self.addresses = {
+            handle: address
+            for handle, address in self.addresses.items()
+            if handle in active
+        }
+
+    def refresh_addresses(self):
+        """
+        Membaca ulang alamat proses yang masih berjalan.
+
+        Dipanggil setelah pemadatan, termasuk pemadatan otomatis di dalam
+        alokasi, karena blok proses dapat dipindahkan.
+        """
+        get_process_address = self.memory_manager.get_process_address
+        for name in self.memory_manager.processes:
+            handle = self.handles.get(name)
+            if handle in self.addresses:
+                self.addresses[handle] = get_process_address(name)
+
+    def flush(self):
+        """
+        Menulis isi buffer ke file.
+        """
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.buffer = bytearray()
+
+    def close(self):
+        """
+        Menulis sisa buffer, menutup file, dan berhenti merekam.
+        """
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+        if self.record in self.memory_manager.operation_callbacks:
+            self.memory_manager.operation_callbacks.remove(self.record)
@@ -0,0 +1,180 @@
+import argparse
+import mmap
+import time
+
+from compaction import COMPACTION_MODES
+from memory_manager import MemoryManager
+from process import Process
+from trace_recorder import (
+    ALGORITHMS,
+    ALLOCATE,
+    AUTO_COMPACT,
+    CLEAR,
+    COMPACT,
+    EXPIRE,
+    FREE,
+    HEADER,
+    MODE,
+    MODES,
+    NO_ADDRESS,
+    PARTITION,
+    PARTITION_VALUE,
+    RECORD,
+    RESIZE,
+    TRACE_MAGIC,
+)
+
+
+def replay_trace(path, memory_manager=None, algorithm=None):
+    """
+    Memutar ulang file trace TraceRecorder secepat mungkin tanpa GUI.
+
+    File trace dipetakan ke memori dengan mmap dan record dibaca langsung dari
+    memoryview, sehingga trace berukuran besar tidak perlu dimuat ke memori.
+    Tidak ada jeda waktu nyata: timestamp record diabaikan dan setiap operasi,
+    termasuk pemadatan, langsung diteruskan ke MemoryManager. Proses diberi
+    nama P{nomor proses} sesuai nomor proses dalam trace.
+
+    Pemadatan yang dipanggil langsung (COMPACT) diputar ulang tanpa batas
+    biaya, kecuali pemadatan Minimal yang tidak dijalankan saat perekaman,
+    yang dilewati. Pemadatan otomatis (AUTO_COMPACT) dibatasi sebesar ukuran
+    yang dipindahkan saat perekaman, sehingga dengan algoritma pengganti
+    pemadatan tersebut tidak lebih mahal daripada aslinya.
+
+    Args:
+        path (str): Lokasi file trace
+        memory_manager (MemoryManager, optional): Pengelola memori tujuan. Jika
+                                                None, dibuat MemoryManager 1024 MB
+                                                tanpa timer. Defaults to None.
+        algorithm (str, optional): Algoritma alokasi pengganti untuk semua
+                                 alokasi, untuk membandingkan algoritma pada
+                                 trace yang sama. Defaults to algoritma yang
+                                 tercatat dalam trace.
+
+    Returns:
+        dict: Jumlah record dan alokasi, alokasi gagal, failure_rate (dalam
+             persen), waktu putar ulang, ops_per_second, serta hasil stats()
+             MemoryManager setelah trace selesai
+
+    Raises:
+        ValueError: Jika file bukan trace TraceRecorder
+    """
+    if memory_manager is None:
+        memory_manager = MemoryManager(use_timer=False)
+
+    allocate_process = memory_manager.allocate_process
+    deallocate_process = memory_manager.deallocate_process
+    allocations = 0
+    failed = 0
+    records = 0
+    partition_count = 0
+    partition_values = []
+
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                if len(view) < HEADER.size:
+                    raise ValueError(f"{path} is not a memory trace")
+                magic, record_size = HEADER.unpack_from(view)
+                if magic != TRACE_MAGIC or record_size != RECORD.size:
+                    raise ValueError(f"{path} is not a memory trace")
+
+                body = view[HEADER.size :]
+                body = body[: len(body) - len(body) % RECORD.size]
+                begin = time.perf_counter()
+                for record in RECORD.iter_unpack(body):
+                    _, op, code, handle, size, address, value = record
+                    records += 1
+                    if op == ALLOCATE:
+                        allocations += 1
+                        process = Process(f"P{handle}", size, value)
+                        if algorithm is not None:
+                            fit = algorithm
+                        elif code < len(ALGORITHMS):
+                            fit = ALGORITHMS[code]
+                        else:
+                            fit = "First Fit"
+                        if not allocate_process(process, fit):
+                            failed += 1
+                    elif op == FREE or op == EXPIRE:
+                        deallocate_process(f"P{handle}")
+                    elif op == PARTITION_VALUE:
+                        partition_values.append(value)
+                        if len(partition_values) == partition_count:
+                            memory_manager.create_partitions(partition_values)
+                            partition_values = []
+                    elif op == PARTITION:
+                        partition_count = size
+                        partition_values = []
+                        if not size:
+                            memory_manager.create_partitions([])
+                    elif op == RESIZE:
+                        memory_manager.resize_memory(size)
+                    elif op == MODE:
+                        if code < len(MODES):
+                            memory_manager.set_allocation_mode(MODES[code])
+                    elif op == CLEAR:
+                        memory_manager.clear_all()
+                    elif op == COMPACT:
+                        if code < len(COMPACTION_MODES) and address != NO_ADDRESS:
+                            memory_manager.compact(COMPACTION_MODES[code], size, size)
+                    elif op == AUTO_COMPACT:
+                        if code < len(COMPACTION_MODES):
+                            memory_manager.compact(
+                                COMPACTION_MODES[code], size, size, max_cost=value
+                            )
+                elapsed = time.perf_counter() - begin
+                body.release()
+
+    return {
+        "records": records,
+        "allocations": allocations,
+        "failed": failed,
+        "failure_rate": failed / allocations * 100 if allocations else 0,
+        "seconds": elapsed,
+        "ops_per_second": records / elapsed if elapsed > 0 else 0,
+        "stats": memory_manager.stats(),
+    }
+
+
+def main():
+    """
+    Memutar ulang file trace dari command line dan mencetak hasilnya.
+
+    Gunakan --algorithm untuk memutar ulang trace yang sama dengan setiap
+    algoritma alokasi dan membandingkan throughput serta fragmentasinya.
+    Pemadatan otomatis yang terjadi saat perekaman sudah tercatat sebagai
+    record AUTO_COMPACT, sehingga --compaction-threshold hanya diperlukan
+    untuk mencoba pemadatan otomatis pada trace yang direkam tanpanya.
+    """
+    parser = argparse.ArgumentParser(description="Memory trace replay")
+    parser.add_argument("path")
+    parser.add_argument("--memory", type=int, default=1024)
+    parser.add_argument("--mode", default="Variable", choices=MODES)
+    parser.add_argument("--algorithm", choices=ALGORITHMS)
+    parser.add_argument("--compaction-threshold", type=int)
+    args = parser.parse_args()
+
+    memory_manager = MemoryManager(args.memory, use_timer=False)
+    memory_manager.set_allocation_mode(args.mode)
+    memory_manager.enable_compaction(args.compaction_threshold)
+    try:
+        result = replay_trace(args.path, memory_manager, args.algorithm)
+    except ValueError as error:
+        parser.error(str(error))
+    stats = result["stats"]
+
+    print(f"records        {result['records']}")
+    print(f"seconds        {result['seconds']:.3f}")
+    print(f"ops/sec        {result['ops_per_second']:.0f}")
+    print(
+        f"failure rate   {result['failure_rate']:.2f}% "
+        f"({result['failed']} of {result['allocations']})"
+    )
+    print(f"fragmentation  {stats['fragmentation']:.2f}%")
+    print(f"free blocks    {stats['free_blocks']}")
+    print(f"largest free   {stats['largest_free_block']} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+import bisect
+import itertools
+import math
+import random
+
+from process import Process
+
+
+class Uniform:
+    """
+    Distribusi seragam antara dua batas.
+
+    Attributes:
+        low (float): Batas bawah
+        high (float): Batas atas
+    """
+
+    def __init__(self, low, high):
+        """
+        Inisialisasi distribusi seragam.
+
+        Args:
+            low (float): Batas bawah
+            high (float): Batas atas
+        """
+        self.low = low
+        self.high = high
+
+    def sample(self, rng):
+        """
+        Mengambil satu nilai acak.
+
+        Args:
+            rng (random.Random): Sumber bilangan acak
+
+        Returns:
+            float: Nilai acak
+        """
+        return rng.uniform(self.low, self.high)
+
+
+class LogNormal:
+    """
+    Distribusi lognormal yang dibatasi dalam sebuah rentang.
+
+    Cocok untuk ukuran dan durasi proses yang sebagian besar kecil tetapi
+    sesekali sangat besar.
+
+    Attributes:
+        median (float): Median distribusi
+        sigma (float): Simpangan baku logaritma nilai
+        low (float): Batas bawah hasil
+        high (float): Batas atas hasil
+    """
+
+    def __init__(self, median, sigma, low=0, high=math.inf):
+        """
+        Inisialisasi distribusi lognormal.
+
+        Args:
+            median (float): Median distribusi
+            sigma (float): Simpangan baku logaritma nilai
+            low (float, optional): Batas bawah hasil. Defaults to 0.
+            high (float, optional): Batas atas hasil. Defaults to math.inf.
+        """
+        self.median = median
+        self.sigma = sigma
+        self.low = low
+        self.high = high
+
+    def sample(self, rng):
+        """
+        Mengambil satu nilai acak.
+
+        Args:
+            rng (random.Random): Sumber bilangan acak
+
+        Returns:
+            float: Nilai acak dalam rentang [low, high]
+        """
+        value = rng.lognormvariate(math.log(self.median), self.sigma)
+        return min(max(value, self.low), self.high)
+
+
+class Zipf:
+    """
+    Distribusi Zipf atas bilangan bulat low sampai high.
+
+    Nilai ke-k dari low memiliki peluang sebanding dengan 1 / k^exponent,
+    sehingga nilai kecil sangat sering muncul dan nilai besar jarang. Bobot
+    kumulatif dihitung sekali saat inisialisasi, lalu setiap sampel hanya
+    memerlukan pencarian biner.
+
+    Attributes:
+        exponent (float): Eksponen Zipf
+        low (int): Nilai terkecil
+        high (int): Nilai terbesar
+    """
+
+    def __init__(self, exponent, low, high):
+        """
+        Inisialisasi distribusi Zipf.
+
+        Args:
+            exponent (float): Eksponen Zipf, misalnya 1.2
+            low (int): Nilai terkecil
+            high (int): Nilai terbesar
+        """
+        self.exponent = exponent
+        self.low = low
+        self.high = high
+        self.cumulative_weights = list(
+            itertools.accumulate(
+                1 / rank**exponent for rank in range(1, high - low + 2)
+            )
+        )
+
+    def sample(self, rng):
+        """
+        Mengambil satu nilai acak.
+
+        Args:
+            rng (random.Random): Sumber bilangan acak
+
+        Returns:
+            int: Nilai acak dalam rentang [low, high]
+        """
+        target = rng.random() * self.cumulative_weights[-1]
+        return self.low + bisect.bisect_right(self.cumulative_weights, target)
+
+
+class Bimodal:
+    """
+    Campuran dua distribusi, misalnya banyak proses kecil dan sedikit proses
+    besar.
+
+    Attributes:
+        small: Distribusi mode pertama
+        large: Distribusi mode kedua
+        large_fraction (float): Peluang nilai diambil dari mode kedua
+    """
+
+    def __init__(self, small, large, large_fraction=0.1):
+        """
+        Inisialisasi distribusi bimodal.
+
+        Args:
+            small: Distribusi mode pertama
+            large: Distribusi mode kedua
+            large_fraction (float, optional): Peluang nilai diambil dari mode
+                                            kedua. Defaults to 0.1.
+        """
+        self.small = small
+        self.large = large
+        self.large_fraction = large_fraction
+
+    def sample(self, rng):
+        """
+        Mengambil satu nilai acak.
+
+        Args:
+            rng (random.Random): Sumber bilangan acak
+
+        Returns:
+            float: Nilai acak dari salah satu mode
+        """
+        if rng.random() < self.large_fraction:
+            return self.large.sample(rng)
+        return self.small.sample(rng)
+
+
+class PoissonArrivals:
+    """
+    Kedatangan Poisson dengan laju tetap.
+
+    Attributes:
+        rate (float): Rata-rata kedatangan per detik
+    """
+
+    def __init__(self, rate):
+        """
+        Inisialisasi kedatangan Poisson.
+
+        Args:
+            rate (float): Rata-rata kedatangan per detik
+        """
+        self.rate = rate
+
+    def times(self, rng):
+        """
+        Menghasilkan waktu kedatangan tanpa batas.
+
+        Args:
+            rng (random.Random): Sumber bilangan acak
+
+        Yields:
+            float: Waktu kedatangan berikutnya dalam detik
+        """
+        time = 0.0
+        while True:
+            time += rng.expovariate(self.rate)
+            yield time
+
+
+class BurstyArrivals:
+    """
+    Kedatangan bergelombang yang berganti antara masa tenang dan masa sibuk.
+
+    Dalam setiap masa, kedatangan mengikuti proses Poisson dengan laju masa
+    tersebut. Lama setiap masa berdistribusi eksponensial.
+
+    Attributes:
+        rate (float): Laju kedatangan per detik pada masa tenang
+        burst_rate (float): Laju kedatangan per detik pada masa sibuk
+        calm_duration (float): Rata-rata lama masa tenang dalam detik
+        burst_duration (float): Rata-rata lama masa sibuk dalam detik
+    """
+
+    def __init__(self, rate, burst_rate, calm_duration=60, burst_duration=5):
+        """
+        Inisialisasi kedatangan bergelombang.
+
+        Args:
+            rate (float): Laju kedatangan per detik pada masa tenang
+            burst_rate (float): Laju kedatangan per detik pada masa sibuk
+            calm_duration (float, optional): Rata-rata lama masa tenang dalam
+                                           detik. Defaults to 60.
+            burst_duration (float, optional): Rata-rata lama masa sibuk dalam
+                                            detik. Defaults to 5.
+        """
+        self.rate = rate
+        self.burst_rate = burst_rate
+        self.calm_duration = calm_duration
+        self.burst_duration = burst_duration
+
+    def times(self, rng):
+        """
+        Menghasilkan waktu kedatangan tanpa batas.
+
+        Args:
+            rng (random.Random): Sumber bilangan acak
+
+        Yields:
+            float: Waktu kedatangan berikutnya dalam detik
+        """
+        time = 0.0
+        bursting = False
+        phase_end = rng.expovariate(1 / self.calm_duration)
+        while True:
+            rate = self.burst_rate if bursting else self.rate
+            arrival = time + rng.expovariate(rate) if rate > 0 else math.inf
+            if arrival < phase_end:
+                time = arrival
+                yield time
+            else:
+                time = phase_end
+                bursting = not bursting
+                mean = self.burst_duration if bursting else self.calm_duration
+                phase_end = time + rng.expovariate(1 / mean)
+
+
+class DiurnalArrivals:
+    """
+    Kedatangan Poisson dengan laju yang naik turun mengikuti siklus harian.
+
+    Laju pada waktu t adalah rate * (1 + amplitude * sin(2 pi t / period)).
+    Waktu kedatangan dibangkitkan dengan metode thinning.
+
+    Attributes:
+        rate (float): Rata-rata kedatangan per detik sepanjang satu siklus
+        amplitude (float): Besar perubahan laju relatif terhadap rata-rata (0-1)
+        period (float): Panjang satu siklus dalam detik
+    """
+
+    def __init__(self, rate, amplitude=0.8, period=86400):
+        """
+        Inisialisasi kedatangan harian.
+
+        Args:
+            rate (float): Rata-rata kedatangan per detik
+            amplitude (float, optional): Besar perubahan laju relatif (0-1).
+                                       Defaults to 0.8.
+            period (float, optional): Panjang siklus dalam detik.
+                                    Defaults to 86400.
+        """
+        self.rate = rate
+        self.amplitude = amplitude
+        self.period = period
+
+    def times(self, rng):
+        """
+        Menghasilkan waktu kedatangan tanpa batas.
+
+        Args:
+            rng (random.Random): Sumber bilangan acak
+
+        Yields:
+            float: Waktu kedatangan berikutnya dalam detik
+        """
+        peak_rate = self.rate * (1 + self.amplitude)
+        angular = 2 * math.pi / self.period
+        time = 0.0
+        while True:
+            time += rng.expovariate(peak_rate)
+            rate = self.rate * (1 + self.amplitude * math.sin(angular * time))
+            if rng.random() * peak_rate < rate:
+                yield time
+
+
+def generate_workload(
+    arrivals,
+    sizes,
+    durations,
+    seed=0,
+    count=None,
+    until=None,
+    prefix="P",
+):
+    """
+    Menghasilkan aliran kedatangan proses sintetis secara malas.
+
+    Setiap kedatangan dibangkitkan hanya saat diminta, sehingga jutaan proses
+    dapat dialirkan ke Simulation.add_arrivals dengan memori tetap. Seed yang
+    sama selalu menghasilkan aliran yang sama.
+
+    Args:
+        arrivals: Pola kedatangan, misalnya PoissonArrivals, BurstyArrivals,
+                atau DiurnalArrivals
+        sizes: Distribusi ukuran proses dalam MB. Nilai dibulatkan dan minimal 1.
+        durations: Distribusi durasi proses dalam detik
+        seed (int, optional): Seed bilangan acak. Defaults to 0.
+        count (int, optional): Jumlah maksimum proses. Defaults to None (tanpa
+                             batas).
+        until (float, optional): Batas waktu kedatangan dalam detik.
+                               Defaults to None (tanpa batas).
+        prefix (str, optional): Awalan nama proses. Defaults to "P".
+
+    Yields:
+        tuple: Pasangan (waktu kedatangan, Process) terurut berdasarkan waktu
+    """
+    rng = random.Random(seed)
+    times = arrivals.times(rng)
+    if count is not None:
+        times = itertools.islice(times, count)
+
+    for index, time in enumerate(times):
+        if until is not None and time > until:
+            return
+        size = max(round(sizes.sample(rng)), 1)
+        duration = durations.sample(rng)
+        yield time, Process(f"{prefix}{index}", size, duration)